@@ -5,14 +5,67 @@ Allows importing all bank_account classes using:
 from bank_account import *
 """
 
+from bank_account.account_book import AccountBook
 from bank_account.bank_account import BankAccount
+from bank_account.bulk_transactions import apply_transactions
+from bank_account.charge_cache import cache_stats
 from bank_account.chequing_account import ChequingAccount
+from bank_account.concurrency import disable_thread_safety, enable_thread_safety
+from bank_account.dirty_tracking import ChangeTracker
+from bank_account.exposure_index import ExposureIndex
+from bank_account.fee_rules import FeeRule, FeeRuleSet, reload_rules
+from bank_account.interest import InterestAccrual, InterestPolicy
 from bank_account.investment_account import InvestmentAccount
+from bank_account.journal import TransactionJournal, recover_balances
+from bank_account.loader import iter_account_batches, iter_accounts
+from bank_account.metrics import disable_metrics, enable_metrics, metrics
+from bank_account.registry import AccountRegistry
 from bank_account.savings_account import SavingsAccount
+from bank_account.service_charges import ServiceChargeResult, post_service_charges
+from bank_account.simulation import Scenario, simulate
+from bank_account.snapshot import PortfolioSnapshot, write_snapshot
+from bank_account.sqlite_store import SqliteAccountStore
+from bank_account.statements import render_statements, write_statements
+from bank_account.transaction_service import TransactionService
+from bank_account.transfers import transfer, transfer_many
+from bank_account.waiver_scheduler import WaiverScheduler
 
 __all__ = [
+    "AccountBook",
+    "AccountRegistry",
     "BankAccount",
+    "ChangeTracker",
     "ChequingAccount",
+    "ExposureIndex",
+    "FeeRule",
+    "FeeRuleSet",
+    "InterestAccrual",
+    "InterestPolicy",
     "InvestmentAccount",
+    "PortfolioSnapshot",
     "SavingsAccount",
+    "Scenario",
+    "ServiceChargeResult",
+    "SqliteAccountStore",
+    "TransactionJournal",
+    "TransactionService",
+    "WaiverScheduler",
+    "apply_transactions",
+    "cache_stats",
+    "disable_metrics",
+    "disable_thread_safety",
+    "enable_metrics",
+    "enable_thread_safety",
+    "iter_account_batches",
+    "iter_accounts",
+    "metrics",
+    "post_service_charges",
+    "recover_balances",
+    "reload_rules",
+    "render_statements",
+    "simulate",
+    "transfer",
+    "transfer_many",
+    "write_snapshot",
+    "write_statements",
 ]
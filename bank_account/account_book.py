@@ -0,0 +1,365 @@
+"""
+account_book.py
+
+Defines the AccountBook class, a column-oriented container for large
+portfolios of bank accounts.
+
+Instead of one Python object per account, an AccountBook keeps every field
+in its own typed array so whole-portfolio operations (such as month-end
+service charges) run as a single pass over the columns rather than one
+polymorphic method call per account.
+"""
+
+from __future__ import annotations
+
+from array import array
+from datetime import date
+from typing import Iterable
+
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+
+# ---- Account type codes ----
+CHEQUING: int = 0
+SAVINGS: int = 1
+INVESTMENT: int = 2
+
+ACCOUNT_TYPE_NAMES: tuple[str, ...] = ("Chequing", "Savings", "Investment")
+
+_TYPE_CODES: dict[type, int] = {
+    ChequingAccount: CHEQUING,
+    SavingsAccount: SAVINGS,
+    InvestmentAccount: INVESTMENT,
+}
+
+
+def account_type_code(account: BankAccount) -> int:
+    """
+    Returns the AccountBook type code for an account.
+
+    Args:
+        account (BankAccount): The account to classify.
+
+    Returns:
+        int: CHEQUING, SAVINGS or INVESTMENT.
+
+    Raises:
+        TypeError: If the account is not one of the supported subclasses.
+    """
+    code = _TYPE_CODES.get(type(account))
+    if code is not None:
+        return code
+
+    for account_class, code in _TYPE_CODES.items():
+        if isinstance(account, account_class):
+            return code
+
+    raise TypeError(f"Unsupported account type: {type(account).__name__}.")
+
+
+def account_type_name(account: BankAccount) -> str:
+    """
+    Returns a display name for an account's type.
+
+    Supported subclasses use ACCOUNT_TYPE_NAMES; any other BankAccount
+    subclass falls back to its class name.
+
+    Args:
+        account (BankAccount): The account to classify.
+
+    Returns:
+        str: The account type name.
+    """
+    try:
+        return ACCOUNT_TYPE_NAMES[account_type_code(account)]
+    except TypeError:
+        return type(account).__name__
+
+
+def compute_service_charges(
+    account_types: Iterable[int],
+    balances: Iterable[float],
+    dates_created: Iterable[int],
+    overdraft_limits: Iterable[float],
+    overdraft_rates: Iterable[float],
+    minimum_balances: Iterable[float],
+    management_fees: Iterable[float],
+    ten_years_ago: date | None = None,
+) -> array:
+    """
+    Calculates service charges for parallel account columns in one pass.
+
+    The active fee rules apply (see fee_rules.set_rules()). With the
+    default rules, the formulas (and the order of the floating point
+    operations) are the same as ChequingAccount, SavingsAccount and
+    InvestmentAccount get_service_charges(), so the results match them bit
+    for bit.
+
+    Args:
+        account_types (Iterable[int]): Account type codes.
+        balances (Iterable[float]): Account balances.
+        dates_created (Iterable[int]): Creation dates as proleptic ordinals.
+        overdraft_limits (Iterable[float]): Chequing overdraft limits.
+        overdraft_rates (Iterable[float]): Chequing overdraft rates.
+        minimum_balances (Iterable[float]): Savings minimum balances.
+        management_fees (Iterable[float]): Investment management fees.
+        ten_years_ago (date | None): Waiver threshold for investment accounts.
+            Defaults to InvestmentAccount.TEN_YEARS_AGO.
+
+    Returns:
+        array: The service charges, as an array of doubles.
+    """
+    # Imported here because fee_rules builds on this module.
+    from bank_account.fee_rules import DEFAULT_RULES, active_rules
+
+    rules = active_rules()
+    if rules is not DEFAULT_RULES:
+        return rules.compute(
+            account_types,
+            balances,
+            dates_created,
+            overdraft_limits,
+            overdraft_rates,
+            minimum_balances,
+            management_fees,
+            ten_years_ago,
+        )
+
+    if ten_years_ago is None:
+        ten_years_ago = InvestmentAccount.TEN_YEARS_AGO
+    waiver_ordinal = ten_years_ago.toordinal()
+
+    chequing_base = ChequingAccount.BASE_SERVICE_CHARGE
+    savings_base = SavingsAccount.BASE_SERVICE_CHARGE
+    savings_premium = savings_base * SavingsAccount.SERVICE_CHARGE_PREMIUM
+    investment_base = InvestmentAccount.BASE_SERVICE_CHARGE
+
+    return array("d", [
+        (
+            (chequing_base if balance >= limit else chequing_base + (limit - balance) * rate)
+            if account_type == CHEQUING else
+            (savings_base if balance >= minimum else savings_premium)
+            if account_type == SAVINGS else
+            (investment_base if created <= waiver_ordinal else investment_base + fee)
+        )
+        for account_type, balance, created, limit, rate, minimum, fee in zip(
+            account_types,
+            balances,
+            dates_created,
+            overdraft_limits,
+            overdraft_rates,
+            minimum_balances,
+            management_fees,
+        )
+    ])
+
+
+class AccountBook:
+    """
+    Column-oriented storage for many bank accounts.
+
+    Fields that do not apply to an account type are stored as 0.0.
+
+    Attributes:
+        COLUMNS (tuple): Column names and their array type codes.
+        account_number (array): Account numbers.
+        client_number (array): Client numbers.
+        balance (array): Account balances.
+        date_created (array): Creation dates as proleptic ordinals.
+        account_type (array): Account type codes.
+        overdraft_limit (array): Chequing overdraft limits.
+        overdraft_rate (array): Chequing overdraft rates.
+        minimum_balance (array): Savings minimum balances.
+        management_fee (array): Investment management fees.
+    """
+
+    COLUMNS: tuple[tuple[str, str], ...] = (
+        ("account_number", "q"),
+        ("client_number", "q"),
+        ("balance", "d"),
+        ("date_created", "l"),
+        ("account_type", "b"),
+        ("overdraft_limit", "d"),
+        ("overdraft_rate", "d"),
+        ("minimum_balance", "d"),
+        ("management_fee", "d"),
+    )
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty AccountBook.
+        """
+        for name, typecode in self.COLUMNS:
+            setattr(self, name, array(typecode))
+
+    @classmethod
+    def from_accounts(cls, accounts: Iterable[BankAccount]) -> AccountBook:
+        """
+        Builds an AccountBook from account objects.
+
+        Args:
+            accounts (Iterable[BankAccount]): The accounts to copy.
+
+        Returns:
+            AccountBook: A book holding one row per account.
+        """
+        book = cls()
+        book.extend(accounts)
+        return book
+
+    def __len__(self) -> int:
+        """
+        Returns the number of accounts in the book.
+
+        Returns:
+            int: The number of rows.
+        """
+        return len(self.account_number)
+
+    # ---- Compact serialization ----
+    def to_buffers(self) -> dict[str, bytes]:
+        """
+        Returns every column as raw bytes.
+
+        The result is much cheaper to send to another process than the
+        equivalent account objects.
+
+        Returns:
+            dict[str, bytes]: Column bytes keyed by column name.
+        """
+        return {name: getattr(self, name).tobytes() for name, _ in self.COLUMNS}
+
+    @classmethod
+    def from_buffers(cls, buffers: dict[str, bytes]) -> AccountBook:
+        """
+        Rebuilds an AccountBook from to_buffers() output.
+
+        Args:
+            buffers (dict[str, bytes]): Column bytes keyed by column name.
+
+        Returns:
+            AccountBook: The rebuilt book.
+        """
+        book = cls()
+        for name, _ in cls.COLUMNS:
+            getattr(book, name).frombytes(buffers[name])
+        return book
+
+    def take(self, rows: Iterable[int]) -> AccountBook:
+        """
+        Returns a new book holding a subset of the rows.
+
+        A range with step 1 is copied as a column slice.
+
+        Args:
+            rows (Iterable[int]): Row indexes to copy, in order.
+
+        Returns:
+            AccountBook: The selected rows.
+        """
+        book = AccountBook()
+        if isinstance(rows, range) and rows.step == 1:
+            for name, _ in self.COLUMNS:
+                setattr(book, name, getattr(self, name)[rows.start:rows.stop])
+            return book
+
+        rows = list(rows)
+        for name, typecode in self.COLUMNS:
+            column = getattr(self, name)
+            setattr(book, name, array(typecode, [column[row] for row in rows]))
+        return book
+
+    # ---- Row insertion ----
+    def append(self, account: BankAccount) -> None:
+        """
+        Appends one account as a new row.
+
+        Args:
+            account (BankAccount): The account to copy.
+
+        Raises:
+            TypeError: If the account type is not supported.
+        """
+        code = account_type_code(account)
+
+        self.account_number.append(account.account_number)
+        self.client_number.append(account.client_number)
+        self.balance.append(account.balance)
+        self.date_created.append(account.date_created.toordinal())
+        self.account_type.append(code)
+
+        self.overdraft_limit.append(account.overdraft_limit if code == CHEQUING else 0.0)
+        self.overdraft_rate.append(account.overdraft_rate if code == CHEQUING else 0.0)
+        self.minimum_balance.append(account.minimum_balance if code == SAVINGS else 0.0)
+        self.management_fee.append(account.management_fee if code == INVESTMENT else 0.0)
+
+    def extend(self, accounts: Iterable[BankAccount]) -> None:
+        """
+        Appends many accounts as new rows.
+
+        Args:
+            accounts (Iterable[BankAccount]): The accounts to copy.
+        """
+        for account in accounts:
+            self.append(account)
+
+    # ---- Materialization ----
+    def to_accounts(self) -> list[BankAccount]:
+        """
+        Builds account objects for every row, in row order.
+
+        Uses the trusted from_columns() fast path, once per account type.
+
+        Returns:
+            list[BankAccount]: One account per row.
+        """
+        accounts: list[BankAccount] = [None] * len(self)  # type: ignore[list-item]
+        field_columns = {
+            CHEQUING: (self.overdraft_limit, self.overdraft_rate),
+            SAVINGS: (self.minimum_balance,),
+            INVESTMENT: (self.management_fee,),
+        }
+
+        for account_class, code in _TYPE_CODES.items():
+            rows = [row for row, account_type in enumerate(self.account_type) if account_type == code]
+            if not rows:
+                continue
+
+            built = account_class.from_columns(
+                [self.account_number[row] for row in rows],
+                [self.client_number[row] for row in rows],
+                [self.balance[row] for row in rows],
+                [date.fromordinal(self.date_created[row]) for row in rows],
+                *([column[row] for row in rows] for column in field_columns[code]),
+            )
+            for row, account in zip(rows, built):
+                accounts[row] = account
+
+        return accounts
+
+    # ---- Service charges ----
+    def get_service_charges(self, ten_years_ago: date | None = None) -> array:
+        """
+        Calculates the service charges of every account in the book.
+
+        Args:
+            ten_years_ago (date | None): Waiver threshold for investment
+                accounts. Defaults to InvestmentAccount.TEN_YEARS_AGO.
+
+        Uses the active fee rules (see fee_rules.set_rules()).
+
+        Returns:
+            array: One service charge per row, as an array of doubles.
+        """
+        return compute_service_charges(
+            self.account_type,
+            self.balance,
+            self.date_created,
+            self.overdraft_limit,
+            self.overdraft_rate,
+            self.minimum_balance,
+            self.management_fee,
+            ten_years_ago,
+        )
@@ -12,8 +12,18 @@ a protected date_created attribute used by subclasses.
 
 from __future__ import annotations
 
+import gc
 from abc import ABC, abstractmethod
 from datetime import date
+from typing import TYPE_CHECKING, Callable, ClassVar, Iterable, Sequence
+
+from bank_account.money import format_minor, to_minor, validate_minor_units
+
+if TYPE_CHECKING:
+    from bank_account.concurrency import LockStripes
+
+# Called as listener(account, operation, amount) after every balance change.
+BalanceListener = Callable[["BankAccount", str, float], None]
 
 
 class BankAccount(ABC):
@@ -24,12 +34,41 @@ class BankAccount(ABC):
         BASE_SERVICE_CHARGE (float): Flat base service charge ($0.50).
         _account_number (int): Unique identifier for the bank account.
         _client_number (int): Identifier for the account holder.
-        _balance (float): Current account balance.
+        _balance (float | int): Current account balance (in minor units when
+            fixed-point mode is on).
         _date_created (date): Date the account was created (protected).
+        _service_charge_cache (tuple | None): Last (key, charge) computed by
+            get_service_charges(), cleared when the balance changes.
+        MINOR_UNITS (int | None): Minor units per currency unit in fixed-point
+            mode, or None for floating point balances.
+        _balance_listeners (tuple): Callbacks notified of every balance change.
+        _lock_stripes (LockStripes | None): Per-account locks, when thread
+            safety is enabled (see bank_account.concurrency).
     """
 
     BASE_SERVICE_CHARGE: float = 0.50
 
+    # ---- Balance change operations (passed to balance listeners) ----
+    OP_DEPOSIT: ClassVar[str] = "deposit"
+    OP_WITHDRAW: ClassVar[str] = "withdraw"
+    OP_UPDATE: ClassVar[str] = "update"
+
+    MINOR_UNITS: ClassVar[int | None] = None
+
+    # Subclass-specific constructor fields, in order, for from_columns().
+    _RECORD_FIELDS: ClassVar[tuple[str, ...]] = ()
+
+    _balance_listeners: ClassVar[tuple[BalanceListener, ...]] = ()
+    _lock_stripes: ClassVar[LockStripes | None] = None
+
+    __slots__ = (
+        "_account_number",
+        "_client_number",
+        "_balance",
+        "_date_created",
+        "_service_charge_cache",
+    )
+
     def __init__(
         self,
         account_number: int,
@@ -63,10 +102,13 @@ class BankAccount(ABC):
             raise ValueError("Client number must be an integer.") from exc
 
         # ---- balance validation ----
+        minor_units = BankAccount.MINOR_UNITS
         try:
-            self._balance: float = float(balance)
-        except (TypeError, ValueError):
-            self._balance = 0.0
+            self._balance: float | int = float(balance)
+            if minor_units is not None:
+                self._balance = to_minor(self._balance, minor_units)
+        except (TypeError, ValueError, OverflowError):
+            self._balance = 0.0 if minor_units is None else 0
 
         # ---- date_created validation ----
         if isinstance(date_created, date):
@@ -74,6 +116,132 @@ class BankAccount(ABC):
         else:
             self._date_created = date.today()
 
+        self._service_charge_cache: tuple | None = None
+
+    # ---- Trusted bulk construction ----
+    @classmethod
+    def from_records(cls, records: Iterable[Sequence]) -> list[BankAccount]:
+        """
+        Builds many accounts of this type from pre-typed tuples.
+
+        Each record holds the constructor arguments in order, e.g.
+        (account_number, client_number, balance, date_created,
+        overdraft_limit, overdraft_rate) for a ChequingAccount.
+
+        Args:
+            records (Iterable[Sequence]): One tuple per account.
+
+        Returns:
+            list[BankAccount]: The accounts, in record order.
+
+        Raises:
+            ValueError: If a column does not hold values of the expected type.
+        """
+        records = list(records)
+        if not records:
+            return []
+        return cls.from_columns(*zip(*records))
+
+    @classmethod
+    def from_columns(
+        cls,
+        account_numbers: Sequence[int],
+        client_numbers: Sequence[int],
+        balances: Sequence[float],
+        dates_created: Sequence[date],
+        *field_columns: Sequence[float],
+    ) -> list[BankAccount]:
+        """
+        Builds many accounts of this type from parallel columns.
+
+        Validation runs once per column instead of once per field, and the
+        constructors' per-field try/except fallbacks are skipped, so the
+        data must already be valid. The accounts are otherwise identical
+        to ones built with the constructor.
+
+        Args:
+            account_numbers (Sequence[int]): Account numbers.
+            client_numbers (Sequence[int]): Client numbers.
+            balances (Sequence[float]): Opening balances.
+            dates_created (Sequence[date]): Creation dates.
+            *field_columns (Sequence[float]): The subclass-specific columns,
+                in constructor order.
+
+        Returns:
+            list[BankAccount]: The accounts, in row order.
+
+        Raises:
+            ValueError: If a column does not hold values of the expected type.
+            ValueError: If the columns differ in length or number.
+        """
+        if len(field_columns) != len(cls._RECORD_FIELDS):
+            raise ValueError(
+                f"{cls.__name__} expects {4 + len(cls._RECORD_FIELDS)} columns, "
+                f"got {4 + len(field_columns)}."
+            )
+
+        # ---- column validation ----
+        if not all(type(value) is int for value in account_numbers):
+            raise ValueError("Account number column must hold integers.")
+        if not all(type(value) is int for value in client_numbers):
+            raise ValueError("Client number column must hold integers.")
+        if not all(isinstance(value, date) for value in dates_created):
+            raise ValueError("Date created column must hold dates.")
+        try:
+            balances = list(map(float, balances))
+            field_columns = tuple(list(map(float, column)) for column in field_columns)
+        except (TypeError, ValueError) as exc:
+            raise ValueError("Balance and account field columns must be numeric.") from exc
+
+        count = len(account_numbers)
+        columns = (client_numbers, balances, dates_created, *field_columns)
+        if any(len(column) != count for column in columns):
+            raise ValueError("All columns must have the same length.")
+
+        minor_units = BankAccount.MINOR_UNITS
+        if minor_units is not None:
+            balances = [to_minor(balance, minor_units) for balance in balances]
+
+        # ---- construction ----
+        # The new objects cannot form reference cycles, so pause the cyclic
+        # garbage collector instead of letting it rescan them while allocating.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            accounts = []
+            append = accounts.append
+            new = cls.__new__
+            for account_number, client_number, balance, created in zip(
+                account_numbers, client_numbers, balances, dates_created
+            ):
+                account = new(cls)
+                account._account_number = account_number
+                account._client_number = client_number
+                account._balance = balance
+                account._date_created = created
+                account._service_charge_cache = None
+                append(account)
+
+            cls._set_record_fields(accounts, *field_columns)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        return accounts
+
+    @classmethod
+    def _set_record_fields(cls, accounts: list[BankAccount], *field_columns: Sequence[float]) -> None:
+        """
+        Assigns the subclass-specific fields during from_columns().
+
+        Subclasses with their own fields override this to set their private
+        attributes directly.
+
+        Args:
+            accounts (list[BankAccount]): The new accounts.
+            *field_columns (Sequence[float]): The validated field columns.
+        """
+
     # ---- Accessors (properties) ----
     @property
     def account_number(self) -> int:
@@ -103,7 +271,72 @@ class BankAccount(ABC):
         Returns:
             float: The account balance.
         """
-        return self._balance
+        minor_units = BankAccount.MINOR_UNITS
+        if minor_units is None:
+            return self._balance
+
+        return self._balance / minor_units
+
+    @property
+    def date_created(self) -> date:
+        """
+        Returns the date the account was created.
+
+        Returns:
+            date: The creation date.
+        """
+        return self._date_created
+
+    # ---- Money mode ----
+    @staticmethod
+    def use_fixed_point(minor_units: int = 100) -> None:
+        """
+        Stores balances as exact integer minor units (cents by default).
+
+        Select the mode before creating accounts; accounts created in one
+        mode must not be used after switching to the other.
+
+        Args:
+            minor_units (int): Minor units per currency unit (a power of ten).
+
+        Raises:
+            ValueError: If minor_units is not a positive power of ten.
+        """
+        BankAccount.MINOR_UNITS = validate_minor_units(minor_units)
+
+    @staticmethod
+    def use_floating_point() -> None:
+        """
+        Stores balances as floats (the default mode).
+        """
+        BankAccount.MINOR_UNITS = None
+
+    # ---- Balance listeners ----
+    @staticmethod
+    def add_balance_listener(listener: BalanceListener) -> None:
+        """
+        Registers a callback notified after every balance change.
+
+        The callback receives the account, the operation (OP_DEPOSIT,
+        OP_WITHDRAW or OP_UPDATE) and the signed amount applied.
+
+        Args:
+            listener (BalanceListener): The callback to register.
+        """
+        BankAccount._balance_listeners = BankAccount._balance_listeners + (listener,)
+
+    @staticmethod
+    def remove_balance_listener(listener: BalanceListener) -> None:
+        """
+        Unregisters a balance change callback.
+
+        Args:
+            listener (BalanceListener): The callback to remove.
+        """
+        BankAccount._balance_listeners = tuple(
+            registered for registered in BankAccount._balance_listeners
+            if registered != listener
+        )
 
     # ---- Balance update helper ----
     def update_balance(self, amount: float) -> None:
@@ -121,7 +354,35 @@ class BankAccount(ABC):
         except (TypeError, ValueError):
             return
 
-        self._balance += amount
+        self._change_balance(amount, self.OP_UPDATE)
+
+    def _change_balance(self, amount: float, operation: str) -> None:
+        """
+        Adds an already validated amount to the balance and notifies listeners.
+
+        Runs under the account's lock when thread safety is enabled.
+        Listeners always receive the amount in currency units.
+
+        Args:
+            amount (float): The signed amount to add.
+            operation (str): OP_DEPOSIT, OP_WITHDRAW or OP_UPDATE.
+        """
+        minor_units = BankAccount.MINOR_UNITS
+        stored = amount if minor_units is None else to_minor(amount, minor_units)
+
+        stripes = BankAccount._lock_stripes
+        if stripes is None:
+            self._balance += stored
+            self._service_charge_cache = None
+            for listener in BankAccount._balance_listeners:
+                listener(self, operation, amount)
+            return
+
+        with stripes.lock_for(self._account_number):
+            self._balance += stored
+            self._service_charge_cache = None
+            for listener in BankAccount._balance_listeners:
+                listener(self, operation, amount)
 
     # ---- Deposit ----
     def deposit(self, amount: float) -> None:
@@ -144,7 +405,7 @@ class BankAccount(ABC):
             formatted_amount = f"${amount:,.2f}"
             raise ValueError(f"Deposit amount: {formatted_amount} must be positive.")
 
-        self.update_balance(amount)
+        self._change_balance(amount, self.OP_DEPOSIT)
 
     # ---- Withdraw ----
     def withdraw(self, amount: float) -> None:
@@ -168,11 +429,32 @@ class BankAccount(ABC):
             formatted_amount = f"${amount:,.2f}"
             raise ValueError(f"Withdraw amount: {formatted_amount} must be positive.")
 
-        if amount > self._balance:
+        # The balance check and the update must be atomic under concurrency.
+        stripes = BankAccount._lock_stripes
+        if stripes is None:
+            self._withdraw_checked(amount)
+        else:
+            with stripes.lock_for(self._account_number):
+                self._withdraw_checked(amount)
+
+    def _withdraw_checked(self, amount: float) -> None:
+        """
+        Withdraws a validated positive amount if the balance covers it.
+
+        Args:
+            amount (float): The withdrawal amount.
+
+        Raises:
+            ValueError: If the amount exceeds the current balance.
+        """
+        minor_units = BankAccount.MINOR_UNITS
+        stored = amount if minor_units is None else to_minor(amount, minor_units)
+
+        if stored > self._balance:
             formatted_amount = f"${amount:,.2f}"
             raise ValueError(f"Withdraw amount: {formatted_amount} exceeds balance.")
 
-        self.update_balance(-amount)
+        self._change_balance(-amount, self.OP_WITHDRAW)
 
     def __str__(self) -> str:
         """
@@ -181,7 +463,24 @@ class BankAccount(ABC):
         Returns:
             str: Formatted account details.
         """
-        return f"Account Number: {self._account_number} Balance: ${self._balance:,.2f}"
+        minor_units = BankAccount.MINOR_UNITS
+        if minor_units is None:
+            return f"Account Number: {self._account_number} Balance: ${self._balance:,.2f}"
+
+        balance_str = format_minor(self._balance, minor_units)
+        return f"Account Number: {self._account_number} Balance: {balance_str}"
+
+    def _service_charge_key(self) -> object:
+        """
+        Returns the non-balance state a cached service charge depends on.
+
+        Subclasses whose charges depend on more than the balance extend
+        this key.
+
+        Returns:
+            object: The cache key.
+        """
+        return BankAccount.MINOR_UNITS
 
     @abstractmethod
     def get_service_charges(self) -> float:
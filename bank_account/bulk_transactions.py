@@ -0,0 +1,220 @@
+"""
+bulk_transactions.py
+
+Applies large feeds of deposits and withdrawals without exceptions.
+
+apply_transactions() takes parallel sequences (account index, amount and,
+optionally, operation code) and applies them in order with the same rules
+as BankAccount.deposit() and withdraw(). A rejected transaction is
+reported through an acceptance mask and a transaction_rules code instead
+of a ValueError with a formatted message.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Sequence
+
+from bank_account.account_book import AccountBook
+from bank_account.bank_account import BankAccount
+from bank_account.money import to_minor
+from bank_account.transaction_rules import (
+    ACCEPTED,
+    REJECT_EXCEEDS_BALANCE,
+    REJECT_NOT_NUMERIC,
+    REJECT_NOT_POSITIVE,
+)
+
+# ---- Operation codes (same values as the journal records) ----
+DEPOSIT: int = 1
+WITHDRAW: int = 2
+
+
+def apply_transactions(
+    target: AccountBook | Sequence[BankAccount],
+    indices: Sequence[int],
+    amounts: Sequence[float],
+    ops: Sequence[int] | None = None,
+) -> tuple[array, array]:
+    """
+    Applies deposits and withdrawals in order and reports each outcome.
+
+    Without ops, a positive amount is a deposit and a negative amount is a
+    withdrawal of its absolute value; a zero amount is rejected as not
+    positive. With ops, each amount is passed as-is to the DEPOSIT or
+    WITHDRAW operation, exactly like calling deposit() or withdraw().
+
+    For account objects, accepted transactions go through the normal
+    balance update, so balance listeners and per-account locks still
+    apply. For an AccountBook, the balance column is updated in place.
+
+    Args:
+        target (AccountBook | Sequence[BankAccount]): The accounts.
+        indices (Sequence[int]): Row (or list position) of each transaction.
+        amounts (Sequence[float]): Amount of each transaction.
+        ops (Sequence[int] | None): DEPOSIT or WITHDRAW per transaction.
+
+    Returns:
+        tuple[array, array]: The acceptance mask (1 accepted, 0 rejected)
+            and the transaction_rules code of each transaction.
+
+    Raises:
+        ValueError: If the sequences differ in length or an operation code
+            is unknown.
+        IndexError: If an index is out of range.
+    """
+    if len(indices) != len(amounts) or (ops is not None and len(ops) != len(amounts)):
+        raise ValueError("Transaction columns: indices, amounts and ops must have the same length.")
+
+    if ops is None:
+        ops, amounts = _split_signed(amounts)
+    else:
+        for op in set(ops):
+            if op not in (DEPOSIT, WITHDRAW):
+                raise ValueError(f"Operation code: {op} must be {DEPOSIT} (deposit) or {WITHDRAW} (withdraw).")
+
+    if isinstance(target, AccountBook):
+        codes = _apply_to_book(target.balance, indices, amounts, ops)
+    else:
+        codes = _apply_to_accounts(target, indices, amounts, ops)
+
+    return array("b", [code == ACCEPTED for code in codes]), codes
+
+
+def _split_signed(amounts: Sequence[float]) -> tuple[list[int], list]:
+    """
+    Derives the operation code and absolute amount of signed amounts.
+
+    A value that is not numeric is passed through unchanged (as a
+    deposit), so it is later rejected with REJECT_NOT_NUMERIC.
+
+    Args:
+        amounts (Sequence[float]): The signed amounts.
+
+    Returns:
+        tuple[list[int], list]: The operation codes and absolute amounts.
+    """
+    try:
+        return (
+            [DEPOSIT if amount > 0 else WITHDRAW for amount in amounts],
+            [amount if amount > 0 else -amount for amount in amounts],
+        )
+    except TypeError:
+        pass
+
+    ops: list[int] = []
+    magnitudes: list = []
+    for amount in amounts:
+        try:
+            amount = float(amount)
+        except (TypeError, ValueError):
+            ops.append(DEPOSIT)
+            magnitudes.append(amount)
+            continue
+        ops.append(DEPOSIT if amount > 0 else WITHDRAW)
+        magnitudes.append(amount if amount > 0 else -amount)
+    return ops, magnitudes
+
+
+def _apply_to_book(
+    balances: array,
+    indices: Sequence[int],
+    amounts: Sequence[float],
+    ops: Sequence[int],
+) -> array:
+    """
+    Applies transactions to a balance column.
+
+    Args:
+        balances (array): The book's balance column (updated in place).
+        indices (Sequence[int]): Row of each transaction.
+        amounts (Sequence[float]): Amount of each transaction.
+        ops (Sequence[int]): DEPOSIT or WITHDRAW per transaction.
+
+    Returns:
+        array: The result code of each transaction.
+    """
+    codes = array("b", bytes(len(amounts)))
+    for position, (row, amount, op) in enumerate(zip(indices, amounts, ops)):
+        try:
+            amount = float(amount)
+        except (TypeError, ValueError):
+            codes[position] = REJECT_NOT_NUMERIC
+            continue
+
+        if amount <= 0:
+            codes[position] = REJECT_NOT_POSITIVE
+        elif op == DEPOSIT:
+            balances[row] += amount
+        elif amount > balances[row]:
+            codes[position] = REJECT_EXCEEDS_BALANCE
+        else:
+            balances[row] -= amount
+    return codes
+
+
+def _apply_to_accounts(
+    accounts: Sequence[BankAccount],
+    indices: Sequence[int],
+    amounts: Sequence[float],
+    ops: Sequence[int],
+) -> array:
+    """
+    Applies transactions to account objects.
+
+    Args:
+        accounts (Sequence[BankAccount]): The accounts.
+        indices (Sequence[int]): List position of each transaction's account.
+        amounts (Sequence[float]): Amount of each transaction.
+        ops (Sequence[int]): DEPOSIT or WITHDRAW per transaction.
+
+    Returns:
+        array: The result code of each transaction.
+    """
+    minor_units = BankAccount.MINOR_UNITS
+    stripes = BankAccount._lock_stripes
+    op_deposit, op_withdraw = BankAccount.OP_DEPOSIT, BankAccount.OP_WITHDRAW
+
+    codes = array("b", bytes(len(amounts)))
+    for position, (index, amount, op) in enumerate(zip(indices, amounts, ops)):
+        account = accounts[index]
+        try:
+            amount = float(amount)
+        except (TypeError, ValueError):
+            codes[position] = REJECT_NOT_NUMERIC
+            continue
+
+        if amount <= 0:
+            codes[position] = REJECT_NOT_POSITIVE
+        elif op == DEPOSIT:
+            account._change_balance(amount, op_deposit)
+        elif stripes is None:
+            codes[position] = _withdraw(account, amount, minor_units, op_withdraw)
+        else:
+            # The balance check and the update must be atomic under concurrency.
+            with stripes.lock_for(account._account_number):
+                codes[position] = _withdraw(account, amount, minor_units, op_withdraw)
+    return codes
+
+
+def _withdraw(account: BankAccount, amount: float, minor_units: int | None, operation: str) -> int:
+    """
+    Withdraws a positive amount if the balance covers it.
+
+    Mirrors BankAccount._withdraw_checked(), returning a code instead of raising.
+
+    Args:
+        account (BankAccount): The account.
+        amount (float): The withdrawal amount.
+        minor_units (int | None): BankAccount.MINOR_UNITS.
+        operation (str): BankAccount.OP_WITHDRAW.
+
+    Returns:
+        int: ACCEPTED or REJECT_EXCEEDS_BALANCE.
+    """
+    stored = amount if minor_units is None else to_minor(amount, minor_units)
+    if stored > account._balance:
+        return REJECT_EXCEEDS_BALANCE
+
+    account._change_balance(-amount, operation)
+    return ACCEPTED
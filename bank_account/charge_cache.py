@@ -0,0 +1,102 @@
+"""
+charge_cache.py
+
+Per-account memoization of get_service_charges().
+
+Each account keeps its last computed service charge together with the key
+it was computed under. The cache is cleared whenever the balance changes,
+and the key also covers the balance, the money mode and, for investment
+accounts, the TEN_YEARS_AGO waiver threshold, so a rolled-over threshold
+is never served from a stale entry. With thread safety enabled the lookup,
+the calculation and the store run under the account's stripe lock, so a
+concurrent balance change cannot leave a stale charge in the cache. Hit
+and miss counters are kept process-wide.
+"""
+
+from __future__ import annotations
+
+from functools import wraps
+from typing import Callable, TypeVar
+
+AccountT = TypeVar("AccountT")
+
+
+class ServiceChargeCacheStats:
+    """
+    Process-wide hit and miss counters for the service charge cache.
+
+    Attributes:
+        hits (int): Calls answered from the cache.
+        misses (int): Calls that computed the charge.
+    """
+
+    __slots__ = ("hits", "misses")
+
+    def __init__(self) -> None:
+        """
+        Initializes both counters to zero.
+        """
+        self.hits = 0
+        self.misses = 0
+
+    def snapshot(self) -> dict[str, float]:
+        """
+        Returns the counters and the hit rate.
+
+        Returns:
+            dict[str, float]: hits, misses and hit_rate (0.0 when unused).
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def reset(self) -> None:
+        """
+        Sets both counters back to zero.
+        """
+        self.hits = 0
+        self.misses = 0
+
+
+cache_stats = ServiceChargeCacheStats()
+
+
+def cached_service_charge(method: Callable[[AccountT], float]) -> Callable[[AccountT], float]:
+    """
+    Decorates a get_service_charges() override with per-account caching.
+
+    The account must provide a _service_charge_cache slot, a
+    _service_charge_key() method and the _lock_stripes setting (all
+    defined on BankAccount).
+
+    Args:
+        method (Callable): The get_service_charges() implementation.
+
+    Returns:
+        Callable: The caching wrapper.
+    """
+
+    def lookup(self):
+        key = (self._balance, self._service_charge_key())
+        cached = self._service_charge_cache
+        if cached is not None and cached[0] == key:
+            cache_stats.hits += 1
+            return cached[1]
+
+        cache_stats.misses += 1
+        charge = method(self)
+        self._service_charge_cache = (key, charge)
+        return charge
+
+    @wraps(method)
+    def wrapper(self):
+        stripes = self._lock_stripes
+        if stripes is None:
+            return lookup(self)
+        with stripes.lock_for(self._account_number):
+            return lookup(self)
+
+    return wrapper
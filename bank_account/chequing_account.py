@@ -10,8 +10,11 @@ to implement Chequing-specific service charge calculations.
 from __future__ import annotations
 
 from datetime import date
+from typing import Sequence
 
 from bank_account.bank_account import BankAccount
+from bank_account.charge_cache import cached_service_charge
+from bank_account.money import from_minor, to_minor
 
 
 class ChequingAccount(BankAccount):
@@ -23,6 +26,9 @@ class ChequingAccount(BankAccount):
         __overdraft_rate (float): Rate used for overdraft fee calculation.
     """
 
+    __slots__ = ("__overdraft_limit", "__overdraft_rate")
+    _RECORD_FIELDS = ("overdraft_limit", "overdraft_rate")
+
     def __init__(
         self,
         account_number: int,
@@ -61,6 +67,46 @@ class ChequingAccount(BankAccount):
         except (TypeError, ValueError):
             self.__overdraft_rate = 0.05
 
+    @classmethod
+    def _set_record_fields(
+        cls,
+        accounts: list[BankAccount],
+        overdraft_limits: Sequence[float],
+        overdraft_rates: Sequence[float],
+    ) -> None:
+        """
+        Assigns the overdraft fields during from_columns().
+
+        Args:
+            accounts (list[BankAccount]): The new accounts.
+            overdraft_limits (Sequence[float]): Overdraft limits.
+            overdraft_rates (Sequence[float]): Overdraft rates.
+        """
+        for account, limit, rate in zip(accounts, overdraft_limits, overdraft_rates):
+            account.__overdraft_limit = limit
+            account.__overdraft_rate = rate
+
+    # ---- Accessors (properties) ----
+    @property
+    def overdraft_limit(self) -> float:
+        """
+        Returns the overdraft limit.
+
+        Returns:
+            float: The overdraft limit.
+        """
+        return self.__overdraft_limit
+
+    @property
+    def overdraft_rate(self) -> float:
+        """
+        Returns the overdraft rate.
+
+        Returns:
+            float: The overdraft rate.
+        """
+        return self.__overdraft_rate
+
     def __str__(self) -> str:
         """
         Returns a formatted string representation of the chequing account.
@@ -75,6 +121,7 @@ class ChequingAccount(BankAccount):
             f"Overdraft Limit: {limit_str} Overdraft Rate: {rate_str} Account Type: Chequing"
         )
 
+    @cached_service_charge
     def get_service_charges(self) -> float:
         """
         Calculates service charges for a ChequingAccount.
@@ -83,9 +130,20 @@ class ChequingAccount(BankAccount):
             If balance >= overdraft_limit -> BASE_SERVICE_CHARGE
             Else -> BASE_SERVICE_CHARGE + (overdraft_limit - balance) * overdraft_rate
 
+        In fixed-point mode the charge is computed in whole minor units.
+
         Returns:
             float: Calculated service charges.
         """
+        minor_units = self.MINOR_UNITS
+        if minor_units is not None:
+            base = to_minor(self.BASE_SERVICE_CHARGE, minor_units)
+            limit = to_minor(self.__overdraft_limit, minor_units)
+            if self._balance >= limit:
+                return from_minor(base, minor_units)
+            overdraft_fee = round((limit - self._balance) * self.__overdraft_rate)
+            return from_minor(base + overdraft_fee, minor_units)
+
         if self.balance >= self.__overdraft_limit:
             return self.BASE_SERVICE_CHARGE
 
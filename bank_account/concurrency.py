@@ -0,0 +1,133 @@
+"""
+concurrency.py
+
+Opt-in thread safety for balance changes.
+
+When enabled, deposit(), withdraw() and update_balance() run under a
+per-account lock taken from a fixed pool of striped locks. Accounts that
+hash to different stripes never contend, so throughput scales with the
+number of threads instead of serializing on one global lock.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from threading import RLock
+from typing import Iterator
+
+from bank_account.bank_account import BankAccount
+
+
+class LockStripes:
+    """
+    A fixed pool of reentrant locks shared by account number.
+
+    Attributes:
+        __locks (tuple[RLock, ...]): The lock stripes.
+    """
+
+    def __init__(self, stripes: int = 64) -> None:
+        """
+        Initializes the lock pool.
+
+        Args:
+            stripes (int): Number of locks in the pool.
+
+        Raises:
+            ValueError: If stripes is not positive.
+        """
+        if stripes <= 0:
+            raise ValueError(f"Lock stripes: {stripes} must be positive.")
+
+        self.__locks: tuple[RLock, ...] = tuple(RLock() for _ in range(stripes))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of lock stripes.
+
+        Returns:
+            int: The number of locks in the pool.
+        """
+        return len(self.__locks)
+
+    def index_for(self, account_number: int) -> int:
+        """
+        Returns the stripe index used by an account number.
+
+        Args:
+            account_number (int): The account number.
+
+        Returns:
+            int: The stripe index.
+        """
+        return hash(account_number) % len(self.__locks)
+
+    def lock_for(self, account_number: int) -> RLock:
+        """
+        Returns the lock guarding an account number.
+
+        Args:
+            account_number (int): The account number.
+
+        Returns:
+            RLock: The stripe's lock.
+        """
+        return self.__locks[hash(account_number) % len(self.__locks)]
+
+    @contextmanager
+    def locked(self, *accounts: BankAccount) -> Iterator[None]:
+        """
+        Holds the locks of several accounts at once.
+
+        Stripes are acquired in ascending index order, so two threads
+        locking the same accounts in any order cannot deadlock.
+
+        Args:
+            *accounts (BankAccount): The accounts to lock.
+
+        Yields:
+            None: While every lock is held.
+        """
+        indexes = sorted({self.index_for(account.account_number) for account in accounts})
+        acquired: list[RLock] = []
+        try:
+            for index in indexes:
+                lock = self.__locks[index]
+                lock.acquire()
+                acquired.append(lock)
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
+
+
+def enable_thread_safety(stripes: int = 64) -> LockStripes:
+    """
+    Makes deposit(), withdraw() and update_balance() atomic per account.
+
+    Args:
+        stripes (int): Number of locks shared by all accounts.
+
+    Returns:
+        LockStripes: The installed lock pool.
+    """
+    lock_stripes = LockStripes(stripes)
+    BankAccount._lock_stripes = lock_stripes
+    return lock_stripes
+
+
+def disable_thread_safety() -> None:
+    """
+    Restores the default lock-free balance changes.
+    """
+    BankAccount._lock_stripes = None
+
+
+def current_lock_stripes() -> LockStripes | None:
+    """
+    Returns the installed lock pool.
+
+    Returns:
+        LockStripes | None: The lock pool, or None when thread safety is off.
+    """
+    return BankAccount._lock_stripes
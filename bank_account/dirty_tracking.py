@@ -0,0 +1,237 @@
+"""
+dirty_tracking.py
+
+Defines the ChangeTracker class, which records which accounts changed
+since a named checkpoint.
+
+Every balance change made through deposit(), withdraw() or
+update_balance() stamps the account with a new generation number in an
+insertion-ordered dict, moving it to the end. Checkpoints are generation
+numbers, so changed_since() walks back from the newest entry and stops at
+the first one older than the checkpoint: the work done is proportional to
+the number of changed accounts, not to the size of the portfolio.
+
+Investment accounts whose management fee waiver starts are not changed
+through their balance; pass them to mark_changed(), or let tick_waivers()
+do it from a WaiverScheduler.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Iterable
+
+from bank_account.bank_account import BankAccount
+from bank_account.waiver_scheduler import WaiverScheduler
+
+
+class ChangeTracker:
+    """
+    Records changed accounts by generation, with named checkpoints.
+
+    The tracker listens for balance changes on every BankAccount, so call
+    close() (or use it as a context manager) once it is no longer needed.
+
+    Attributes:
+        __generation (int): Number of changes recorded so far.
+        __changes (OrderedDict[int, tuple[int, BankAccount]]): Last change
+            generation and account, keyed by account number, oldest first.
+        __checkpoints (dict[str, int]): Generation of each named checkpoint.
+        __lock (threading.RLock): Serializes recording and checkpoints, since
+            listeners run under the changed account's stripe lock only.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty tracker and starts recording balance changes.
+        """
+        self.__generation = 0
+        self.__changes: OrderedDict[int, tuple[int, BankAccount]] = OrderedDict()
+        self.__checkpoints: dict[str, int] = {}
+        self.__lock = threading.RLock()
+
+        BankAccount.add_balance_listener(self._on_balance_change)
+
+    def __enter__(self) -> ChangeTracker:
+        """
+        Returns the tracker for use in a with block.
+
+        Returns:
+            ChangeTracker: This tracker.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """
+        Stops recording balance changes at the end of a with block.
+
+        Args:
+            *exc_info (object): The exception details, if any.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops recording balance changes.
+        """
+        BankAccount.remove_balance_listener(self._on_balance_change)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of changed accounts kept for the checkpoints.
+
+        Returns:
+            int: The number of accounts.
+        """
+        return len(self.__changes)
+
+    @property
+    def generation(self) -> int:
+        """
+        Returns the current generation number.
+
+        Returns:
+            int: The number of changes recorded so far.
+        """
+        return self.__generation
+
+    # ---- Checkpoints ----
+    def checkpoint(self, name: str) -> int:
+        """
+        Creates or moves a named checkpoint to the current generation.
+
+        Changes older than every remaining checkpoint are discarded.
+
+        Args:
+            name (str): The checkpoint name (e.g. "month-end").
+
+        Returns:
+            int: The checkpoint's generation.
+        """
+        with self.__lock:
+            self.__checkpoints[name] = self.__generation
+            self._discard_old()
+            return self.__generation
+
+    def release(self, name: str) -> None:
+        """
+        Removes a named checkpoint.
+
+        Args:
+            name (str): The checkpoint name.
+
+        Raises:
+            KeyError: If the checkpoint does not exist.
+        """
+        with self.__lock:
+            del self.__checkpoints[name]
+            self._discard_old()
+
+    def changed_since(self, name: str) -> list[BankAccount]:
+        """
+        Returns the accounts changed since a checkpoint.
+
+        Args:
+            name (str): The checkpoint name.
+
+        Returns:
+            list[BankAccount]: The changed accounts, most recently changed first.
+
+        Raises:
+            KeyError: If the checkpoint does not exist.
+        """
+        with self.__lock:
+            since = self.__checkpoints[name]
+            changed = []
+            for generation, account in reversed(self.__changes.values()):
+                if generation <= since:
+                    break
+                changed.append(account)
+            return changed
+
+    def changed_count(self, name: str) -> int:
+        """
+        Returns the number of accounts changed since a checkpoint.
+
+        Args:
+            name (str): The checkpoint name.
+
+        Returns:
+            int: The number of changed accounts.
+
+        Raises:
+            KeyError: If the checkpoint does not exist.
+        """
+        return len(self.changed_since(name))
+
+    # ---- Recording ----
+    def mark_changed(self, accounts: Iterable[BankAccount]) -> None:
+        """
+        Records accounts as changed without a balance change.
+
+        Args:
+            accounts (Iterable[BankAccount]): The accounts (for example
+                those returned by WaiverScheduler.tick()).
+        """
+        for account in accounts:
+            self._record(account)
+
+    def tick_waivers(self, scheduler: WaiverScheduler, today: date | None = None) -> list[BankAccount]:
+        """
+        Advances a WaiverScheduler and records the accounts whose waiver started.
+
+        Args:
+            scheduler (WaiverScheduler): The scheduler.
+            today (date | None): The new date (defaults to today).
+
+        Returns:
+            list[BankAccount]: The accounts whose service charge changed.
+        """
+        flipped = scheduler.tick(today)
+        self.mark_changed(flipped)
+        return flipped
+
+    def _record(self, account: BankAccount) -> None:
+        """
+        Moves an account to the newest generation.
+
+        Nothing is kept while there is no checkpoint to report it to.
+
+        Args:
+            account (BankAccount): The changed account.
+        """
+        with self.__lock:
+            self.__generation += 1
+            if not self.__checkpoints:
+                return
+
+            number = account.account_number
+            self.__changes[number] = (self.__generation, account)
+            self.__changes.move_to_end(number)
+
+    def _discard_old(self) -> None:
+        """
+        Drops changes that no checkpoint can report any more (caller holds
+        the lock).
+        """
+        if not self.__checkpoints:
+            self.__changes.clear()
+            return
+
+        oldest = min(self.__checkpoints.values())
+        changes = self.__changes
+        while changes and next(iter(changes.values()))[0] <= oldest:
+            changes.popitem(last=False)
+
+    def _on_balance_change(self, account: BankAccount, operation: str, amount: float) -> None:
+        """
+        Balance listener that records the changed account.
+
+        Args:
+            account (BankAccount): The account whose balance changed.
+            operation (str): The balance operation.
+            amount (float): The signed amount applied.
+        """
+        self._record(account)
@@ -0,0 +1,348 @@
+"""
+exposure_index.py
+
+Defines the ExposureIndex class, which keeps chequing and savings
+accounts sorted by how far their balance is from the threshold that
+triggers an extra service charge.
+
+The margin of an account is balance - overdraft_limit for chequing
+accounts and balance - minimum_balance for savings accounts; a negative
+margin means the account pays more than the base charge. Each type keeps
+a sorted list of (margin, account number) keys, updated through the
+balance listener hook, so queries are binary searches over the sorted
+keys and a balance change only moves the account that changed.
+
+Moving a key is a binary search plus a list insert and delete, which
+shift the keys after it: O(n) element moves, but as one memmove each,
+far cheaper than re-sorting. projected_penalty() sums the accounts below
+the threshold on each call, so it costs O(k) for k such accounts.
+
+Listeners run under the changed account's stripe lock only, so the index
+guards its keys with a lock of its own.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left, insort
+from math import fsum, inf
+from typing import Iterable
+
+from bank_account.account_book import CHEQUING, SAVINGS, account_type_code
+from bank_account.bank_account import BankAccount
+from bank_account.savings_account import SavingsAccount
+
+INDEXED_TYPES: tuple[int, ...] = (CHEQUING, SAVINGS)
+
+
+def _threshold(account: BankAccount, account_type: int) -> float:
+    """
+    Returns the balance below which an account pays the extra charge.
+
+    Args:
+        account (BankAccount): A chequing or savings account.
+        account_type (int): CHEQUING or SAVINGS.
+
+    Returns:
+        float: The overdraft limit or the minimum balance.
+    """
+    if account_type == CHEQUING:
+        return account.overdraft_limit
+    return account.minimum_balance
+
+
+class ExposureIndex:
+    """
+    Sorted margin index over chequing and savings accounts.
+
+    The index listens for balance changes on every BankAccount, so call
+    close() (or use it as a context manager) once it is no longer needed.
+
+    Attributes:
+        __accounts (dict[int, BankAccount]): Indexed accounts by account number.
+        __types (dict[int, int]): Each indexed account's type code.
+        __keys (dict[int, tuple[float, int]]): Each account's current sort key.
+        __sorted (dict[int, list[tuple[float, int]]]): Sorted keys per type.
+        __lock (threading.RLock): Guards the keys against concurrent updates.
+    """
+
+    def __init__(self, accounts: Iterable[BankAccount] = ()) -> None:
+        """
+        Initializes an index and adds the chequing and savings accounts given.
+
+        Accounts of other types are ignored.
+
+        Args:
+            accounts (Iterable[BankAccount]): Accounts to index.
+
+        Raises:
+            ValueError: If two accounts share an account number.
+        """
+        self.__accounts: dict[int, BankAccount] = {}
+        self.__types: dict[int, int] = {}
+        self.__keys: dict[int, tuple[float, int]] = {}
+        self.__sorted: dict[int, list[tuple[float, int]]] = {code: [] for code in INDEXED_TYPES}
+        self.__lock = threading.RLock()
+
+        BankAccount.add_balance_listener(self._on_balance_change)
+
+        for account in accounts:
+            self.add(account)
+
+    def __enter__(self) -> ExposureIndex:
+        """
+        Returns the index for use in a with block.
+
+        Returns:
+            ExposureIndex: This index.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """
+        Stops tracking balance changes at the end of a with block.
+
+        Args:
+            *exc_info (object): The exception details, if any.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops tracking balance changes.
+        """
+        BankAccount.remove_balance_listener(self._on_balance_change)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of indexed accounts.
+
+        Returns:
+            int: The number of accounts.
+        """
+        return len(self.__accounts)
+
+    def __contains__(self, account_number: object) -> bool:
+        """
+        Returns whether an account number is indexed.
+
+        Args:
+            account_number (object): The account number.
+
+        Returns:
+            bool: True if the account is indexed.
+        """
+        return account_number in self.__accounts
+
+    # ---- Insert / remove ----
+    def add(self, account: BankAccount) -> bool:
+        """
+        Indexes an account if it is a chequing or savings account.
+
+        Args:
+            account (BankAccount): The account to add.
+
+        Returns:
+            bool: True if the account was indexed, False if its type is not.
+
+        Raises:
+            ValueError: If the account number is already indexed.
+        """
+        try:
+            account_type = account_type_code(account)
+        except TypeError:
+            return False
+        if account_type not in INDEXED_TYPES:
+            return False
+
+        account_number = account.account_number
+        with self.__lock:
+            if account_number in self.__accounts:
+                raise ValueError(f"Account number: {account_number} is already indexed.")
+
+            self.__accounts[account_number] = account
+            self.__types[account_number] = account_type
+            self._insert(account)
+        return True
+
+    def remove(self, account_number: int) -> BankAccount:
+        """
+        Removes an account from the index.
+
+        Args:
+            account_number (int): The account number to remove.
+
+        Returns:
+            BankAccount: The removed account.
+
+        Raises:
+            KeyError: If the account number is not indexed.
+        """
+        with self.__lock:
+            account = self.__accounts.pop(account_number)
+            self._delete(account_number)
+            del self.__types[account_number]
+        return account
+
+    # ---- Queries ----
+    def margin(self, account_number: int) -> float:
+        """
+        Returns an account's balance minus its threshold.
+
+        Args:
+            account_number (int): The account number.
+
+        Returns:
+            float: The margin (negative when below the threshold).
+
+        Raises:
+            KeyError: If the account number is not indexed.
+        """
+        return self.__keys[account_number][0]
+
+    def in_range(self, low: float, high: float, account_type: int = CHEQUING) -> list[BankAccount]:
+        """
+        Returns the accounts whose margin lies in [low, high).
+
+        Args:
+            low (float): Lowest margin included.
+            high (float): Margin upper bound (excluded).
+            account_type (int): CHEQUING or SAVINGS.
+
+        Returns:
+            list[BankAccount]: The accounts, lowest margin first.
+        """
+        keys = self._keys_for(account_type)
+        with self.__lock:
+            start = bisect_left(keys, (low, -inf))
+            stop = bisect_left(keys, (high, -inf))
+            return [self.__accounts[number] for _, number in keys[start:stop]]
+
+    def below_threshold(self, account_type: int = CHEQUING) -> list[BankAccount]:
+        """
+        Returns the accounts that pay more than the base charge.
+
+        These are chequing accounts below their overdraft limit, or savings
+        accounts below their minimum balance.
+
+        Args:
+            account_type (int): CHEQUING or SAVINGS.
+
+        Returns:
+            list[BankAccount]: The accounts, deepest first.
+        """
+        return self.in_range(-inf, 0.0, account_type)
+
+    def deepest(self, count: int, account_type: int = CHEQUING) -> list[BankAccount]:
+        """
+        Returns the accounts furthest below their threshold.
+
+        Args:
+            count (int): Maximum number of accounts.
+            account_type (int): CHEQUING or SAVINGS.
+
+        Returns:
+            list[BankAccount]: Up to count accounts below the threshold,
+                deepest first.
+        """
+        keys = self._keys_for(account_type)
+        with self.__lock:
+            stop = min(max(count, 0), bisect_left(keys, (0.0, -inf)))
+            return [self.__accounts[number] for _, number in keys[:stop]]
+
+    def projected_penalty(self, account_type: int = CHEQUING) -> float:
+        """
+        Returns the total charged above the base service charge.
+
+        For chequing accounts this is the sum of
+        (overdraft_limit - balance) * overdraft_rate; for savings accounts
+        it is the premium over the base charge of each account below its
+        minimum balance.
+
+        Args:
+            account_type (int): CHEQUING or SAVINGS.
+
+        Returns:
+            float: The projected penalty.
+        """
+        keys = self._keys_for(account_type)
+        with self.__lock:
+            below = keys[:bisect_left(keys, (0.0, -inf))]
+
+        if account_type == CHEQUING:
+            accounts = self.__accounts
+            return fsum(-margin * accounts[number].overdraft_rate for margin, number in below)
+
+        premium = SavingsAccount.BASE_SERVICE_CHARGE * (SavingsAccount.SERVICE_CHARGE_PREMIUM - 1.0)
+        return premium * len(below)
+
+    # ---- Maintenance ----
+    def refresh(self) -> None:
+        """
+        Rebuilds every key.
+
+        Balance changes are tracked automatically; call this after changes
+        that do not go through the balance (for example a restored snapshot).
+        """
+        with self.__lock:
+            self.__keys.clear()
+            for keys in self.__sorted.values():
+                keys.clear()
+            for account in self.__accounts.values():
+                self._insert(account)
+
+    def _keys_for(self, account_type: int) -> list[tuple[float, int]]:
+        """
+        Returns the sorted keys of one account type.
+
+        Args:
+            account_type (int): CHEQUING or SAVINGS.
+
+        Returns:
+            list[tuple[float, int]]: The sorted (margin, account number) keys.
+
+        Raises:
+            ValueError: If the account type is not indexed.
+        """
+        keys = self.__sorted.get(account_type)
+        if keys is None:
+            raise ValueError(f"Account type: {account_type} is not indexed.")
+        return keys
+
+    def _insert(self, account: BankAccount) -> None:
+        """
+        Adds an account's current key (caller holds the lock).
+
+        Args:
+            account (BankAccount): An indexed account.
+        """
+        account_number = account.account_number
+        account_type = self.__types[account_number]
+        key = (account.balance - _threshold(account, account_type), account_number)
+        self.__keys[account_number] = key
+        insort(self.__sorted[account_type], key)
+
+    def _delete(self, account_number: int) -> None:
+        """
+        Removes an account's key (caller holds the lock).
+
+        Args:
+            account_number (int): An indexed account number.
+        """
+        key = self.__keys.pop(account_number)
+        keys = self.__sorted[self.__types[account_number]]
+        del keys[bisect_left(keys, key)]
+
+    def _on_balance_change(self, account: BankAccount, operation: str, amount: float) -> None:
+        """
+        Balance listener that moves a changed account to its new position.
+
+        Args:
+            account (BankAccount): The account whose balance changed.
+            operation (str): The balance operation.
+            amount (float): The signed amount applied.
+        """
+        with self.__lock:
+            if self.__accounts.get(account.account_number) is account:
+                self._delete(account.account_number)
+                self._insert(account)
@@ -0,0 +1,450 @@
+"""
+fee_rules.py
+
+Declarative service charge rules.
+
+A FeeRuleSet maps each account type to one FeeRule. The rule kinds are:
+
+* "flat": base + fee;
+* "threshold": base, or base + (threshold - balance) * rate when the
+  balance is below the threshold (the chequing overdraft charge);
+* "multiplier": base, or base * multiplier when the balance is below the
+  threshold (the savings premium);
+* "age_waiver": base when the account is older than the waiver age,
+  otherwise base + fee (the investment management fee).
+
+Rule parameters are either numbers or the name of an account field
+(overdraft_limit, overdraft_rate, minimum_balance, management_fee), which
+are also the AccountBook column names. Each rule set is compiled once into
+evaluators for single accounts and for whole books. DEFAULT_RULES
+reproduces the get_service_charges() overrides bit for bit in
+floating-point mode, and set_rules()/reload_rules() swap the active rule
+set at run time.
+
+The active rules drive the column paths: compute_service_charges() (and
+through it AccountBook.get_service_charges(), simulate() and
+PortfolioSnapshot), post_service_charges() and the sharded run. The
+get_service_charges() overrides of single accounts keep the built-in
+rules.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from array import array
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from numbers import Real
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Iterable, Mapping
+
+from bank_account.account_book import ACCOUNT_TYPE_NAMES, AccountBook, account_type_code
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+
+RULE_KINDS: tuple[str, ...] = ("flat", "threshold", "multiplier", "age_waiver")
+
+FIELDS: tuple[str, ...] = ("overdraft_limit", "overdraft_rate", "minimum_balance", "management_fee")
+
+# A parameter is a constant or the name of one of FIELDS.
+Parameter = float | str
+
+
+@dataclass(frozen=True)
+class FeeRule:
+    """
+    The service charge rule of one account type.
+
+    Attributes:
+        kind (str): One of RULE_KINDS.
+        base (float): The base service charge.
+        threshold (Parameter | None): Balance below which the extra charge
+            applies ("threshold" and "multiplier").
+        rate (Parameter | None): Charge per dollar below the threshold ("threshold").
+        multiplier (float): Factor applied to base below the threshold ("multiplier").
+        fee (Parameter): Fee added to base ("flat" and "age_waiver").
+        waiver_age_days (float | None): Account age that waives the fee
+            ("age_waiver"). None uses InvestmentAccount.TEN_YEARS_AGO.
+    """
+
+    kind: str
+    base: float = BankAccount.BASE_SERVICE_CHARGE
+    threshold: Parameter | None = None
+    rate: Parameter | None = None
+    multiplier: float = 1.0
+    fee: Parameter = 0.0
+    waiver_age_days: float | None = None
+
+    def __post_init__(self) -> None:
+        """
+        Validates the rule.
+
+        Raises:
+            ValueError: If the kind is unknown, a required parameter is
+                missing, a parameter is not numeric, or a parameter names
+                an unknown field.
+        """
+        if self.kind not in RULE_KINDS:
+            raise ValueError(f"Fee rule kind: {self.kind} must be one of {', '.join(RULE_KINDS)}.")
+        if self.kind in ("threshold", "multiplier") and self.threshold is None:
+            raise ValueError(f"Fee rule kind: {self.kind} requires a threshold.")
+        if self.kind == "threshold" and self.rate is None:
+            raise ValueError("Fee rule kind: threshold requires a rate.")
+
+        for name in ("base", "multiplier"):
+            value = getattr(self, name)
+            if not isinstance(value, Real):
+                raise ValueError(f"Fee rule {name}: {value!r} must be numeric.")
+        if self.waiver_age_days is not None and not isinstance(self.waiver_age_days, Real):
+            raise ValueError(f"Fee rule waiver_age_days: {self.waiver_age_days!r} must be numeric.")
+
+        for name in ("threshold", "rate", "fee"):
+            value = getattr(self, name)
+            if isinstance(value, str):
+                if value not in FIELDS:
+                    raise ValueError(f"Fee rule field: {value} must be one of {', '.join(FIELDS)}.")
+            elif value is not None and not isinstance(value, Real):
+                raise ValueError(f"Fee rule {name}: {value!r} must be numeric or a field name.")
+
+
+DEFAULT_RULES_DATA: dict[str, dict[str, Any]] = {
+    "Chequing": {
+        "kind": "threshold",
+        "base": ChequingAccount.BASE_SERVICE_CHARGE,
+        "threshold": "overdraft_limit",
+        "rate": "overdraft_rate",
+    },
+    "Savings": {
+        "kind": "multiplier",
+        "base": SavingsAccount.BASE_SERVICE_CHARGE,
+        "threshold": "minimum_balance",
+        "multiplier": SavingsAccount.SERVICE_CHARGE_PREMIUM,
+    },
+    "Investment": {
+        "kind": "age_waiver",
+        "base": InvestmentAccount.BASE_SERVICE_CHARGE,
+        "fee": "management_fee",
+    },
+}
+
+
+# ---- Compilation ----
+# An evaluator takes (balance, date created, field source, waiver threshold)
+# and returns the charge. For single accounts the dates are date objects and
+# the field source is the account; for book rows the dates are proleptic
+# ordinals and the field source is a (limit, rate, minimum, fee) tuple.
+Evaluator = Callable[[float, Any, Any, Any], float]
+
+
+def _resolver(value: Parameter | None, for_rows: bool) -> Callable[[Any], float]:
+    """
+    Returns a function reading a rule parameter from a field source.
+
+    Args:
+        value (Parameter | None): A constant or a field name.
+        for_rows (bool): True for row tuples, False for account objects.
+
+    Returns:
+        Callable[[Any], float]: The reader.
+    """
+    if isinstance(value, str):
+        return itemgetter(FIELDS.index(value)) if for_rows else attrgetter(value)
+
+    constant = float(value or 0.0)
+    return lambda source: constant
+
+
+def _compile_rule(rule: FeeRule, for_rows: bool) -> Evaluator:
+    """
+    Compiles one rule into an evaluator.
+
+    Args:
+        rule (FeeRule): The rule.
+        for_rows (bool): True to read fields from row tuples, False from accounts.
+
+    Returns:
+        Evaluator: The compiled rule.
+    """
+    base = rule.base
+    threshold = _resolver(rule.threshold, for_rows)
+    rate = _resolver(rule.rate, for_rows)
+    fee = _resolver(rule.fee, for_rows)
+
+    if rule.kind == "threshold":
+        def evaluate(balance, created, source, waiver):
+            limit = threshold(source)
+            return base if balance >= limit else base + (limit - balance) * rate(source)
+    elif rule.kind == "multiplier":
+        premium = base * rule.multiplier
+
+        def evaluate(balance, created, source, waiver):
+            return base if balance >= threshold(source) else premium
+    elif rule.kind == "age_waiver":
+        def evaluate(balance, created, source, waiver):
+            return base if created <= waiver else base + fee(source)
+    else:
+        def evaluate(balance, created, source, waiver):
+            return base + fee(source)
+
+    return evaluate
+
+
+class FeeRuleSet:
+    """
+    Compiled service charge rules for every account type.
+
+    Attributes:
+        __rules (dict[int, FeeRule]): The rule of each account type code.
+        __account_evaluators (dict[int, Evaluator]): Compiled rules for accounts.
+        __row_evaluators (tuple[Evaluator, ...]): Compiled rules for
+            book rows, indexed by type code.
+    """
+
+    def __init__(self, rules: Mapping[int, FeeRule]) -> None:
+        """
+        Compiles a rule set.
+
+        Account types without a rule use their built-in rule from
+        DEFAULT_RULES_DATA, so every supported type can always be charged.
+
+        Args:
+            rules (Mapping[int, FeeRule]): The rule of each account type code.
+
+        Raises:
+            ValueError: If a type code is unknown.
+        """
+        for code in rules:
+            if code not in range(len(ACCOUNT_TYPE_NAMES)):
+                raise ValueError(f"Account type: {code} is not supported.")
+
+        self.__rules: dict[int, FeeRule] = {
+            code: rules[code] if code in rules else FeeRule(**DEFAULT_RULES_DATA[name])
+            for code, name in enumerate(ACCOUNT_TYPE_NAMES)
+        }
+        self.__account_evaluators: dict[int, Evaluator] = {
+            code: _compile_rule(rule, for_rows=False) for code, rule in self.__rules.items()
+        }
+        self.__row_evaluators: tuple[Evaluator, ...] = tuple(
+            _compile_rule(self.__rules[code], for_rows=True) for code in range(len(ACCOUNT_TYPE_NAMES))
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Mapping[str, Any]]) -> FeeRuleSet:
+        """
+        Builds a rule set from rule fields keyed by account type name.
+
+        Args:
+            data (Mapping[str, Mapping[str, Any]]): e.g. DEFAULT_RULES_DATA.
+
+        Returns:
+            FeeRuleSet: The compiled rule set.
+
+        Raises:
+            ValueError: If a type name or a rule is invalid.
+        """
+        rules: dict[int, FeeRule] = {}
+        for type_name, fields in data.items():
+            if type_name not in ACCOUNT_TYPE_NAMES:
+                raise ValueError(
+                    f"Account type: {type_name} must be one of {', '.join(ACCOUNT_TYPE_NAMES)}."
+                )
+            try:
+                rules[ACCOUNT_TYPE_NAMES.index(type_name)] = FeeRule(**fields)
+            except TypeError as exc:
+                raise ValueError(f"Fee rule for {type_name}: {exc}") from exc
+        return cls(rules)
+
+    @classmethod
+    def from_json(cls, path: str | os.PathLike) -> FeeRuleSet:
+        """
+        Loads a rule set from a JSON file in the from_dict() layout.
+
+        Args:
+            path (str | os.PathLike): The rules file.
+
+        Returns:
+            FeeRuleSet: The compiled rule set.
+        """
+        with open(path, encoding="utf-8") as stream:
+            return cls.from_dict(json.load(stream))
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """
+        Returns the rules keyed by account type name.
+
+        Returns:
+            dict[str, dict[str, Any]]: Data accepted by from_dict().
+        """
+        return {ACCOUNT_TYPE_NAMES[code]: asdict(rule) for code, rule in sorted(self.__rules.items())}
+
+    def rule_for(self, account_type: int) -> FeeRule:
+        """
+        Returns the rule of an account type.
+
+        Args:
+            account_type (int): CHEQUING, SAVINGS or INVESTMENT.
+
+        Returns:
+            FeeRule: The rule.
+
+        Raises:
+            KeyError: If the type code is unknown.
+        """
+        return self.__rules[account_type]
+
+    # ---- Evaluation ----
+    def charge(self, account: BankAccount, ten_years_ago: date | None = None) -> float:
+        """
+        Returns one account's service charge under these rules.
+
+        Args:
+            account (BankAccount): The account.
+            ten_years_ago (date | None): Waiver threshold for rules without
+                a waiver age. Defaults to InvestmentAccount.TEN_YEARS_AGO.
+
+        Returns:
+            float: The service charge.
+
+        Raises:
+            TypeError: If the account is not a chequing, savings or
+                investment account.
+        """
+        code = account_type_code(account)
+        waiver = self._waiver_date(code, ten_years_ago)
+        return self.__account_evaluators[code](account.balance, account.date_created, account, waiver)
+
+    def charges(self, book: AccountBook, ten_years_ago: date | None = None) -> array:
+        """
+        Returns the service charge of every row of a book under these rules.
+
+        Args:
+            book (AccountBook): The accounts.
+            ten_years_ago (date | None): Waiver threshold for rules without
+                a waiver age. Defaults to InvestmentAccount.TEN_YEARS_AGO.
+
+        Returns:
+            array: The service charges, as an array of doubles.
+        """
+        return self.compute(
+            book.account_type,
+            book.balance,
+            book.date_created,
+            book.overdraft_limit,
+            book.overdraft_rate,
+            book.minimum_balance,
+            book.management_fee,
+            ten_years_ago,
+        )
+
+    def compute(
+        self,
+        account_types: Iterable[int],
+        balances: Iterable[float],
+        dates_created: Iterable[int],
+        overdraft_limits: Iterable[float],
+        overdraft_rates: Iterable[float],
+        minimum_balances: Iterable[float],
+        management_fees: Iterable[float],
+        ten_years_ago: date | None = None,
+    ) -> array:
+        """
+        Returns the service charges of parallel account columns under these rules.
+
+        Takes the same columns as account_book.compute_service_charges().
+
+        Args:
+            account_types (Iterable[int]): Account type codes.
+            balances (Iterable[float]): Account balances.
+            dates_created (Iterable[int]): Creation dates as proleptic ordinals.
+            overdraft_limits (Iterable[float]): Chequing overdraft limits.
+            overdraft_rates (Iterable[float]): Chequing overdraft rates.
+            minimum_balances (Iterable[float]): Savings minimum balances.
+            management_fees (Iterable[float]): Investment management fees.
+            ten_years_ago (date | None): Waiver threshold for rules without
+                a waiver age. Defaults to InvestmentAccount.TEN_YEARS_AGO.
+
+        Returns:
+            array: The service charges, as an array of doubles.
+        """
+        evaluators = self.__row_evaluators
+        waivers = [self._waiver_date(code, ten_years_ago).toordinal() for code in range(len(evaluators))]
+
+        return array("d", [
+            evaluators[code](balance, created, (limit, rate, minimum, fee), waivers[code])
+            for code, balance, created, limit, rate, minimum, fee in zip(
+                account_types,
+                balances,
+                dates_created,
+                overdraft_limits,
+                overdraft_rates,
+                minimum_balances,
+                management_fees,
+            )
+        ])
+
+    def _waiver_date(self, account_type: int, ten_years_ago: date | None) -> date:
+        """
+        Returns the waiver threshold that applies to a type's rule.
+
+        Args:
+            account_type (int): The account type code.
+            ten_years_ago (date | None): Explicit threshold, if any.
+
+        Returns:
+            date: Accounts created on or before this date have their fee waived.
+        """
+        age = self.__rules[account_type].waiver_age_days
+        if age is not None:
+            return date.today() - timedelta(days=age)
+        if ten_years_ago is None:
+            return InvestmentAccount.TEN_YEARS_AGO
+        return ten_years_ago
+
+
+DEFAULT_RULES: FeeRuleSet = FeeRuleSet.from_dict(DEFAULT_RULES_DATA)
+
+_active_rules: FeeRuleSet = DEFAULT_RULES
+
+
+def active_rules() -> FeeRuleSet:
+    """
+    Returns the rule set currently in use.
+
+    Returns:
+        FeeRuleSet: The active rules (DEFAULT_RULES until replaced).
+    """
+    return _active_rules
+
+
+def set_rules(rules: FeeRuleSet) -> None:
+    """
+    Replaces the active rule set.
+
+    Evaluations already running finish with the rule set they started with.
+
+    Args:
+        rules (FeeRuleSet): The new rules.
+    """
+    global _active_rules
+    _active_rules = rules
+
+
+def reload_rules(path: str | os.PathLike) -> FeeRuleSet:
+    """
+    Loads, compiles and activates a rule set from a JSON file.
+
+    The active rules are only replaced once the new file has been
+    compiled successfully.
+
+    Args:
+        path (str | os.PathLike): The rules file.
+
+    Returns:
+        FeeRuleSet: The new active rules.
+    """
+    rules = FeeRuleSet.from_json(path)
+    set_rules(rules)
+    return rules
@@ -0,0 +1,412 @@
+"""
+interest.py
+
+Daily interest accrual with monthly compounding.
+
+An InterestPolicy holds annual rates per account type, either one flat
+rate or balance tiers (the highest tier whose minimum the balance reaches
+applies to the whole balance). An InterestAccrual follows an AccountBook
+or a list of accounts: each day a positive balance accrues
+balance * rate / day_count, and on the first of every month the interest
+accrued during the previous month is posted to the balance, so it earns
+interest from then on.
+
+advance() does not step day by day: the interest of a whole stretch of
+days with unchanged balances is one multiplication per account, done as
+one pass over the columns. Catching up after skipped days therefore costs
+one pass per month crossed (plus one per day with a balance change),
+however many days were skipped.
+
+Balance changes between advances are handled by the balance listener of
+an accrual over account objects: each change is recorded with the date it
+happened (from the accrual's clock), and advance() accrues the days
+before it on the previous balance. An AccountBook column has no listener,
+so callers must advance() to the day of a change before writing to the
+balance column.
+"""
+
+from __future__ import annotations
+
+import threading
+from array import array
+from bisect import bisect_right
+from datetime import date
+from math import fsum
+from numbers import Real
+from typing import Callable, Iterable, Mapping, Sequence
+
+from bank_account.account_book import AccountBook, account_type_code
+from bank_account.bank_account import BankAccount
+
+_NO_TYPE: int = -1
+
+
+def _next_month(day: date) -> date:
+    """
+    Returns the first day of the month after a date.
+
+    Args:
+        day (date): The date.
+
+    Returns:
+        date: The first of the following month.
+    """
+    if day.month == 12:
+        return date(day.year + 1, 1, 1)
+    return date(day.year, day.month + 1, 1)
+
+
+class InterestPolicy:
+    """
+    Annual interest rates per account type.
+
+    Example:
+        InterestPolicy({SAVINGS: 0.02, INVESTMENT: [(0.0, 0.01), (10_000.0, 0.03)]})
+
+    Attributes:
+        __tiers (dict[int, tuple[tuple[float, ...], tuple[float, ...]]]):
+            Tier minimums (ascending) and their rates, per type code.
+        __day_count (int): Days per year used for the daily rate.
+    """
+
+    def __init__(
+        self,
+        rates: Mapping[int, float | Iterable[tuple[float, float]]],
+        day_count: int = 365,
+    ) -> None:
+        """
+        Initializes a policy.
+
+        Args:
+            rates (Mapping[int, float | Iterable[tuple[float, float]]]): Per
+                account type code, a flat annual rate or (minimum balance,
+                annual rate) tiers. Types not listed earn no interest.
+            day_count (int): Days per year used for the daily rate.
+
+        Raises:
+            ValueError: If a rate is negative or not numeric, a tier minimum
+                repeats, or day_count is not positive.
+        """
+        if not isinstance(day_count, int) or day_count <= 0:
+            raise ValueError(f"Day count: {day_count} must be a positive integer.")
+
+        self.__day_count = day_count
+        self.__tiers: dict[int, tuple[tuple[float, ...], tuple[float, ...]]] = {}
+
+        for code, tiers in rates.items():
+            if isinstance(tiers, Real):
+                tiers = [(0.0, tiers)]
+            tiers = sorted((float(minimum), rate) for minimum, rate in tiers)
+
+            minimums = tuple(minimum for minimum, _ in tiers)
+            if len(set(minimums)) != len(minimums):
+                raise ValueError(f"Interest tiers: {list(minimums)} must not repeat a minimum balance.")
+            for _, rate in tiers:
+                if not isinstance(rate, Real) or rate < 0:
+                    raise ValueError(f"Interest rate: {rate} must be a non-negative number.")
+
+            self.__tiers[code] = (minimums, tuple(float(rate) for _, rate in tiers))
+
+    @property
+    def day_count(self) -> int:
+        """
+        Returns the days per year used for the daily rate.
+
+        Returns:
+            int: The day count.
+        """
+        return self.__day_count
+
+    def rate_for(self, account_type: int, balance: float) -> float:
+        """
+        Returns the annual rate for a balance.
+
+        Args:
+            account_type (int): The account type code.
+            balance (float): The balance.
+
+        Returns:
+            float: The rate of the highest tier the balance reaches, or 0.0.
+        """
+        tiers = self.__tiers.get(account_type)
+        if tiers is None:
+            return 0.0
+        position = bisect_right(tiers[0], balance)
+        return tiers[1][position - 1] if position else 0.0
+
+    def daily_interest(self, types: Sequence[int], balances: Sequence[float], days: int) -> array:
+        """
+        Returns the interest each balance accrues over a number of days.
+
+        Args:
+            types (Sequence[int]): Account type code of each row.
+            balances (Sequence[float]): Balance of each row.
+            days (int): Number of days.
+
+        Returns:
+            array: The accrued interest of each row (0.0 for balances
+                that are not positive).
+        """
+        rate_for = self.rate_for
+        factor = days / self.__day_count
+        return array("d", [
+            balance * rate_for(code, balance) * factor if balance > 0.0 else 0.0
+            for code, balance in zip(types, balances)
+        ])
+
+
+class InterestAccrual:
+    """
+    Accrues and posts interest for an AccountBook or a list of accounts.
+
+    For an AccountBook, interest is posted to the balance column in place
+    and rows appended to the book later start accruing on the next
+    advance(); advance() to the day of a balance change before writing it
+    to the column. For account objects, interest is posted with
+    update_balance(), so balance listeners and per-account locks apply,
+    and a balance listener records every other change with the clock's
+    date until close() is called.
+
+    Attributes:
+        __target (AccountBook | list[BankAccount]): The accounts.
+        __policy (InterestPolicy): The rates.
+        __clock (Callable[[], date]): Returns the date of a balance change.
+        __types (array): Account type code of each object (unused for a book).
+        __rows (dict[int, int]): Row of each object, by id() (empty for a book).
+        __accrued (array): Interest accrued but not yet posted, per row.
+        __as_of (date): The first day not yet accrued.
+        __changes (list[tuple[int, float, date]]): Balance changes (row,
+            amount, date) not yet accrued.
+        __changes_lock (threading.Lock): Guards the recorded changes.
+        __local (threading.local): Marks the thread posting interest.
+    """
+
+    def __init__(
+        self,
+        target: AccountBook | Sequence[BankAccount],
+        policy: InterestPolicy,
+        as_of: date | None = None,
+        clock: Callable[[], date] | None = None,
+    ) -> None:
+        """
+        Initializes an accrual with nothing accrued yet.
+
+        Args:
+            target (AccountBook | Sequence[BankAccount]): The accounts.
+            policy (InterestPolicy): The rates.
+            as_of (date | None): The first day to accrue. Defaults to today.
+            clock (Callable[[], date] | None): Returns the date of a balance
+                change to an account object. Defaults to date.today.
+        """
+        self.__policy = policy
+        self.__clock = date.today if clock is None else clock
+        self.__as_of = self.__clock() if as_of is None else as_of
+        self.__changes: list[tuple[int, float, date]] = []
+        self.__changes_lock = threading.Lock()
+        self.__local = threading.local()
+
+        if isinstance(target, AccountBook):
+            self.__target: AccountBook | list[BankAccount] = target
+            self.__types = array("b")
+            self.__rows: dict[int, int] = {}
+        else:
+            self.__target = list(target)
+            self.__types = array("b", [self._type_code(account) for account in self.__target])
+            self.__rows = {id(account): row for row, account in enumerate(self.__target)}
+            BankAccount.add_balance_listener(self._on_balance_change)
+        self.__accrued = array("d", [0.0]) * len(self.__target)
+
+    def __enter__(self) -> InterestAccrual:
+        """
+        Returns the accrual for use in a with block.
+
+        Returns:
+            InterestAccrual: This accrual.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """
+        Stops tracking balance changes at the end of a with block.
+
+        Args:
+            *exc_info (object): The exception details, if any.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops tracking balance changes.
+        """
+        BankAccount.remove_balance_listener(self._on_balance_change)
+
+    @property
+    def as_of(self) -> date:
+        """
+        Returns the first day not yet accrued.
+
+        Returns:
+            date: The accrual date.
+        """
+        return self.__as_of
+
+    @property
+    def accrued(self) -> array:
+        """
+        Returns the interest accrued but not yet posted.
+
+        Returns:
+            array: A copy of the per-row accrued interest.
+        """
+        return array("d", self.__accrued)
+
+    @property
+    def pending_total(self) -> float:
+        """
+        Returns the total interest accrued but not yet posted.
+
+        Returns:
+            float: The sum of the accrued interest.
+        """
+        return fsum(self.__accrued)
+
+    def advance(self, today: date | None = None) -> float:
+        """
+        Accrues interest up to a date, posting it on each first of the month.
+
+        Every day from as_of up to (but not including) today is accrued.
+        A recorded balance change accrues on the previous balance for the
+        days before its date.
+
+        Args:
+            today (date | None): The new date. Defaults to today.
+
+        Returns:
+            float: The total interest posted.
+
+        Raises:
+            ValueError: If today is before as_of.
+        """
+        if today is None:
+            today = date.today()
+        if today < self.__as_of:
+            raise ValueError(f"Accrual date: {today} must not be before {self.__as_of}.")
+
+        accrued = self.__accrued
+        missing = len(self.__target) - len(accrued)
+        if missing > 0:
+            accrued.extend(array("d", [0.0]) * missing)
+
+        with self.__changes_lock:
+            changes, self.__changes = self.__changes, []
+        changes = sorted((c for c in changes if c[2] > self.__as_of), key=lambda change: change[2])
+
+        posted = 0.0
+        day = self.__as_of
+        position = 0
+
+        while day < today:
+            while position < len(changes) and changes[position][2] <= day:
+                position += 1
+            month_end = _next_month(day)
+            stop = min(month_end, today)
+            if position < len(changes):
+                stop = min(stop, changes[position][2])
+
+            types, balances = self._columns(changes[position:])
+            interest = self.__policy.daily_interest(types, balances, (stop - day).days)
+            accrued = array("d", [total + amount for total, amount in zip(accrued, interest)])
+
+            if stop == month_end:
+                posted += self._post(accrued)
+                accrued = array("d", [0.0]) * len(accrued)
+            day = stop
+
+        later = [change for change in changes[position:] if change[2] > today]
+        if later:
+            with self.__changes_lock:
+                self.__changes[:0] = later
+
+        self.__accrued = accrued
+        self.__as_of = today
+        return posted
+
+    # ---- Columns and posting ----
+    def _columns(
+        self, later: Sequence[tuple[int, float, date]] = ()
+    ) -> tuple[Sequence[int], Sequence[float]]:
+        """
+        Returns the type codes and the balances before later changes.
+
+        Args:
+            later (Sequence[tuple[int, float, date]]): Recorded changes that
+                have not happened yet on the day being accrued.
+
+        Returns:
+            tuple[Sequence[int], Sequence[float]]: One entry per row.
+        """
+        target = self.__target
+        if isinstance(target, AccountBook):
+            return target.account_type, target.balance
+        balances = [account.balance for account in target]
+        for row, amount, _ in later:
+            balances[row] -= amount
+        return self.__types, balances
+
+    def _post(self, accrued: array) -> float:
+        """
+        Adds accrued interest to the balances.
+
+        Args:
+            accrued (array): The interest to post, per row.
+
+        Returns:
+            float: The total interest posted.
+        """
+        target = self.__target
+        if isinstance(target, AccountBook):
+            balances = target.balance
+            balances[:] = array("d", [balance + amount for balance, amount in zip(balances, accrued)])
+        else:
+            self.__local.posting = True
+            try:
+                for account, amount in zip(target, accrued):
+                    if amount:
+                        account.update_balance(amount)
+            finally:
+                self.__local.posting = False
+        return fsum(accrued)
+
+    def _on_balance_change(self, account: BankAccount, operation: str, amount: float) -> None:
+        """
+        Balance listener that records a change with the clock's date.
+
+        Interest posted by this accrual is not recorded.
+
+        Args:
+            account (BankAccount): The account whose balance changed.
+            operation (str): The balance operation.
+            amount (float): The signed amount applied.
+        """
+        row = self.__rows.get(id(account))
+        if row is None or getattr(self.__local, "posting", False):
+            return
+        change = (row, amount, self.__clock())
+        with self.__changes_lock:
+            self.__changes.append(change)
+
+    @staticmethod
+    def _type_code(account: BankAccount) -> int:
+        """
+        Returns an account's type code, or _NO_TYPE for other subclasses.
+
+        Args:
+            account (BankAccount): The account.
+
+        Returns:
+            int: The type code.
+        """
+        try:
+            return account_type_code(account)
+        except TypeError:
+            return _NO_TYPE
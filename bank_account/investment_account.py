@@ -10,8 +10,11 @@ to implement Investment-specific service charge calculations.
 from __future__ import annotations
 
 from datetime import date, timedelta
+from typing import Sequence
 
 from bank_account.bank_account import BankAccount
+from bank_account.charge_cache import cached_service_charge
+from bank_account.money import from_minor, to_minor
 
 
 class InvestmentAccount(BankAccount):
@@ -19,11 +22,17 @@ class InvestmentAccount(BankAccount):
     Represents an investment account.
 
     Attributes:
-        TEN_YEARS_AGO (date): Today's date minus ten years.
+        WAIVER_AGE (timedelta): Account age after which the fee is waived.
+        TEN_YEARS_AGO (date): Today's date minus WAIVER_AGE (set at import;
+            see waiver_scheduler.WaiverScheduler to keep it current).
         __management_fee (float): Flat management fee (may be waived after 10 years).
     """
 
-    TEN_YEARS_AGO: date = date.today() - timedelta(days=10 * 365.25)
+    WAIVER_AGE: timedelta = timedelta(days=10 * 365.25)
+    TEN_YEARS_AGO: date = date.today() - WAIVER_AGE
+
+    __slots__ = ("__management_fee",)
+    _RECORD_FIELDS = ("management_fee",)
 
     def __init__(
         self,
@@ -54,6 +63,46 @@ class InvestmentAccount(BankAccount):
         except (TypeError, ValueError):
             self.__management_fee = 2.55
 
+    @classmethod
+    def waiver_threshold(cls, today: date) -> date:
+        """
+        Returns the TEN_YEARS_AGO value that applies on a given day.
+
+        Args:
+            today (date): The current date.
+
+        Returns:
+            date: Accounts created on or before this date have the fee waived.
+        """
+        return today - cls.WAIVER_AGE
+
+    @classmethod
+    def _set_record_fields(
+        cls,
+        accounts: list[BankAccount],
+        management_fees: Sequence[float],
+    ) -> None:
+        """
+        Assigns the management fee field during from_columns().
+
+        Args:
+            accounts (list[BankAccount]): The new accounts.
+            management_fees (Sequence[float]): Management fees.
+        """
+        for account, fee in zip(accounts, management_fees):
+            account.__management_fee = fee
+
+    # ---- Accessors (properties) ----
+    @property
+    def management_fee(self) -> float:
+        """
+        Returns the management fee.
+
+        Returns:
+            float: The management fee.
+        """
+        return self.__management_fee
+
     def __str__(self) -> str:
         """
         Returns a formatted string representation of the investment account.
@@ -73,6 +122,18 @@ class InvestmentAccount(BankAccount):
             f"Date Created: {self._date_created} Management Fee: {fee_str} Account Type: Investment"
         )
 
+    def _service_charge_key(self) -> object:
+        """
+        Returns the state a cached service charge depends on.
+
+        Includes TEN_YEARS_AGO so a new waiver threshold invalidates the cache.
+
+        Returns:
+            object: The cache key.
+        """
+        return (self.MINOR_UNITS, self.TEN_YEARS_AGO)
+
+    @cached_service_charge
     def get_service_charges(self) -> float:
         """
         Calculates service charges for an InvestmentAccount.
@@ -81,10 +142,20 @@ class InvestmentAccount(BankAccount):
             If date_created is more than 10 years ago -> BASE_SERVICE_CHARGE
             Else -> BASE_SERVICE_CHARGE + management_fee
 
+        In fixed-point mode the charge is computed in whole minor units.
+
         Returns:
             float: Calculated service charges.
         """
         if self._date_created <= self.TEN_YEARS_AGO:
             return self.BASE_SERVICE_CHARGE
 
+        minor_units = self.MINOR_UNITS
+        if minor_units is not None:
+            return from_minor(
+                to_minor(self.BASE_SERVICE_CHARGE, minor_units)
+                + to_minor(self.__management_fee, minor_units),
+                minor_units,
+            )
+
         return self.BASE_SERVICE_CHARGE + self.__management_fee
@@ -0,0 +1,331 @@
+"""
+journal.py
+
+Append-only binary transaction journal for account balances.
+
+A TransactionJournal listens for every balance change made through
+deposit(), withdraw() or update_balance() and appends a fixed-width record
+(account number, operation, amount, timestamp) to a log file. Records are
+group committed: they are buffered and written with a single fsync once
+enough records are pending or a short interval has passed.
+
+After a crash, recover_balances() rebuilds balances from the last
+checkpoint plus the journal records written after it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import threading
+import time
+from typing import IO, Iterable, Iterator, NamedTuple
+
+from bank_account.bank_account import BankAccount
+from bank_account.money import to_minor
+
+JOURNAL_MAGIC: bytes = b"BAJRNL01"
+
+# account_number, operation code, signed amount, unix timestamp
+_RECORD = struct.Struct("<qBdd")
+
+_OPERATION_CODES: dict[str, int] = {
+    BankAccount.OP_DEPOSIT: 1,
+    BankAccount.OP_WITHDRAW: 2,
+    BankAccount.OP_UPDATE: 3,
+}
+_OPERATION_NAMES: dict[int, str] = {code: name for name, code in _OPERATION_CODES.items()}
+
+
+class JournalRecord(NamedTuple):
+    """
+    One balance change read back from a journal.
+
+    Attributes:
+        account_number (int): The account that changed.
+        operation (str): BankAccount.OP_DEPOSIT, OP_WITHDRAW or OP_UPDATE.
+        amount (float): The signed amount applied to the balance.
+        timestamp (float): When the change was recorded (seconds since epoch).
+    """
+
+    account_number: int
+    operation: str
+    amount: float
+    timestamp: float
+
+
+class TransactionJournal:
+    """
+    Records every balance change to an append-only file.
+
+    Attributes:
+        __path (str): Path of the journal file.
+        __flush_records (int): Pending records that trigger a commit.
+        __flush_interval (float): Maximum seconds a record stays buffered.
+        __buffer (bytearray): Encoded records not yet written.
+        __pending (int): Number of records in the buffer.
+        __offset (int): File offset of the last committed byte.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        flush_records: int = 1024,
+        flush_interval: float = 0.005,
+    ) -> None:
+        """
+        Opens (or creates) a journal and starts recording balance changes.
+
+        Args:
+            path (str | os.PathLike): Path of the journal file.
+            flush_records (int): Commit once this many records are pending.
+            flush_interval (float): Commit at least this often, in seconds.
+
+        Raises:
+            ValueError: If the file exists but is not a transaction journal.
+        """
+        self.__path = os.fspath(path)
+        self.__flush_records = max(1, int(flush_records))
+        self.__flush_interval = float(flush_interval)
+
+        self.__file: IO[bytes] = open(self.__path, "ab")
+        if self.__file.tell() == 0:
+            self.__file.write(JOURNAL_MAGIC)
+            self.__file.flush()
+            os.fsync(self.__file.fileno())
+        else:
+            with open(self.__path, "rb") as existing:
+                if existing.read(len(JOURNAL_MAGIC)) != JOURNAL_MAGIC:
+                    self.__file.close()
+                    raise ValueError(f"Journal: {self.__path} is not a transaction journal.")
+            self._truncate_torn_tail()
+
+        self.__offset = self.__file.tell()
+        self.__buffer = bytearray()
+        self.__pending = 0
+        self.__buffer_lock = threading.Lock()
+        self.__write_lock = threading.Lock()
+
+        self.__closed = threading.Event()
+        self.__flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        self.__flusher.start()
+
+        BankAccount.add_balance_listener(self.record)
+
+    def __enter__(self) -> TransactionJournal:
+        """
+        Returns the journal for use in a with block.
+
+        Returns:
+            TransactionJournal: This journal.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """
+        Commits pending records and closes the journal at the end of the block.
+
+        Args:
+            *exc_info (object): The exception details, if any.
+        """
+        self.close()
+
+    @property
+    def path(self) -> str:
+        """
+        Returns the journal file path.
+
+        Returns:
+            str: The path.
+        """
+        return self.__path
+
+    @property
+    def offset(self) -> int:
+        """
+        Returns the file offset up to which records are durable.
+
+        Returns:
+            int: The committed length of the journal, in bytes.
+        """
+        return self.__offset
+
+    def record(self, account: BankAccount, operation: str, amount: float) -> None:
+        """
+        Buffers one balance change (registered as a balance listener).
+
+        Args:
+            account (BankAccount): The account whose balance changed.
+            operation (str): The balance operation.
+            amount (float): The signed amount applied.
+        """
+        data = _RECORD.pack(account.account_number, _OPERATION_CODES[operation], amount, time.time())
+        with self.__buffer_lock:
+            self.__buffer += data
+            self.__pending += 1
+            full = self.__pending >= self.__flush_records
+
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes and fsyncs every buffered record (one group commit).
+        """
+        with self.__write_lock:
+            with self.__buffer_lock:
+                data, self.__buffer = self.__buffer, bytearray()
+                self.__pending = 0
+
+            if data and not self.__file.closed:
+                self.__file.write(data)
+                self.__file.flush()
+                os.fsync(self.__file.fileno())
+                self.__offset += len(data)
+
+    def close(self) -> None:
+        """
+        Stops recording, commits pending records and closes the file.
+        """
+        if self.__closed.is_set():
+            return
+
+        BankAccount.remove_balance_listener(self.record)
+        self.__closed.set()
+        self.__flusher.join()
+        self.flush()
+        self.__file.close()
+
+    def _truncate_torn_tail(self) -> None:
+        """
+        Drops a partially written record left at the end by a crash.
+
+        New records must start on a record boundary, or every record
+        appended after the torn one would be read back misaligned.
+        """
+        size = self.__file.seek(0, os.SEEK_END)
+        whole = len(JOURNAL_MAGIC) + (size - len(JOURNAL_MAGIC)) // _RECORD.size * _RECORD.size
+        if whole != size:
+            self.__file.truncate(whole)
+            self.__file.seek(0, os.SEEK_END)
+            os.fsync(self.__file.fileno())
+
+    def _flush_periodically(self) -> None:
+        """
+        Background loop that commits buffered records every flush_interval.
+        """
+        while not self.__closed.wait(self.__flush_interval):
+            if self.__pending:
+                self.flush()
+
+
+def read_journal(path: str | os.PathLike, offset: int = 0) -> Iterator[JournalRecord]:
+    """
+    Yields the records of a journal file.
+
+    A partially written record at the end of the file (from a crash during
+    a write) is ignored.
+
+    Args:
+        path (str | os.PathLike): Path of the journal file.
+        offset (int): File offset to start from (0 for the beginning).
+
+    Yields:
+        JournalRecord: The records, in the order they were written.
+
+    Raises:
+        ValueError: If the file is not a transaction journal.
+    """
+    with open(path, "rb") as stream:
+        if stream.read(len(JOURNAL_MAGIC)) != JOURNAL_MAGIC:
+            raise ValueError(f"Journal: {os.fspath(path)} is not a transaction journal.")
+
+        stream.seek(max(offset, len(JOURNAL_MAGIC)))
+        while True:
+            chunk = stream.read(_RECORD.size * 4096)
+            usable = len(chunk) - len(chunk) % _RECORD.size
+            for account_number, code, amount, timestamp in _RECORD.iter_unpack(chunk[:usable]):
+                yield JournalRecord(account_number, _OPERATION_NAMES[code], amount, timestamp)
+            if usable < len(chunk) or len(chunk) < _RECORD.size * 4096:
+                return
+
+
+def write_checkpoint(
+    path: str | os.PathLike,
+    accounts: Iterable[BankAccount],
+    journal: TransactionJournal,
+) -> None:
+    """
+    Saves every balance together with the journal position it reflects.
+
+    Take checkpoints while no balances are changing. The file is written
+    to a temporary name and then renamed, so a crash never leaves a
+    half-written checkpoint.
+
+    Args:
+        path (str | os.PathLike): Path of the checkpoint file.
+        accounts (Iterable[BankAccount]): The accounts to save.
+        journal (TransactionJournal): The journal recording these accounts.
+    """
+    journal.flush()
+    checkpoint = {
+        "journal_offset": journal.offset,
+        "balances": {str(account.account_number): account.balance for account in accounts},
+    }
+
+    temp_path = f"{os.fspath(path)}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as stream:
+        json.dump(checkpoint, stream)
+        stream.flush()
+        os.fsync(stream.fileno())
+    os.replace(temp_path, path)
+
+
+def recover_balances(
+    journal_path: str | os.PathLike,
+    checkpoint_path: str | os.PathLike | None = None,
+) -> dict[int, float]:
+    """
+    Rebuilds balances from a checkpoint plus the journal tail.
+
+    Args:
+        journal_path (str | os.PathLike): Path of the journal file.
+        checkpoint_path (str | os.PathLike | None): Path of the last
+            checkpoint. Without one, balances start at 0.0 and the whole
+            journal is replayed.
+
+    Returns:
+        dict[int, float]: Recovered balances keyed by account number.
+    """
+    balances: dict[int, float] = {}
+    offset = 0
+
+    if checkpoint_path is not None:
+        with open(checkpoint_path, encoding="utf-8") as stream:
+            checkpoint = json.load(stream)
+        offset = checkpoint["journal_offset"]
+        balances = {int(number): balance for number, balance in checkpoint["balances"].items()}
+
+    for record in read_journal(journal_path, offset):
+        balances[record.account_number] = balances.get(record.account_number, 0.0) + record.amount
+
+    return balances
+
+
+def restore_balances(accounts: Iterable[BankAccount], balances: dict[int, float]) -> None:
+    """
+    Sets account balances from recovered values without journaling them.
+
+    Accounts missing from balances are left unchanged.
+
+    Args:
+        accounts (Iterable[BankAccount]): The accounts to restore.
+        balances (dict[int, float]): Balances keyed by account number.
+    """
+    minor_units = BankAccount.MINOR_UNITS
+    for account in accounts:
+        balance = balances.get(account.account_number)
+        if balance is not None:
+            account._balance = balance if minor_units is None else to_minor(balance, minor_units)
+            account._service_charge_cache = None
@@ -0,0 +1,221 @@
+"""
+loader.py
+
+Streams bank accounts out of CSV or JSON Lines files.
+
+Rows are read one at a time and turned into ChequingAccount, SavingsAccount
+or InvestmentAccount objects based on their account_type column, so files
+of any size load in bounded memory and consumers can start work before the
+whole file has been read.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+from contextlib import contextmanager
+from datetime import date
+from itertools import islice
+from typing import IO, Any, Iterator, Mapping
+
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+
+ACCOUNT_TYPE_COLUMN: str = "account_type"
+
+_FORMATS_BY_SUFFIX: dict[str, str] = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+_ACCOUNT_TYPES: dict[str, type[BankAccount]] = {
+    "chequing": ChequingAccount,
+    "chequingaccount": ChequingAccount,
+    "savings": SavingsAccount,
+    "savingsaccount": SavingsAccount,
+    "investment": InvestmentAccount,
+    "investmentaccount": InvestmentAccount,
+}
+
+
+def _parse_date(value: Any) -> Any:
+    """
+    Converts an ISO date string to a date.
+
+    Values that are not valid ISO dates are returned unchanged so the
+    account constructor applies its own fallback (today's date).
+
+    Args:
+        value (Any): The raw date_created value.
+
+    Returns:
+        Any: A date, or the original value.
+    """
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value.strip())
+        except ValueError:
+            return value
+    return value
+
+
+def account_from_row(row: Mapping[str, Any]) -> BankAccount:
+    """
+    Builds an account from one row of field values.
+
+    Missing or invalid optional fields are passed through to the account
+    constructor, which applies its usual defaults (balance 0.0,
+    date_created today, overdraft_limit -100, overdraft_rate 0.05,
+    minimum_balance 50, management_fee 2.55).
+
+    Args:
+        row (Mapping[str, Any]): Field values keyed by column name.
+
+    Returns:
+        BankAccount: The constructed account.
+
+    Raises:
+        ValueError: If the account type is missing or unknown.
+        ValueError: If the account or client number is not numeric.
+    """
+    raw_type = row.get(ACCOUNT_TYPE_COLUMN)
+    account_class = _ACCOUNT_TYPES.get(str(raw_type).strip().lower())
+    if account_class is None:
+        raise ValueError(f"Account type: {raw_type} is not supported.")
+
+    common = (
+        row.get("account_number"),
+        row.get("client_number"),
+        row.get("balance"),
+        _parse_date(row.get("date_created")),
+    )
+
+    if account_class is ChequingAccount:
+        return ChequingAccount(*common, row.get("overdraft_limit"), row.get("overdraft_rate"))
+
+    if account_class is SavingsAccount:
+        return SavingsAccount(*common, row.get("minimum_balance"))
+
+    return InvestmentAccount(*common, row.get("management_fee"))
+
+
+def _detect_format(source: str | os.PathLike | IO[str], file_format: str | None) -> str:
+    """
+    Works out the file format from an explicit value or the file suffix.
+
+    Args:
+        source (str | os.PathLike | IO[str]): A path or an open text stream.
+        file_format (str | None): "csv", "jsonl" or None to detect.
+
+    Returns:
+        str: "csv" or "jsonl".
+
+    Raises:
+        ValueError: If the format is unknown or cannot be detected.
+    """
+    if file_format is None and isinstance(source, (str, os.PathLike)):
+        file_format = _FORMATS_BY_SUFFIX.get(os.path.splitext(os.fspath(source))[1].lower())
+
+    if file_format not in ("csv", "jsonl"):
+        raise ValueError(f"File format: {file_format} must be 'csv' or 'jsonl'.")
+
+    return file_format
+
+
+@contextmanager
+def _open_source(source: str | os.PathLike | IO[str]) -> Iterator[IO[str]]:
+    """
+    Opens a path for reading, or passes an open stream through untouched.
+
+    Args:
+        source (str | os.PathLike | IO[str]): A path or an open text stream.
+
+    Yields:
+        IO[str]: A readable text stream.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, newline="", encoding="utf-8") as stream:
+            yield stream
+    else:
+        yield source
+
+
+def _iter_rows(stream: IO[str], file_format: str) -> Iterator[Mapping[str, Any]]:
+    """
+    Yields the rows of a CSV or JSON Lines stream one at a time.
+
+    Args:
+        stream (IO[str]): The stream to read.
+        file_format (str): "csv" or "jsonl".
+
+    Yields:
+        Mapping[str, Any]: Field values keyed by column name.
+    """
+    if file_format == "csv":
+        yield from csv.DictReader(stream)
+        return
+
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+
+def iter_accounts(
+    source: str | os.PathLike | IO[str],
+    file_format: str | None = None,
+) -> Iterator[BankAccount]:
+    """
+    Lazily yields the accounts stored in a CSV or JSON Lines file.
+
+    Args:
+        source (str | os.PathLike | IO[str]): A path or an open text stream.
+        file_format (str | None): "csv" or "jsonl". Detected from the file
+            suffix when omitted; required for streams.
+
+    Yields:
+        BankAccount: One account per row.
+
+    Raises:
+        ValueError: If the format is unknown, or a row cannot be loaded
+            (the message includes the row number).
+    """
+    file_format = _detect_format(source, file_format)
+
+    with _open_source(source) as stream:
+        for row_number, row in enumerate(_iter_rows(stream, file_format), start=1):
+            try:
+                yield account_from_row(row)
+            except ValueError as exc:
+                raise ValueError(f"Row {row_number}: {exc}") from exc
+
+
+def iter_account_batches(
+    source: str | os.PathLike | IO[str],
+    batch_size: int = 10_000,
+    file_format: str | None = None,
+) -> Iterator[list[BankAccount]]:
+    """
+    Lazily yields the accounts of a CSV or JSON Lines file in batches.
+
+    Args:
+        source (str | os.PathLike | IO[str]): A path or an open text stream.
+        batch_size (int): Maximum number of accounts per batch.
+        file_format (str | None): "csv" or "jsonl". Detected from the file
+            suffix when omitted; required for streams.
+
+    Yields:
+        list[BankAccount]: Batches of at most batch_size accounts.
+
+    Raises:
+        ValueError: If batch_size is not positive.
+    """
+    if batch_size <= 0:
+        raise ValueError(f"Batch size: {batch_size} must be positive.")
+
+    accounts = iter_accounts(source, file_format)
+    while batch := list(islice(accounts, batch_size)):
+        yield batch
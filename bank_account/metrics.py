@@ -0,0 +1,307 @@
+"""
+metrics.py
+
+Optional instrumentation of account operations.
+
+enable_metrics() replaces BankAccount.deposit(), withdraw(),
+update_balance() and every get_service_charges() override with wrappers
+that count calls, time them into a latency histogram and record why
+rejected calls failed, broken down by account type. disable_metrics()
+puts the original methods back, so instrumentation costs nothing while
+it is off.
+
+Snapshots are available as a dict or in the Prometheus text format.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from functools import wraps
+from time import perf_counter
+from typing import Callable
+
+from bank_account.account_book import account_type_name
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.transaction_rules import REJECTION_REASONS
+
+# Upper bounds of the latency histogram buckets, in seconds.
+LATENCY_BUCKETS: tuple[float, ...] = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 1e-3, 1e-2,
+)
+
+# (class, method name) pairs that are instrumented.
+INSTRUMENTED_METHODS: tuple[tuple[type[BankAccount], str], ...] = (
+    (BankAccount, "deposit"),
+    (BankAccount, "withdraw"),
+    (BankAccount, "update_balance"),
+    (ChequingAccount, "get_service_charges"),
+    (SavingsAccount, "get_service_charges"),
+    (InvestmentAccount, "get_service_charges"),
+)
+
+_OTHER_REASON = "other"
+
+
+class OperationMetrics:
+    """
+    Counters and latency histograms for account operations.
+
+    Every series is keyed by (operation, account type name). Each thread
+    records into its own shard, so recording never waits on a lock; the
+    shards are merged when a snapshot is taken.
+
+    Attributes:
+        __local (threading.local): Holds the current thread's shard.
+        __shards (list[tuple[dict, dict]]): Every thread's (series,
+            rejections) shard. Series map to a list holding the call count,
+            the total seconds and the non-cumulative histogram counts (one
+            per bucket, then +Inf); rejections map (operation, account
+            type, reason) to a count.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes empty metrics.
+        """
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+        self.__shards: list[tuple[dict, dict]] = []
+
+    def _shard(self) -> tuple[dict, dict]:
+        """
+        Returns the calling thread's shard, creating it on first use.
+
+        Returns:
+            tuple[dict, dict]: The thread's series and rejections.
+        """
+        try:
+            return self.__local.shard
+        except AttributeError:
+            shard: tuple[dict, dict] = ({}, {})
+            with self.__lock:
+                self.__shards.append(shard)
+            self.__local.shard = shard
+            return shard
+
+    def observe(self, operation: str, account_type: str, seconds: float, reason: str | None = None) -> None:
+        """
+        Records one call.
+
+        Args:
+            operation (str): The method name.
+            account_type (str): The account type name.
+            seconds (float): How long the call took.
+            reason (str | None): Why the call was rejected, or None.
+        """
+        all_series, rejections = self._shard()
+        series = all_series.get((operation, account_type))
+        if series is None:
+            series = all_series[operation, account_type] = [0, 0.0] + [0] * (len(LATENCY_BUCKETS) + 1)
+        series[0] += 1
+        series[1] += seconds
+        series[bisect_left(LATENCY_BUCKETS, seconds) + 2] += 1
+        if reason is not None:
+            key = (operation, account_type, reason)
+            rejections[key] = rejections.get(key, 0) + 1
+
+    def reset(self) -> None:
+        """
+        Clears every series.
+        """
+        with self.__lock:
+            for all_series, rejections in self.__shards:
+                all_series.clear()
+                rejections.clear()
+
+    def snapshot(self) -> dict[str, dict[str, dict]]:
+        """
+        Returns the metrics as nested dicts.
+
+        Returns:
+            dict: {operation: {account type: {"count", "rejected", "seconds",
+                "buckets"}}}, where "rejected" maps reasons to counts and
+                "buckets" maps each upper bound (and "+Inf") to the
+                cumulative number of calls.
+        """
+        all_series: dict[tuple[str, str], list] = {}
+        rejections: dict[tuple[str, str, str], int] = {}
+        with self.__lock:
+            shards = list(self.__shards)
+        for shard_series, shard_rejections in shards:
+            for key, series in list(shard_series.items()):
+                merged = all_series.get(key)
+                if merged is None:
+                    all_series[key] = list(series)
+                else:
+                    all_series[key] = [total + value for total, value in zip(merged, series)]
+            for key, count in list(shard_rejections.items()):
+                rejections[key] = rejections.get(key, 0) + count
+
+        bounds = (*map(repr, LATENCY_BUCKETS), "+Inf")
+        result: dict[str, dict[str, dict]] = {}
+        for (operation, account_type), (count, seconds, *buckets) in sorted(all_series.items()):
+            cumulative = 0
+            histogram: dict[str, int] = {}
+            for bound, bucket_count in zip(bounds, buckets):
+                cumulative += bucket_count
+                histogram[bound] = cumulative
+
+            result.setdefault(operation, {})[account_type] = {
+                "count": count,
+                "rejected": {
+                    reason: rejected
+                    for (op, kind, reason), rejected in sorted(rejections.items())
+                    if op == operation and kind == account_type
+                },
+                "seconds": seconds,
+                "buckets": histogram,
+            }
+        return result
+
+    def to_prometheus(self, prefix: str = "bank_account") -> str:
+        """
+        Returns the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): Metric name prefix.
+
+        Returns:
+            str: The exposition text.
+        """
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_operations_total Account operations by outcome.",
+            f"# TYPE {prefix}_operations_total counter",
+        ]
+        for operation, by_type in snapshot.items():
+            for account_type, series in by_type.items():
+                labels = f'operation="{operation}",account_type="{account_type}"'
+                rejected = sum(series["rejected"].values())
+                lines.append(f'{prefix}_operations_total{{{labels},outcome="accepted"}} {series["count"] - rejected}')
+                for reason, count in series["rejected"].items():
+                    lines.append(
+                        f'{prefix}_operations_total{{{labels},outcome="rejected",reason="{reason}"}} {count}'
+                    )
+
+        lines += [
+            f"# HELP {prefix}_operation_seconds Account operation latency.",
+            f"# TYPE {prefix}_operation_seconds histogram",
+        ]
+        for operation, by_type in snapshot.items():
+            for account_type, series in by_type.items():
+                labels = f'operation="{operation}",account_type="{account_type}"'
+                for bound, count in series["buckets"].items():
+                    lines.append(f'{prefix}_operation_seconds_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f"{prefix}_operation_seconds_sum{{{labels}}} {series['seconds']!r}")
+                lines.append(f"{prefix}_operation_seconds_count{{{labels}}} {series['count']}")
+
+        return "\n".join(lines) + "\n"
+
+
+metrics = OperationMetrics()
+
+_originals: dict[tuple[type[BankAccount], str], Callable] = {}
+_type_names: dict[type, str] = {}
+
+
+def _rejection_reason(error: ValueError) -> str:
+    """
+    Maps a ValueError raised by an account operation to a rejection reason.
+
+    Args:
+        error (ValueError): The error.
+
+    Returns:
+        str: A transaction_rules reason, or "other".
+    """
+    message = str(error)
+    for reason in REJECTION_REASONS.values():
+        if message.endswith(f"{reason}."):
+            return reason
+    return _OTHER_REASON
+
+
+def _type_name(account: BankAccount) -> str:
+    """
+    Returns an account's type name, cached per class.
+
+    Args:
+        account (BankAccount): The account.
+
+    Returns:
+        str: The account type name.
+    """
+    name = _type_names.get(type(account))
+    if name is None:
+        name = _type_names[type(account)] = account_type_name(account)
+    return name
+
+
+def _instrument(method: Callable, operation: str) -> Callable:
+    """
+    Wraps an account method with timing and counting.
+
+    Args:
+        method (Callable): The original method.
+        operation (str): The operation name used in the metrics.
+
+    Returns:
+        Callable: The instrumented method.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        start = perf_counter()
+        try:
+            result = method(self, *args, **kwargs)
+        except ValueError as error:
+            elapsed = perf_counter() - start
+            metrics.observe(operation, _type_name(self), elapsed, _rejection_reason(error))
+            raise
+        elapsed = perf_counter() - start
+        metrics.observe(operation, _type_name(self), elapsed)
+        return result
+
+    return wrapper
+
+
+def enable_metrics() -> OperationMetrics:
+    """
+    Starts instrumenting account operations.
+
+    Calling it again while enabled has no effect.
+
+    Returns:
+        OperationMetrics: The process-wide metrics.
+    """
+    if not _originals:
+        for owner, name in INSTRUMENTED_METHODS:
+            method = owner.__dict__[name]
+            _originals[owner, name] = method
+            setattr(owner, name, _instrument(method, name))
+    return metrics
+
+
+def disable_metrics() -> None:
+    """
+    Restores the original, uninstrumented methods.
+
+    Collected metrics are kept until metrics.reset() is called.
+    """
+    for (owner, name), method in _originals.items():
+        setattr(owner, name, method)
+    _originals.clear()
+
+
+def metrics_enabled() -> bool:
+    """
+    Returns whether account operations are instrumented.
+
+    Returns:
+        bool: True between enable_metrics() and disable_metrics().
+    """
+    return bool(_originals)
@@ -0,0 +1,85 @@
+"""
+money.py
+
+Helpers for the fixed-point money mode.
+
+In fixed-point mode balances are stored as integer minor units (cents by
+default) so repeated deposits, withdrawals and charges never accumulate
+floating point drift. Select the mode with BankAccount.use_fixed_point()
+before creating accounts.
+"""
+
+from __future__ import annotations
+
+
+def validate_minor_units(minor_units: int) -> int:
+    """
+    Checks that a minor unit count is a positive power of ten.
+
+    Args:
+        minor_units (int): Minor units per currency unit (e.g. 100 for cents).
+
+    Returns:
+        int: The validated minor unit count.
+
+    Raises:
+        ValueError: If minor_units is not 1, 10, 100, 1000, ...
+    """
+    try:
+        minor_units = int(minor_units)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Minor units: {minor_units} must be an integer.") from exc
+
+    if minor_units <= 0 or str(minor_units).rstrip("0") != "1":
+        raise ValueError(f"Minor units: {minor_units} must be a positive power of ten.")
+
+    return minor_units
+
+
+def to_minor(amount: float, minor_units: int) -> int:
+    """
+    Converts a currency amount to whole minor units.
+
+    Args:
+        amount (float): The amount in currency units.
+        minor_units (int): Minor units per currency unit.
+
+    Returns:
+        int: The amount in minor units, rounded half to even.
+    """
+    return round(amount * minor_units)
+
+
+def from_minor(units: int, minor_units: int) -> float:
+    """
+    Converts whole minor units to a currency amount.
+
+    Args:
+        units (int): The amount in minor units.
+        minor_units (int): Minor units per currency unit.
+
+    Returns:
+        float: The amount in currency units.
+    """
+    return units / minor_units
+
+
+def format_minor(units: int, minor_units: int) -> str:
+    """
+    Formats minor units like f"${amount:,.2f}" using exact integer math.
+
+    Args:
+        units (int): The amount in minor units.
+        minor_units (int): Minor units per currency unit (a power of ten).
+
+    Returns:
+        str: The formatted amount, e.g. "$1,234.56" or "$-200.00".
+    """
+    sign = "-" if units < 0 else ""
+    whole, fraction = divmod(abs(units), minor_units)
+    digits = len(str(minor_units)) - 1
+
+    if digits == 0:
+        return f"${sign}{whole:,}"
+
+    return f"${sign}{whole:,}.{fraction:0{digits}d}"
@@ -0,0 +1,249 @@
+"""
+registry.py
+
+Defines the AccountRegistry class, which indexes accounts by account
+number and by client number.
+
+Lookups are dictionary based instead of list scans, and per-client totals
+(balance and service charges) are kept current as balances change through
+deposit(), withdraw() or update_balance().
+"""
+
+from __future__ import annotations
+
+import threading
+from math import fsum
+from typing import Iterable, Iterator
+
+from bank_account.bank_account import BankAccount
+
+
+class AccountRegistry:
+    """
+    Indexes accounts by account number (unique) and client number.
+
+    The registry listens for balance changes on every BankAccount, so call
+    close() (or use it as a context manager) once it is no longer needed.
+
+    Attributes:
+        __by_account (dict[int, BankAccount]): Accounts keyed by account number.
+        __by_client (dict[int, dict[int, BankAccount]]): Accounts grouped by client.
+        __client_balances (dict[int, float]): Total balance per client.
+        __client_charges (dict[int, float]): Total service charges per client.
+        __lock (threading.RLock): Serializes index and aggregate updates.
+    """
+
+    def __init__(self, accounts: Iterable[BankAccount] = ()) -> None:
+        """
+        Initializes a registry and adds the given accounts.
+
+        Args:
+            accounts (Iterable[BankAccount]): Accounts to register.
+
+        Raises:
+            ValueError: If two accounts share an account number.
+        """
+        self.__by_account: dict[int, BankAccount] = {}
+        self.__by_client: dict[int, dict[int, BankAccount]] = {}
+        self.__client_balances: dict[int, float] = {}
+        self.__client_charges: dict[int, float] = {}
+        # Listeners run under the changed account's stripe lock only, so two
+        # accounts of one client can be refreshed from different threads.
+        self.__lock = threading.RLock()
+
+        BankAccount.add_balance_listener(self._on_balance_change)
+
+        for account in accounts:
+            self.add(account)
+
+    def __enter__(self) -> AccountRegistry:
+        """
+        Returns the registry for use in a with block.
+
+        Returns:
+            AccountRegistry: This registry.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """
+        Stops tracking balance changes at the end of a with block.
+
+        Args:
+            *exc_info (object): The exception details, if any.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops tracking balance changes.
+        """
+        BankAccount.remove_balance_listener(self._on_balance_change)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of registered accounts.
+
+        Returns:
+            int: The number of accounts.
+        """
+        return len(self.__by_account)
+
+    def __iter__(self) -> Iterator[BankAccount]:
+        """
+        Returns an iterator over the registered accounts.
+
+        Returns:
+            Iterator[BankAccount]: The accounts, in registration order.
+        """
+        return iter(self.__by_account.values())
+
+    def __contains__(self, account_number: object) -> bool:
+        """
+        Returns whether an account number is registered.
+
+        Args:
+            account_number (object): The account number.
+
+        Returns:
+            bool: True if the account is registered.
+        """
+        return account_number in self.__by_account
+
+    # ---- Insert / remove ----
+    def add(self, account: BankAccount) -> None:
+        """
+        Registers an account.
+
+        Args:
+            account (BankAccount): The account to add.
+
+        Raises:
+            ValueError: If the account number is already registered.
+        """
+        account_number = account.account_number
+        with self.__lock:
+            if account_number in self.__by_account:
+                raise ValueError(f"Account number: {account_number} is already registered.")
+
+            self.__by_account[account_number] = account
+            self.__by_client.setdefault(account.client_number, {})[account_number] = account
+            self._refresh_client(account.client_number)
+
+    def remove(self, account_number: int) -> BankAccount:
+        """
+        Unregisters an account.
+
+        Args:
+            account_number (int): The account number to remove.
+
+        Returns:
+            BankAccount: The removed account.
+
+        Raises:
+            KeyError: If the account number is not registered.
+        """
+        with self.__lock:
+            account = self.__by_account.pop(account_number)
+            client_number = account.client_number
+
+            client_accounts = self.__by_client[client_number]
+            del client_accounts[account_number]
+            if client_accounts:
+                self._refresh_client(client_number)
+            else:
+                del self.__by_client[client_number]
+                del self.__client_balances[client_number]
+                del self.__client_charges[client_number]
+
+        return account
+
+    # ---- Lookups ----
+    def get(self, account_number: int) -> BankAccount | None:
+        """
+        Returns the account with the given account number.
+
+        Args:
+            account_number (int): The account number.
+
+        Returns:
+            BankAccount | None: The account, or None if not registered.
+        """
+        return self.__by_account.get(account_number)
+
+    def accounts_for_client(self, client_number: int) -> list[BankAccount]:
+        """
+        Returns every account belonging to a client.
+
+        Args:
+            client_number (int): The client number.
+
+        Returns:
+            list[BankAccount]: The client's accounts (empty if none).
+        """
+        with self.__lock:
+            return list(self.__by_client.get(client_number, {}).values())
+
+    # ---- Client aggregates ----
+    def client_total_balance(self, client_number: int) -> float:
+        """
+        Returns the total balance of a client's accounts.
+
+        Args:
+            client_number (int): The client number.
+
+        Returns:
+            float: The total balance (0.0 if the client has no accounts).
+        """
+        return self.__client_balances.get(client_number, 0.0)
+
+    def client_total_service_charges(self, client_number: int) -> float:
+        """
+        Returns the total service charges of a client's accounts.
+
+        Args:
+            client_number (int): The client number.
+
+        Returns:
+            float: The total service charges (0.0 if the client has no accounts).
+        """
+        return self.__client_charges.get(client_number, 0.0)
+
+    def refresh(self) -> None:
+        """
+        Recomputes every client's aggregates.
+
+        Balance changes are tracked automatically; call this after changes
+        that do not go through the balance (for example a new
+        InvestmentAccount.TEN_YEARS_AGO waiver threshold).
+        """
+        with self.__lock:
+            for client_number in self.__by_client:
+                self._refresh_client(client_number)
+
+    def _refresh_client(self, client_number: int) -> None:
+        """
+        Recomputes one client's aggregates from their accounts (caller
+        holds the lock).
+
+        Args:
+            client_number (int): The client number.
+        """
+        accounts = self.__by_client[client_number].values()
+        self.__client_balances[client_number] = fsum(account.balance for account in accounts)
+        self.__client_charges[client_number] = fsum(
+            account.get_service_charges() for account in accounts
+        )
+
+    def _on_balance_change(self, account: BankAccount, operation: str, amount: float) -> None:
+        """
+        Balance listener that refreshes the owning client's aggregates.
+
+        Args:
+            account (BankAccount): The account whose balance changed.
+            operation (str): The balance operation.
+            amount (float): The signed amount applied.
+        """
+        with self.__lock:
+            if self.__by_account.get(account.account_number) is account:
+                self._refresh_client(account.client_number)
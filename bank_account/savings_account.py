@@ -10,8 +10,11 @@ to implement Savings-specific service charge calculations.
 from __future__ import annotations
 
 from datetime import date
+from typing import Sequence
 
 from bank_account.bank_account import BankAccount
+from bank_account.charge_cache import cached_service_charge
+from bank_account.money import from_minor, to_minor
 
 
 class SavingsAccount(BankAccount):
@@ -25,6 +28,9 @@ class SavingsAccount(BankAccount):
 
     SERVICE_CHARGE_PREMIUM: float = 2.00
 
+    __slots__ = ("__minimum_balance",)
+    _RECORD_FIELDS = ("minimum_balance",)
+
     def __init__(
         self,
         account_number: int,
@@ -54,6 +60,33 @@ class SavingsAccount(BankAccount):
         except (TypeError, ValueError):
             self.__minimum_balance = 50.0
 
+    @classmethod
+    def _set_record_fields(
+        cls,
+        accounts: list[BankAccount],
+        minimum_balances: Sequence[float],
+    ) -> None:
+        """
+        Assigns the minimum balance field during from_columns().
+
+        Args:
+            accounts (list[BankAccount]): The new accounts.
+            minimum_balances (Sequence[float]): Minimum balances.
+        """
+        for account, minimum in zip(accounts, minimum_balances):
+            account.__minimum_balance = minimum
+
+    # ---- Accessors (properties) ----
+    @property
+    def minimum_balance(self) -> float:
+        """
+        Returns the minimum balance.
+
+        Returns:
+            float: The minimum balance.
+        """
+        return self.__minimum_balance
+
     def __str__(self) -> str:
         """
         Returns a formatted string representation of the savings account.
@@ -67,13 +100,23 @@ class SavingsAccount(BankAccount):
             f"Minimum Balance: {min_str} Account Type: Savings"
         )
 
+    @cached_service_charge
     def get_service_charges(self) -> float:
         """
         Calculates service charges for a SavingsAccount.
 
+        In fixed-point mode the charge is computed in whole minor units.
+
         Returns:
             float: Calculated service charges.
         """
+        minor_units = self.MINOR_UNITS
+        if minor_units is not None:
+            base = to_minor(self.BASE_SERVICE_CHARGE, minor_units)
+            if self._balance >= to_minor(self.__minimum_balance, minor_units):
+                return from_minor(base, minor_units)
+            return from_minor(round(base * self.SERVICE_CHARGE_PREMIUM), minor_units)
+
         if self.balance >= self.__minimum_balance:
             return self.BASE_SERVICE_CHARGE
 
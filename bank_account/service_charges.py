@@ -0,0 +1,218 @@
+"""
+service_charges.py
+
+Defines post_service_charges(), which posts month-end service charges for
+a whole portfolio in one pass.
+
+Charges that cannot be withdrawn are collected as rejections instead of
+raising one ValueError per account, and the run returns a summary with
+per-type totals and timings.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Iterable
+
+from bank_account.account_book import ACCOUNT_TYPE_NAMES, AccountBook, account_type_name
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.fee_rules import DEFAULT_RULES, FeeRuleSet, active_rules
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.transaction_rules import ACCEPTED, REJECTION_REASONS, check_withdrawal
+
+# Account types charged by a FeeRuleSet; other subclasses keep their own rules.
+_RULE_ACCOUNT_TYPES: tuple[type, ...] = (ChequingAccount, SavingsAccount, InvestmentAccount)
+
+
+@dataclass
+class Rejection:
+    """
+    A service charge that could not be posted.
+
+    Attributes:
+        account_number (int): The account that was not charged.
+        account_type (str): The account type name.
+        charge (float): The service charge that was rejected.
+        reason (str): Why the withdrawal was rejected (e.g. "exceeds balance").
+    """
+
+    account_number: int
+    account_type: str
+    charge: float
+    reason: str
+
+
+@dataclass
+class ServiceChargeResult:
+    """
+    Summary of a service charge posting run.
+
+    Attributes:
+        totals (dict[str, float]): Charges posted, per account type.
+        counts (dict[str, int]): Accounts charged, per account type.
+        rejected (list[Rejection]): Charges that were not posted.
+        compute_seconds (float): Time spent calculating charges.
+        apply_seconds (float): Time spent posting charges.
+    """
+
+    totals: dict[str, float] = field(default_factory=dict)
+    counts: dict[str, int] = field(default_factory=dict)
+    rejected: list[Rejection] = field(default_factory=list)
+    compute_seconds: float = 0.0
+    apply_seconds: float = 0.0
+
+    @property
+    def total_charged(self) -> float:
+        """
+        Returns the total of all posted charges.
+
+        Returns:
+            float: The sum of the per-type totals.
+        """
+        return sum(self.totals.values())
+
+    @property
+    def posted_count(self) -> int:
+        """
+        Returns the number of accounts that were charged.
+
+        Returns:
+            int: The sum of the per-type counts.
+        """
+        return sum(self.counts.values())
+
+    def record(self, account_type: str, charge: float) -> None:
+        """
+        Adds a posted charge to the per-type totals.
+
+        Args:
+            account_type (str): The account type name.
+            charge (float): The posted charge.
+        """
+        self.totals[account_type] = self.totals.get(account_type, 0.0) + charge
+        self.counts[account_type] = self.counts.get(account_type, 0) + 1
+
+
+def post_service_charges(accounts: Iterable[BankAccount] | AccountBook) -> ServiceChargeResult:
+    """
+    Calculates and withdraws the service charges of every account.
+
+    Each charge follows the BankAccount.withdraw() rules: it must be
+    positive and must not exceed the balance. Charges that break a rule
+    are reported in the result instead of raising. Charges follow the
+    active fee rules (see fee_rules.set_rules()).
+
+    Args:
+        accounts (Iterable[BankAccount] | AccountBook): The portfolio to charge.
+            An AccountBook is charged in place on its balance column.
+
+    Returns:
+        ServiceChargeResult: Per-type totals, rejections and timings.
+    """
+    if isinstance(accounts, AccountBook):
+        return _post_book_service_charges(accounts)
+
+    accounts = list(accounts)
+    result = ServiceChargeResult()
+
+    # ---- compute phase ----
+    start = perf_counter()
+    rules = active_rules()
+    if rules is DEFAULT_RULES:
+        charges = [account.get_service_charges() for account in accounts]
+    else:
+        charges = [_rule_charge(rules, account) for account in accounts]
+    result.compute_seconds = perf_counter() - start
+
+    # ---- apply phase ----
+    start = perf_counter()
+    stripes = BankAccount._lock_stripes
+    for account, charge in zip(accounts, charges):
+        type_name = account_type_name(account)
+        if stripes is None:
+            code = _withdraw_charge(account, charge)
+        else:
+            # The balance check and the update must be atomic under concurrency.
+            with stripes.lock_for(account._account_number):
+                code = _withdraw_charge(account, charge)
+        if code == ACCEPTED:
+            result.record(type_name, charge)
+        else:
+            result.rejected.append(
+                Rejection(account.account_number, type_name, charge, REJECTION_REASONS[code])
+            )
+    result.apply_seconds = perf_counter() - start
+
+    return result
+
+
+def _withdraw_charge(account: BankAccount, charge: float) -> int:
+    """
+    Withdraws a service charge if the withdraw() rules allow it.
+
+    Args:
+        account (BankAccount): The account.
+        charge (float): The service charge.
+
+    Returns:
+        int: A transaction_rules result code.
+    """
+    code = check_withdrawal(account.balance, charge)
+    if code == ACCEPTED:
+        account._change_balance(-charge, BankAccount.OP_WITHDRAW)
+    return code
+
+
+def _rule_charge(rules: FeeRuleSet, account: BankAccount) -> float:
+    """
+    Returns an account's service charge under a rule set.
+
+    Accounts that are not chequing, savings or investment accounts keep
+    their own get_service_charges().
+
+    Args:
+        rules (FeeRuleSet): The active rules.
+        account (BankAccount): The account.
+
+    Returns:
+        float: The service charge.
+    """
+    if isinstance(account, _RULE_ACCOUNT_TYPES):
+        return rules.charge(account)
+    return account.get_service_charges()
+
+
+def _post_book_service_charges(book: AccountBook) -> ServiceChargeResult:
+    """
+    Posts service charges directly on an AccountBook's balance column.
+
+    Args:
+        book (AccountBook): The book to charge.
+
+    Returns:
+        ServiceChargeResult: Per-type totals, rejections and timings.
+    """
+    result = ServiceChargeResult()
+
+    start = perf_counter()
+    charges = book.get_service_charges()
+    result.compute_seconds = perf_counter() - start
+
+    start = perf_counter()
+    balances = book.balance
+    for row, (account_type, charge) in enumerate(zip(book.account_type, charges)):
+        type_name = ACCOUNT_TYPE_NAMES[account_type]
+        code = check_withdrawal(balances[row], charge)
+        if code == ACCEPTED:
+            balances[row] -= charge
+            result.record(type_name, charge)
+        else:
+            result.rejected.append(
+                Rejection(book.account_number[row], type_name, charge, REJECTION_REASONS[code])
+            )
+    result.apply_seconds = perf_counter() - start
+
+    return result
@@ -0,0 +1,144 @@
+"""
+sharding.py
+
+Runs month-end service charges for an AccountBook across a process pool.
+
+Rows are partitioned by account number, each shard is shipped to a worker
+as raw column bytes (not pickled account objects), and the workers'
+balances, per-type totals and rejections are merged back into one result.
+"""
+
+from __future__ import annotations
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from itertools import islice
+from typing import Any, Sequence
+
+from bank_account.account_book import AccountBook
+from bank_account.fee_rules import DEFAULT_RULES, FeeRuleSet, active_rules, set_rules
+from bank_account.investment_account import InvestmentAccount
+from bank_account.service_charges import Rejection, ServiceChargeResult, post_service_charges
+
+
+def partition_rows(book: AccountBook, shards: int) -> list[Sequence[int]]:
+    """
+    Splits a book's rows into shards by account number.
+
+    A book sorted by account number is split into contiguous account
+    number ranges, which are copied as array slices. Otherwise rows are
+    assigned by account number modulo the shard count.
+
+    Args:
+        book (AccountBook): The book to partition.
+        shards (int): Number of shards.
+
+    Returns:
+        list[Sequence[int]]: Row indexes per shard (a range for contiguous shards).
+
+    Raises:
+        ValueError: If shards is not positive.
+    """
+    if shards <= 0:
+        raise ValueError(f"Shards: {shards} must be positive.")
+
+    numbers = book.account_number
+    if all(low <= high for low, high in zip(numbers, islice(numbers, 1, None))):
+        count = len(numbers)
+        return [range(i * count // shards, (i + 1) * count // shards) for i in range(shards)]
+
+    rows: list[list[int]] = [[] for _ in range(shards)]
+    for row, account_number in enumerate(numbers):
+        rows[account_number % shards].append(row)
+    return rows
+
+
+def _init_worker(ten_years_ago: date, rules_data: dict[str, dict[str, Any]] | None) -> None:
+    """
+    Aligns a worker's waiver threshold and fee rules with the parent process.
+
+    Workers started with spawn or forkserver do not inherit either, so both
+    are passed explicitly.
+
+    Args:
+        ten_years_ago (date): The parent's InvestmentAccount.TEN_YEARS_AGO.
+        rules_data (dict[str, dict[str, Any]] | None): The parent's active
+            fee rules (FeeRuleSet.to_dict()), or None for DEFAULT_RULES.
+    """
+    InvestmentAccount.TEN_YEARS_AGO = ten_years_ago
+    set_rules(DEFAULT_RULES if rules_data is None else FeeRuleSet.from_dict(rules_data))
+
+
+def _charge_shard(buffers: dict[str, bytes]) -> tuple[bytes, dict[str, Any]]:
+    """
+    Posts service charges for one shard inside a worker process.
+
+    Args:
+        buffers (dict[str, bytes]): The shard's columns, from to_buffers().
+
+    Returns:
+        tuple[bytes, dict[str, Any]]: The shard's new balance column bytes
+            and its result fields.
+    """
+    book = AccountBook.from_buffers(buffers)
+    result = post_service_charges(book)
+    return book.balance.tobytes(), {
+        "totals": result.totals,
+        "counts": result.counts,
+        "rejected": [
+            (r.account_number, r.account_type, r.charge, r.reason) for r in result.rejected
+        ],
+        "compute_seconds": result.compute_seconds,
+        "apply_seconds": result.apply_seconds,
+    }
+
+
+def run_sharded_service_charges(book: AccountBook, workers: int | None = None) -> ServiceChargeResult:
+    """
+    Posts service charges for every row of a book using a process pool.
+
+    The book's balance column is updated in place. Timings in the result
+    are those of the slowest shard.
+
+    Args:
+        book (AccountBook): The book to charge.
+        workers (int | None): Number of worker processes. Defaults to the
+            number of CPUs.
+
+    Returns:
+        ServiceChargeResult: Merged per-type totals, rejections and timings.
+    """
+    workers = workers or os.cpu_count() or 1
+    shard_rows = [rows for rows in partition_rows(book, workers) if rows]
+    result = ServiceChargeResult()
+
+    # Compiled rules hold closures and cannot be pickled; send their data.
+    rules = active_rules()
+    rules_data = None if rules is DEFAULT_RULES else rules.to_dict()
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(InvestmentAccount.TEN_YEARS_AGO, rules_data),
+    ) as pool:
+        payloads = (book.take(rows).to_buffers() for rows in shard_rows)
+        for rows, (balance_bytes, shard) in zip(shard_rows, pool.map(_charge_shard, payloads)):
+            shard_balances = array("d")
+            shard_balances.frombytes(balance_bytes)
+            if isinstance(rows, range):
+                book.balance[rows.start:rows.stop] = shard_balances
+            else:
+                for row, balance in zip(rows, shard_balances):
+                    book.balance[row] = balance
+
+            for type_name, total in shard["totals"].items():
+                result.totals[type_name] = result.totals.get(type_name, 0.0) + total
+            for type_name, count in shard["counts"].items():
+                result.counts[type_name] = result.counts.get(type_name, 0) + count
+            result.rejected.extend(Rejection(*fields) for fields in shard["rejected"])
+            result.compute_seconds = max(result.compute_seconds, shard["compute_seconds"])
+            result.apply_seconds = max(result.apply_seconds, shard["apply_seconds"])
+
+    return result
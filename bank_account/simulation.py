@@ -0,0 +1,255 @@
+"""
+simulation.py
+
+Multi-month service charge projections over an AccountBook.
+
+simulate() repeats the month-end step of A02_main.py (withdraw each
+account's get_service_charges()) for many months and many what-if
+scenarios. Each scenario may override the overdraft rate, minimum
+balance or management fee of every account and add a random monthly
+deposit/withdraw stream. Every month is a handful of passes over the
+book's columns, using compute_service_charges() with the investment
+waiver threshold of that month, so accounts cross their 10-year mark
+during the projection.
+"""
+
+from __future__ import annotations
+
+import calendar
+import random
+from array import array
+from dataclasses import dataclass, field
+from datetime import date
+from math import fsum
+from statistics import fmean, quantiles
+from typing import Iterable
+
+from bank_account.account_book import AccountBook, compute_service_charges
+from bank_account.investment_account import InvestmentAccount
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    One what-if setting for a projection.
+
+    Attributes:
+        name (str): Label used in the results.
+        overdraft_rate (float | None): Replaces every chequing overdraft rate.
+        minimum_balance (float | None): Replaces every savings minimum balance.
+        management_fee (float | None): Replaces every investment management fee.
+        flow_mean (float): Mean of each account's random monthly cash flow.
+        flow_stddev (float): Standard deviation of the monthly cash flow
+            (0.0 disables the random stream).
+        seed (int | None): Seed of the random stream.
+    """
+
+    name: str
+    overdraft_rate: float | None = None
+    minimum_balance: float | None = None
+    management_fee: float | None = None
+    flow_mean: float = 0.0
+    flow_stddev: float = 0.0
+    seed: int | None = None
+
+
+@dataclass
+class ScenarioResult:
+    """
+    Outcome of one scenario.
+
+    Attributes:
+        scenario (Scenario): The scenario that was run.
+        charges (array): Total charges withdrawn per account.
+        ending_balances (array): Balance of each account after the last month.
+        monthly_charges (list[float]): Total charges withdrawn each month.
+        rejected_charges (int): Service charges that exceeded the balance.
+        rejected_withdrawals (int): Random withdrawals that exceeded the balance.
+    """
+
+    scenario: Scenario
+    charges: array = field(default_factory=lambda: array("d"))
+    ending_balances: array = field(default_factory=lambda: array("d"))
+    monthly_charges: list[float] = field(default_factory=list)
+    rejected_charges: int = 0
+    rejected_withdrawals: int = 0
+
+    @property
+    def total_charged(self) -> float:
+        """
+        Returns the charges withdrawn over the whole projection.
+
+        Returns:
+            float: The sum of the monthly totals.
+        """
+        return fsum(self.monthly_charges)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        Returns the distributions of per-account charges and ending balances.
+
+        Returns:
+            dict[str, dict[str, float]]: "charges" and "ending_balance",
+                each summarized by describe().
+        """
+        return {
+            "charges": describe(self.charges),
+            "ending_balance": describe(self.ending_balances),
+        }
+
+
+def describe(values: Iterable[float]) -> dict[str, float]:
+    """
+    Summarizes a distribution.
+
+    Args:
+        values (Iterable[float]): The values.
+
+    Returns:
+        dict[str, float]: mean, min, p5, p50, p95 and max (empty if no values).
+    """
+    values = sorted(values)
+    if not values:
+        return {}
+    if len(values) == 1:
+        cuts = [values[0]] * 99
+    else:
+        cuts = quantiles(values, n=100, method="inclusive")
+    return {
+        "mean": fmean(values),
+        "min": values[0],
+        "p5": cuts[4],
+        "p50": cuts[49],
+        "p95": cuts[94],
+        "max": values[-1],
+    }
+
+
+def add_months(day: date, months: int) -> date:
+    """
+    Returns the same day of the month a number of months later.
+
+    Days past the end of a shorter month are clamped to its last day.
+
+    Args:
+        day (date): The starting date.
+        months (int): Months to add.
+
+    Returns:
+        date: The shifted date.
+    """
+    year, month = divmod(day.month - 1 + months, 12)
+    year += day.year
+    month += 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+def simulate(
+    book: AccountBook,
+    scenarios: Iterable[Scenario],
+    months: int = 12,
+    start: date | None = None,
+) -> list[ScenarioResult]:
+    """
+    Projects month-end service charges for several scenarios.
+
+    Each month, every account first receives its random cash flow (a
+    deposit, or a withdrawal that is skipped if it exceeds the balance),
+    then its service charge is withdrawn following the
+    BankAccount.withdraw() rules. The book itself is not modified.
+
+    Args:
+        book (AccountBook): The starting portfolio.
+        scenarios (Iterable[Scenario]): The settings to compare.
+        months (int): Number of month ends to simulate.
+        start (date | None): Date of the first month end. Defaults to today.
+
+    Returns:
+        list[ScenarioResult]: One result per scenario, in order.
+
+    Raises:
+        ValueError: If months is negative.
+    """
+    if months < 0:
+        raise ValueError(f"Months: {months} must not be negative.")
+    if start is None:
+        start = date.today()
+
+    thresholds = [
+        InvestmentAccount.waiver_threshold(add_months(start, month)) for month in range(months)
+    ]
+    return [_run_scenario(book, scenario, thresholds) for scenario in scenarios]
+
+
+def _override(column: array, value: float | None) -> array:
+    """
+    Returns a column, or a column filled with the scenario's override.
+
+    Rows of other account types ignore the column, so filling every row is safe.
+
+    Args:
+        column (array): The book's column.
+        value (float | None): The override, or None to keep the column.
+
+    Returns:
+        array: The column to use.
+    """
+    if value is None:
+        return column
+    return array("d", [value]) * len(column)
+
+
+def _run_scenario(book: AccountBook, scenario: Scenario, thresholds: list[date]) -> ScenarioResult:
+    """
+    Runs one scenario month by month.
+
+    Args:
+        book (AccountBook): The starting portfolio.
+        scenario (Scenario): The scenario.
+        thresholds (list[date]): The investment waiver threshold of each month.
+
+    Returns:
+        ScenarioResult: The scenario's outcome.
+    """
+    result = ScenarioResult(scenario)
+    count = len(book)
+    balances = array("d", book.balance)
+    charged = array("d", [0.0]) * count
+
+    types = book.account_type
+    dates = book.date_created
+    limits = book.overdraft_limit
+    rates = _override(book.overdraft_rate, scenario.overdraft_rate)
+    minimums = _override(book.minimum_balance, scenario.minimum_balance)
+    fees = _override(book.management_fee, scenario.management_fee)
+
+    rng = random.Random(scenario.seed)
+    mean, stddev = scenario.flow_mean, scenario.flow_stddev
+
+    for ten_years_ago in thresholds:
+        # ---- random deposit / withdraw stream ----
+        if stddev > 0.0 or mean != 0.0:
+            gauss = rng.gauss
+            flows = [round(gauss(mean, stddev), 2) for _ in range(count)]
+            rejected = sum(1 for balance, flow in zip(balances, flows) if flow < 0.0 and -flow > balance)
+            result.rejected_withdrawals += rejected
+            balances = array("d", [
+                balance + flow if flow > 0.0 or -flow <= balance else balance
+                for balance, flow in zip(balances, flows)
+            ])
+
+        # ---- month-end service charges (A02_main.py step 12) ----
+        charges = compute_service_charges(
+            types, balances, dates, limits, rates, minimums, fees, ten_years_ago
+        )
+        # A rejected charge is posted as 0.0, which leaves the balance as is.
+        posted = [charge if 0.0 < charge <= balance else 0.0 for balance, charge in zip(balances, charges)]
+        balances = array("d", [balance - charge for balance, charge in zip(balances, posted)])
+        charged = array("d", [total + charge for total, charge in zip(charged, posted)])
+
+        result.monthly_charges.append(fsum(posted))
+        result.rejected_charges += posted.count(0.0)
+
+    result.charges = charged
+    result.ending_balances = balances
+    return result
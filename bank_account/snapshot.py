@@ -0,0 +1,351 @@
+"""
+snapshot.py
+
+Compact, memory-mapped binary snapshots of a portfolio.
+
+A snapshot file is a fixed header followed by one fixed-width record per
+account, sorted by account number. PortfolioSnapshot maps the file into
+memory and only decodes the records that are actually used, so a freshly
+started process can answer lookups and service charge queries right away
+instead of rebuilding every account first.
+
+Layout (little endian):
+    header:  magic (8s) version (H) record size (H) reserved (I) count (Q)
+    record:  account type (B) account number (q) client number (q)
+             balance (d) date created ordinal (i) field 1 (d) field 2 (d)
+
+Field 1 and 2 hold overdraft_limit/overdraft_rate for chequing accounts,
+minimum_balance for savings accounts and management_fee for investment
+accounts (unused fields are 0.0).
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from datetime import date
+from typing import Iterable, Iterator
+
+from bank_account.account_book import (
+    CHEQUING,
+    INVESTMENT,
+    SAVINGS,
+    AccountBook,
+    compute_service_charges,
+)
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+
+SNAPSHOT_MAGIC: bytes = b"BANKSNAP"
+SNAPSHOT_VERSION: int = 1
+
+_HEADER = struct.Struct("<8sHHIQ")
+_RECORD = struct.Struct("<Bqqdidd")
+_ACCOUNT_NUMBER = struct.Struct("<q")
+
+_ACCOUNT_CLASSES: dict[int, type[BankAccount]] = {
+    CHEQUING: ChequingAccount,
+    SAVINGS: SavingsAccount,
+    INVESTMENT: InvestmentAccount,
+}
+
+
+def write_snapshot(path: str | os.PathLike, accounts: Iterable[BankAccount] | AccountBook) -> int:
+    """
+    Writes a portfolio snapshot.
+
+    The file is written under a temporary name and renamed into place, so
+    readers never see a partial snapshot.
+
+    Args:
+        path (str | os.PathLike): Destination file.
+        accounts (Iterable[BankAccount] | AccountBook): The portfolio.
+
+    Returns:
+        int: The number of accounts written.
+
+    Raises:
+        ValueError: If two accounts share an account number.
+        TypeError: If an account type is not supported.
+    """
+    book = accounts if isinstance(accounts, AccountBook) else AccountBook.from_accounts(accounts)
+    rows = sorted(range(len(book)), key=book.account_number.__getitem__)
+
+    for previous, current in zip(rows, rows[1:]):
+        if book.account_number[previous] == book.account_number[current]:
+            raise ValueError(f"Account number: {book.account_number[current]} is duplicated.")
+
+    temp_path = f"{os.fspath(path)}.tmp"
+    with open(temp_path, "wb") as stream:
+        stream.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, _RECORD.size, 0, len(rows)))
+        pack = _RECORD.pack
+        for row in rows:
+            account_type = book.account_type[row]
+            if account_type == CHEQUING:
+                fields = (book.overdraft_limit[row], book.overdraft_rate[row])
+            elif account_type == SAVINGS:
+                fields = (book.minimum_balance[row], 0.0)
+            else:
+                fields = (book.management_fee[row], 0.0)
+
+            stream.write(pack(
+                account_type,
+                book.account_number[row],
+                book.client_number[row],
+                book.balance[row],
+                book.date_created[row],
+                *fields,
+            ))
+        stream.flush()
+        os.fsync(stream.fileno())
+
+    os.replace(temp_path, path)
+    return len(rows)
+
+
+class PortfolioSnapshot:
+    """
+    Read-only, lazily decoded view of a snapshot file.
+
+    Attributes:
+        __file: The open snapshot file.
+        __map (mmap.mmap): The memory-mapped file contents.
+        __count (int): Number of records.
+        __accounts (dict[int, BankAccount]): Accounts materialized so far, by row.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """
+        Opens and memory-maps a snapshot file.
+
+        Args:
+            path (str | os.PathLike): The snapshot file.
+
+        Raises:
+            ValueError: If the file is not a snapshot, has an unsupported
+                version, or is truncated.
+        """
+        self.__file = open(path, "rb")
+        try:
+            size = os.fstat(self.__file.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"Snapshot: {os.fspath(path)} is too short.")
+
+            self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, record_size, _, count = _HEADER.unpack_from(self.__map)
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError(f"Snapshot: {os.fspath(path)} is not a portfolio snapshot.")
+            if version != SNAPSHOT_VERSION or record_size != _RECORD.size:
+                raise ValueError(f"Snapshot version: {version} is not supported.")
+            if size < _HEADER.size + count * record_size:
+                raise ValueError(f"Snapshot: {os.fspath(path)} is truncated.")
+        except Exception:
+            self.close()
+            raise
+
+        self.__count: int = count
+        self.__accounts: dict[int, BankAccount] = {}
+
+    def __enter__(self) -> PortfolioSnapshot:
+        """
+        Returns the snapshot for use in a with block.
+
+        Returns:
+            PortfolioSnapshot: This snapshot.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """
+        Closes the snapshot at the end of a with block.
+
+        Args:
+            *exc_info (object): The exception details, if any.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Unmaps and closes the snapshot file.
+
+        Accounts already materialized remain usable.
+        """
+        snapshot_map = getattr(self, "_PortfolioSnapshot__map", None)
+        if snapshot_map is not None and not snapshot_map.closed:
+            snapshot_map.close()
+        self.__file.close()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of accounts in the snapshot.
+
+        Returns:
+            int: The number of records.
+        """
+        return self.__count
+
+    def __iter__(self) -> Iterator[BankAccount]:
+        """
+        Returns an iterator over every account, in account number order.
+
+        Returns:
+            Iterator[BankAccount]: The accounts (materialized on demand).
+        """
+        for row in range(self.__count):
+            yield self[row]
+
+    def __getitem__(self, row: int) -> BankAccount:
+        """
+        Returns the account stored at a row, materializing it on first use.
+
+        Args:
+            row (int): The row index (records are sorted by account number).
+
+        Returns:
+            BankAccount: The account.
+
+        Raises:
+            IndexError: If the row is out of range.
+        """
+        if row < 0:
+            row += self.__count
+        if not 0 <= row < self.__count:
+            raise IndexError(f"Snapshot row: {row} is out of range.")
+
+        account = self.__accounts.get(row)
+        if account is None:
+            account = self._materialize(row)
+            self.__accounts[row] = account
+        return account
+
+    # ---- Lookups ----
+    def row_of(self, account_number: int) -> int | None:
+        """
+        Finds an account's row by binary search over the mapped records.
+
+        Args:
+            account_number (int): The account number.
+
+        Returns:
+            int | None: The row, or None if the account is not in the snapshot.
+        """
+        low, high = 0, self.__count
+        while low < high:
+            middle = (low + high) // 2
+            if self._account_number_at(middle) < account_number:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < self.__count and self._account_number_at(low) == account_number:
+            return low
+        return None
+
+    def find(self, account_number: int) -> BankAccount | None:
+        """
+        Returns the account with the given account number.
+
+        Args:
+            account_number (int): The account number.
+
+        Returns:
+            BankAccount | None: The account, or None if not in the snapshot.
+        """
+        row = self.row_of(account_number)
+        return None if row is None else self[row]
+
+    def get_service_charges(self, account_number: int) -> float | None:
+        """
+        Returns an account's service charges (active fee rules) from its record.
+
+        Args:
+            account_number (int): The account number.
+
+        Returns:
+            float | None: The service charges, or None if not in the snapshot.
+        """
+        row = self.row_of(account_number)
+        if row is None:
+            return None
+
+        account_type, _, _, balance, created, field_1, field_2 = self._record(row)
+        charges = compute_service_charges(
+            [account_type],
+            [balance],
+            [created],
+            [field_1 if account_type == CHEQUING else 0.0],
+            [field_2 if account_type == CHEQUING else 0.0],
+            [field_1 if account_type == SAVINGS else 0.0],
+            [field_1 if account_type == INVESTMENT else 0.0],
+        )
+        return charges[0]
+
+    def to_book(self) -> AccountBook:
+        """
+        Decodes every record into an AccountBook.
+
+        Returns:
+            AccountBook: The whole portfolio, in account number order.
+        """
+        book = AccountBook()
+        start = _HEADER.size
+        stop = start + self.__count * _RECORD.size
+        for account_type, number, client, balance, created, field_1, field_2 in _RECORD.iter_unpack(
+            self.__map[start:stop]
+        ):
+            book.account_type.append(account_type)
+            book.account_number.append(number)
+            book.client_number.append(client)
+            book.balance.append(balance)
+            book.date_created.append(created)
+            book.overdraft_limit.append(field_1 if account_type == CHEQUING else 0.0)
+            book.overdraft_rate.append(field_2 if account_type == CHEQUING else 0.0)
+            book.minimum_balance.append(field_1 if account_type == SAVINGS else 0.0)
+            book.management_fee.append(field_1 if account_type == INVESTMENT else 0.0)
+        return book
+
+    # ---- Record decoding ----
+    def _record(self, row: int) -> tuple:
+        """
+        Decodes one record.
+
+        Args:
+            row (int): The record position.
+
+        Returns:
+            tuple: The record fields in _RECORD order.
+        """
+        return _RECORD.unpack_from(self.__map, _HEADER.size + row * _RECORD.size)
+
+    def _account_number_at(self, row: int) -> int:
+        """
+        Decodes only the account number of one record (for binary search).
+
+        Args:
+            row (int): The record position.
+
+        Returns:
+            int: The account number.
+        """
+        return _ACCOUNT_NUMBER.unpack_from(self.__map, _HEADER.size + row * _RECORD.size + 1)[0]
+
+    def _materialize(self, row: int) -> BankAccount:
+        """
+        Builds the account object for one record.
+
+        Args:
+            row (int): The row index.
+
+        Returns:
+            BankAccount: The account.
+        """
+        account_type, number, client, balance, created, field_1, field_2 = self._record(row)
+        account_class = _ACCOUNT_CLASSES[account_type]
+        fields = (field_1, field_2)[: len(account_class._RECORD_FIELDS)]
+        account, = account_class.from_columns(
+            [number], [client], [balance], [date.fromordinal(created)], *([value] for value in fields)
+        )
+        return account
@@ -0,0 +1,359 @@
+"""
+sqlite_store.py
+
+Defines the SqliteAccountStore class, which persists accounts in a SQLite
+database (standard library sqlite3, write-ahead logging).
+
+Accounts are saved and loaded in large executemany()/fetchmany() batches
+with a fixed set of SQL statements, which sqlite3 prepares once and
+reuses. Balance changes made through deposit(), withdraw() or
+update_balance() are not written one by one: the store records which
+accounts changed and writes all of them in a single batch at commit().
+"""
+
+from __future__ import annotations
+
+import heapq
+import os
+import sqlite3
+from datetime import date
+from itertools import islice
+from operator import attrgetter
+from typing import Iterable, Iterator
+
+from bank_account.account_book import CHEQUING, INVESTMENT, SAVINGS, AccountBook, account_type_code
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+
+_ACCOUNT_CLASSES: dict[int, type[BankAccount]] = {
+    CHEQUING: ChequingAccount,
+    SAVINGS: SavingsAccount,
+    INVESTMENT: InvestmentAccount,
+}
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS accounts (
+    account_number  INTEGER PRIMARY KEY,
+    account_type    INTEGER NOT NULL,
+    client_number   INTEGER NOT NULL,
+    balance         REAL    NOT NULL,
+    date_created    INTEGER NOT NULL,
+    overdraft_limit REAL    NOT NULL DEFAULT 0.0,
+    overdraft_rate  REAL    NOT NULL DEFAULT 0.0,
+    minimum_balance REAL    NOT NULL DEFAULT 0.0,
+    management_fee  REAL    NOT NULL DEFAULT 0.0
+)
+"""
+
+_COLUMNS: tuple[str, ...] = (
+    "account_number",
+    "account_type",
+    "client_number",
+    "balance",
+    "date_created",
+    "overdraft_limit",
+    "overdraft_rate",
+    "minimum_balance",
+    "management_fee",
+)
+
+_UPSERT = f"INSERT OR REPLACE INTO accounts ({', '.join(_COLUMNS)}) VALUES ({', '.join('?' * len(_COLUMNS))})"
+_SELECT = f"SELECT {', '.join(_COLUMNS)} FROM accounts ORDER BY account_number"
+_UPDATE_BALANCE = "UPDATE accounts SET balance = ? WHERE account_number = ?"
+_DELETE = "DELETE FROM accounts WHERE account_number = ?"
+_COUNT = "SELECT COUNT(*) FROM accounts"
+
+
+def _account_row(account: BankAccount) -> tuple:
+    """
+    Returns an account's values in _COLUMNS order.
+
+    Args:
+        account (BankAccount): The account.
+
+    Returns:
+        tuple: The row (fields of other account types are 0.0).
+
+    Raises:
+        TypeError: If the account type is not supported.
+    """
+    account_type = account_type_code(account)
+    return (
+        account.account_number,
+        account_type,
+        account.client_number,
+        account.balance,
+        account.date_created.toordinal(),
+        account.overdraft_limit if account_type == CHEQUING else 0.0,
+        account.overdraft_rate if account_type == CHEQUING else 0.0,
+        account.minimum_balance if account_type == SAVINGS else 0.0,
+        account.management_fee if account_type == INVESTMENT else 0.0,
+    )
+
+
+def _book_rows(book: AccountBook) -> Iterator[tuple]:
+    """
+    Returns an iterator over an AccountBook's rows in _COLUMNS order.
+
+    Args:
+        book (AccountBook): The book.
+
+    Returns:
+        Iterator[tuple]: One row per account.
+    """
+    return zip(
+        book.account_number,
+        book.account_type,
+        book.client_number,
+        book.balance,
+        book.date_created,
+        book.overdraft_limit,
+        book.overdraft_rate,
+        book.minimum_balance,
+        book.management_fee,
+    )
+
+
+class SqliteAccountStore:
+    """
+    Persists accounts in a SQLite database.
+
+    The store listens for balance changes on every BankAccount, so call
+    close() (or use it as a context manager) once it is no longer needed.
+
+    Attributes:
+        __connection (sqlite3.Connection): The database connection.
+        __batch_size (int): Rows per executemany()/fetchmany() call.
+        __tracked (dict[int, BankAccount]): Saved or loaded accounts.
+        __dirty (dict[int, BankAccount]): Tracked accounts whose balance
+            changed since the last commit().
+    """
+
+    def __init__(self, path: str | os.PathLike, batch_size: int = 50_000) -> None:
+        """
+        Opens (or creates) an account database.
+
+        Args:
+            path (str | os.PathLike): The database file.
+            batch_size (int): Rows per executemany()/fetchmany() call.
+
+        Raises:
+            ValueError: If batch_size is not positive.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"Batch size: {batch_size} must be positive.")
+
+        self.__batch_size = batch_size
+        self.__connection = sqlite3.connect(os.fspath(path))
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.execute(_CREATE_TABLE)
+        self.__connection.commit()
+
+        self.__tracked: dict[int, BankAccount] = {}
+        self.__dirty: dict[int, BankAccount] = {}
+        BankAccount.add_balance_listener(self._on_balance_change)
+
+    def __enter__(self) -> SqliteAccountStore:
+        """
+        Returns the store for use in a with block.
+
+        Returns:
+            SqliteAccountStore: This store.
+        """
+        return self
+
+    def __exit__(self, exc_type: type | None, *exc_info: object) -> None:
+        """
+        Commits (unless the block raised) and closes the store.
+
+        Args:
+            exc_type (type | None): The exception type, if the block raised.
+            *exc_info (object): The exception value and traceback.
+        """
+        if exc_type is None:
+            self.commit()
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of stored accounts.
+
+        Returns:
+            int: The number of rows in the accounts table.
+        """
+        return self.__connection.execute(_COUNT).fetchone()[0]
+
+    @property
+    def dirty_count(self) -> int:
+        """
+        Returns the number of balances waiting for commit().
+
+        Returns:
+            int: The number of changed accounts.
+        """
+        return len(self.__dirty)
+
+    # ---- Writing ----
+    def save(self, accounts: Iterable[BankAccount] | AccountBook) -> int:
+        """
+        Inserts or replaces accounts, in batches, and commits.
+
+        Saved account objects are tracked, so their later balance changes
+        are written by commit().
+
+        Args:
+            accounts (Iterable[BankAccount] | AccountBook): The accounts.
+
+        Returns:
+            int: The number of accounts saved.
+
+        Raises:
+            TypeError: If an account type is not supported.
+        """
+        if isinstance(accounts, AccountBook):
+            rows: Iterable[tuple] = _book_rows(accounts)
+        else:
+            rows = map(self._track_row, accounts)
+
+        saved = 0
+        with self.__connection:
+            while batch := list(islice(rows, self.__batch_size)):
+                self.__connection.executemany(_UPSERT, batch)
+                saved += len(batch)
+        return saved
+
+    def delete(self, account_numbers: Iterable[int]) -> None:
+        """
+        Deletes accounts and stops tracking them.
+
+        Args:
+            account_numbers (Iterable[int]): The accounts to delete.
+        """
+        numbers = list(account_numbers)
+        for number in numbers:
+            self.__tracked.pop(number, None)
+            self.__dirty.pop(number, None)
+        with self.__connection:
+            self.__connection.executemany(_DELETE, ((number,) for number in numbers))
+
+    def commit(self) -> int:
+        """
+        Writes every changed balance in one batch and commits.
+
+        If the write fails, the changed balances stay pending so a later
+        commit() writes them.
+
+        Returns:
+            int: The number of balances written.
+        """
+        dirty, self.__dirty = self.__dirty, {}
+        if not dirty:
+            return 0
+
+        rows = ((account.balance, number) for number, account in dirty.items())
+        try:
+            with self.__connection:
+                while batch := list(islice(rows, self.__batch_size)):
+                    self.__connection.executemany(_UPDATE_BALANCE, batch)
+        except BaseException:
+            # Keep changes recorded while writing, then restore the rest.
+            dirty.update(self.__dirty)
+            self.__dirty = dirty
+            raise
+        return len(dirty)
+
+    def close(self) -> None:
+        """
+        Stops tracking balance changes and closes the database.
+
+        Balances changed since the last commit() are not written.
+        """
+        BankAccount.remove_balance_listener(self._on_balance_change)
+        self.__connection.close()
+
+    # ---- Reading ----
+    def load(self) -> list[BankAccount]:
+        """
+        Loads every account and tracks it for commit().
+
+        Accounts are built per type with the trusted bulk constructor.
+
+        Returns:
+            list[BankAccount]: The accounts, in account number order.
+        """
+        columns: dict[int, list[list]] = {code: [[] for _ in range(6)] for code in _ACCOUNT_CLASSES}
+        fromordinal = date.fromordinal
+
+        cursor = self.__connection.execute(_SELECT)
+        while batch := cursor.fetchmany(self.__batch_size):
+            for number, account_type, client, balance, created, limit, rate, minimum, fee in batch:
+                numbers, clients, balances, dates, field_1, field_2 = columns[account_type]
+                numbers.append(number)
+                clients.append(client)
+                balances.append(balance)
+                dates.append(fromordinal(created))
+                if account_type == CHEQUING:
+                    field_1.append(limit)
+                    field_2.append(rate)
+                elif account_type == SAVINGS:
+                    field_1.append(minimum)
+                else:
+                    field_1.append(fee)
+
+        per_type = []
+        for code, account_class in _ACCOUNT_CLASSES.items():
+            numbers, clients, balances, dates, field_1, field_2 = columns[code]
+            fields = (field_1, field_2)[: len(account_class._RECORD_FIELDS)]
+            per_type.append(account_class.from_columns(numbers, clients, balances, dates, *fields))
+
+        accounts = list(heapq.merge(*per_type, key=attrgetter("account_number")))
+        self.__tracked.update((account.account_number, account) for account in accounts)
+        return accounts
+
+    def load_book(self) -> AccountBook:
+        """
+        Loads every account into an AccountBook (not tracked for commit()).
+
+        Returns:
+            AccountBook: The accounts, in account number order.
+        """
+        book = AccountBook()
+        columns = [getattr(book, name) for name in _COLUMNS]
+
+        cursor = self.__connection.execute(_SELECT)
+        while batch := cursor.fetchmany(self.__batch_size):
+            for column, values in zip(columns, zip(*batch)):
+                column.extend(values)
+        return book
+
+    # ---- Change tracking ----
+    def _track_row(self, account: BankAccount) -> tuple:
+        """
+        Tracks an account being saved and returns its row.
+
+        Args:
+            account (BankAccount): The account.
+
+        Returns:
+            tuple: The row in _COLUMNS order.
+        """
+        row = _account_row(account)
+        self.__tracked[account.account_number] = account
+        self.__dirty.pop(account.account_number, None)
+        return row
+
+    def _on_balance_change(self, account: BankAccount, operation: str, amount: float) -> None:
+        """
+        Balance listener that marks a tracked account as changed.
+
+        Args:
+            account (BankAccount): The account whose balance changed.
+            operation (str): The balance operation.
+            amount (float): The signed amount applied.
+        """
+        number = account.account_number
+        if self.__tracked.get(number) is account:
+            self.__dirty[number] = account
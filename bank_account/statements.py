@@ -0,0 +1,238 @@
+"""
+statements.py
+
+Renders statements for whole portfolios straight into a stream.
+
+Accounts are formatted in chunks and each chunk is written with a single
+call, instead of one print() per account. Three layouts are available:
+
+* "text": byte-identical to print(account) for every account;
+* "fixed": one fixed-width line per account;
+* "csv": one row per account, using the columns read by bank_account.loader.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+from itertools import islice
+from typing import IO, Callable, Iterable
+
+from bank_account.account_book import account_type_name
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+
+LAYOUTS: tuple[str, ...] = ("text", "fixed", "csv")
+
+CSV_COLUMNS: tuple[str, ...] = (
+    "account_type",
+    "account_number",
+    "client_number",
+    "balance",
+    "date_created",
+    "overdraft_limit",
+    "overdraft_rate",
+    "minimum_balance",
+    "management_fee",
+)
+
+FIXED_WIDTH_HEADER: str = (
+    f"{'Type':<10} {'Account':>12} {'Client':>12} {'Balance':>18} "
+    f"{'Created':>10} {'Charges':>12}"
+)
+
+
+# ---- "text" layout: same output as __str__, without the super() chain ----
+def _chequing_text(account: ChequingAccount) -> str:
+    """
+    Returns a chequing account's statement text.
+
+    Args:
+        account (ChequingAccount): The account.
+
+    Returns:
+        str: The same text as ChequingAccount.__str__().
+    """
+    return (
+        f"Account Number: {account._account_number} Balance: ${account._balance:,.2f}\n"
+        f"Overdraft Limit: ${account.overdraft_limit:,.2f} "
+        f"Overdraft Rate: {account.overdraft_rate * 100:.2f}% Account Type: Chequing"
+    )
+
+
+def _savings_text(account: SavingsAccount) -> str:
+    """
+    Returns a savings account's statement text.
+
+    Args:
+        account (SavingsAccount): The account.
+
+    Returns:
+        str: The same text as SavingsAccount.__str__().
+    """
+    return (
+        f"Account Number: {account._account_number} Balance: ${account._balance:,.2f}\n"
+        f"Minimum Balance: ${account.minimum_balance:,.2f} Account Type: Savings"
+    )
+
+
+def _investment_text(account: InvestmentAccount) -> str:
+    """
+    Returns an investment account's statement text.
+
+    Args:
+        account (InvestmentAccount): The account.
+
+    Returns:
+        str: The same text as InvestmentAccount.__str__().
+    """
+    if account._date_created <= account.TEN_YEARS_AGO:
+        fee_str = "Waived"
+    else:
+        fee_str = f"${account.management_fee:,.2f}"
+
+    return (
+        f"Account Number: {account._account_number} Balance: ${account._balance:,.2f}\n"
+        f"Date Created: {account._date_created} Management Fee: {fee_str} "
+        f"Account Type: Investment"
+    )
+
+
+_TEXT_FORMATTERS: dict[type, Callable[[BankAccount], str]] = {
+    ChequingAccount: _chequing_text,
+    SavingsAccount: _savings_text,
+    InvestmentAccount: _investment_text,
+}
+
+
+def format_text(account: BankAccount) -> str:
+    """
+    Returns an account's statement text, identical to str(account).
+
+    Subclasses with their own __str__, and fixed-point money mode, use
+    str(account) directly.
+
+    Args:
+        account (BankAccount): The account to format.
+
+    Returns:
+        str: The statement text.
+    """
+    formatter = _TEXT_FORMATTERS.get(type(account))
+    if formatter is None or BankAccount.MINOR_UNITS is not None:
+        return str(account)
+    return formatter(account)
+
+
+def format_fixed_width(account: BankAccount) -> str:
+    """
+    Returns an account's statement as one fixed-width line.
+
+    Args:
+        account (BankAccount): The account to format.
+
+    Returns:
+        str: The line, aligned with FIXED_WIDTH_HEADER.
+    """
+    return (
+        f"{account_type_name(account):<10} {account.account_number:>12} "
+        f"{account.client_number:>12} {account.balance:>18,.2f} "
+        f"{account.date_created.isoformat():>10} {account.get_service_charges():>12,.2f}"
+    )
+
+
+def _csv_row(account: BankAccount) -> tuple:
+    """
+    Returns an account's fields in CSV_COLUMNS order.
+
+    Args:
+        account (BankAccount): The account.
+
+    Returns:
+        tuple: The row values (empty strings for fields of other types).
+    """
+    return (
+        account_type_name(account),
+        account.account_number,
+        account.client_number,
+        repr(account.balance),
+        account.date_created.isoformat(),
+        repr(account.overdraft_limit) if isinstance(account, ChequingAccount) else "",
+        repr(account.overdraft_rate) if isinstance(account, ChequingAccount) else "",
+        repr(account.minimum_balance) if isinstance(account, SavingsAccount) else "",
+        repr(account.management_fee) if isinstance(account, InvestmentAccount) else "",
+    )
+
+
+def render_statements(
+    accounts: Iterable[BankAccount],
+    stream: IO[str],
+    layout: str = "text",
+    chunk_size: int = 4096,
+) -> int:
+    """
+    Writes the statements of many accounts to a text stream.
+
+    Args:
+        accounts (Iterable[BankAccount]): The accounts to render.
+        stream (IO[str]): The destination text stream.
+        layout (str): "text", "fixed" or "csv".
+        chunk_size (int): Accounts formatted per write call.
+
+    Returns:
+        int: The number of accounts rendered.
+
+    Raises:
+        ValueError: If the layout is unknown or chunk_size is not positive.
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"Layout: {layout} must be one of {', '.join(LAYOUTS)}.")
+    if chunk_size <= 0:
+        raise ValueError(f"Chunk size: {chunk_size} must be positive.")
+
+    accounts = iter(accounts)
+    rendered = 0
+
+    if layout == "csv":
+        writer = csv.writer(stream, lineterminator="\n")
+        writer.writerow(CSV_COLUMNS)
+        while chunk := list(islice(accounts, chunk_size)):
+            writer.writerows(map(_csv_row, chunk))
+            rendered += len(chunk)
+        return rendered
+
+    if layout == "fixed":
+        stream.write(FIXED_WIDTH_HEADER + "\n")
+        formatter = format_fixed_width
+    else:
+        formatter = format_text
+
+    while chunk := list(islice(accounts, chunk_size)):
+        stream.write("\n".join(map(formatter, chunk)) + "\n")
+        rendered += len(chunk)
+
+    return rendered
+
+
+def write_statements(
+    path: str | os.PathLike,
+    accounts: Iterable[BankAccount],
+    layout: str = "text",
+    buffer_size: int = 1 << 20,
+) -> int:
+    """
+    Writes the statements of many accounts to a file.
+
+    Args:
+        path (str | os.PathLike): The destination file.
+        accounts (Iterable[BankAccount]): The accounts to render.
+        layout (str): "text", "fixed" or "csv".
+        buffer_size (int): Size of the file's write buffer, in bytes.
+
+    Returns:
+        int: The number of accounts rendered.
+    """
+    with open(path, "w", encoding="utf-8", newline="", buffering=buffer_size) as stream:
+        return render_statements(accounts, stream, layout)
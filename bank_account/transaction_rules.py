@@ -0,0 +1,61 @@
+"""
+transaction_rules.py
+
+Defines the shared deposit and withdrawal rules as plain result codes.
+
+BankAccount.deposit() and withdraw() raise ValueError when a rule fails.
+Bulk operations use these helpers instead so a rejected transaction costs
+a comparison rather than an exception.
+"""
+
+from __future__ import annotations
+
+# ---- Result codes ----
+ACCEPTED: int = 0
+REJECT_NOT_NUMERIC: int = 1
+REJECT_NOT_POSITIVE: int = 2
+REJECT_EXCEEDS_BALANCE: int = 3
+REJECT_SAME_ACCOUNT: int = 4
+
+REJECTION_REASONS: dict[int, str] = {
+    REJECT_NOT_NUMERIC: "must be numeric",
+    REJECT_NOT_POSITIVE: "must be positive",
+    REJECT_EXCEEDS_BALANCE: "exceeds balance",
+    REJECT_SAME_ACCOUNT: "same account",
+}
+
+
+def check_deposit(amount: float) -> int:
+    """
+    Applies the BankAccount.deposit() rules to an amount.
+
+    Args:
+        amount (float): The deposit amount.
+
+    Returns:
+        int: ACCEPTED or REJECT_NOT_POSITIVE.
+    """
+    if amount <= 0:
+        return REJECT_NOT_POSITIVE
+
+    return ACCEPTED
+
+
+def check_withdrawal(balance: float, amount: float) -> int:
+    """
+    Applies the BankAccount.withdraw() rules to an amount.
+
+    Args:
+        balance (float): The current account balance.
+        amount (float): The withdrawal amount.
+
+    Returns:
+        int: ACCEPTED, REJECT_NOT_POSITIVE or REJECT_EXCEEDS_BALANCE.
+    """
+    if amount <= 0:
+        return REJECT_NOT_POSITIVE
+
+    if amount > balance:
+        return REJECT_EXCEEDS_BALANCE
+
+    return ACCEPTED
@@ -0,0 +1,326 @@
+"""
+transaction_service.py
+
+Asyncio front-end that applies deposits, withdrawals and service charges
+in micro-batches.
+
+Callers submit requests through a bounded queue, so producers wait when
+the service falls behind. A single worker drains whatever is queued,
+groups it by account and applies each account's requests in arrival
+order, using the transaction_rules codes instead of raising one
+ValueError per rejected request. Each caller's future resolves to a
+TransactionResult.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Iterable
+
+from bank_account.bank_account import BankAccount
+from bank_account.transaction_rules import (
+    ACCEPTED,
+    REJECT_NOT_NUMERIC,
+    REJECTION_REASONS,
+    check_deposit,
+    check_withdrawal,
+)
+
+OP_CHARGE: str = "charge"
+
+OPERATIONS: tuple[str, ...] = (BankAccount.OP_DEPOSIT, BankAccount.OP_WITHDRAW, OP_CHARGE)
+
+
+@dataclass(frozen=True)
+class TransactionResult:
+    """
+    Outcome of one submitted transaction.
+
+    Attributes:
+        account_number (int): The account the request targeted.
+        operation (str): "deposit", "withdraw" or "charge".
+        amount (float): The amount requested (the computed charge for "charge").
+        code (int): A transaction_rules result code.
+        balance (float): The account balance after the request was processed.
+    """
+
+    account_number: int
+    operation: str
+    amount: float
+    code: int
+    balance: float
+
+    @property
+    def accepted(self) -> bool:
+        """
+        Returns whether the transaction was applied.
+
+        Returns:
+            bool: True if the code is ACCEPTED.
+        """
+        return self.code == ACCEPTED
+
+    @property
+    def reason(self) -> str | None:
+        """
+        Returns why the transaction was rejected.
+
+        Returns:
+            str | None: The rejection reason, or None if accepted.
+        """
+        return REJECTION_REASONS.get(self.code)
+
+
+class TransactionService:
+    """
+    Applies queued transactions to a fixed set of accounts.
+
+    Attributes:
+        __accounts (dict[int, BankAccount]): Accounts keyed by account number.
+        __queue (asyncio.Queue): Pending requests.
+        __max_batch (int): Most requests applied per batch.
+        __worker (asyncio.Task | None): The running batch worker.
+    """
+
+    def __init__(
+        self,
+        accounts: Iterable[BankAccount],
+        max_queue: int = 10_000,
+        max_batch: int = 512,
+    ) -> None:
+        """
+        Creates a stopped service.
+
+        Args:
+            accounts (Iterable[BankAccount]): The accounts the service manages.
+            max_queue (int): Requests queued before submitters wait.
+            max_batch (int): Most requests applied per batch.
+
+        Raises:
+            ValueError: If max_queue or max_batch is not positive.
+        """
+        if max_queue <= 0:
+            raise ValueError(f"Queue size: {max_queue} must be positive.")
+        if max_batch <= 0:
+            raise ValueError(f"Batch size: {max_batch} must be positive.")
+
+        self.__accounts: dict[int, BankAccount] = {
+            account.account_number: account for account in accounts
+        }
+        self.__queue: asyncio.Queue = asyncio.Queue(max_queue)
+        self.__max_batch = max_batch
+        self.__worker: asyncio.Task | None = None
+
+    async def __aenter__(self) -> TransactionService:
+        """
+        Starts the service for use in an async with block.
+
+        Returns:
+            TransactionService: This service.
+        """
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """
+        Drains the queue and stops the service at the end of the block.
+
+        Args:
+            *exc_info (object): The exception details, if any.
+        """
+        await self.stop()
+
+    @property
+    def running(self) -> bool:
+        """
+        Returns whether the batch worker is running.
+
+        Returns:
+            bool: True between start() and stop().
+        """
+        return self.__worker is not None
+
+    async def start(self) -> None:
+        """
+        Starts the batch worker on the running event loop.
+        """
+        if self.__worker is None:
+            self.__worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Waits for every queued request to be processed, then stops the worker.
+        """
+        if self.__worker is None:
+            return
+
+        await self.__queue.join()
+        self.__worker.cancel()
+        with suppress(asyncio.CancelledError):
+            await self.__worker
+        self.__worker = None
+
+    # ---- Submitting ----
+    async def submit(self, account_number: int, operation: str, amount: float = 0.0) -> TransactionResult:
+        """
+        Queues one transaction and waits for its outcome.
+
+        Args:
+            account_number (int): The target account.
+            operation (str): "deposit", "withdraw" or "charge".
+            amount (float): The amount (ignored for "charge").
+
+        Returns:
+            TransactionResult: The outcome.
+
+        Raises:
+            RuntimeError: If the service is not running.
+            KeyError: If the account is not managed by the service.
+            ValueError: If the operation is unknown.
+        """
+        if self.__worker is None:
+            raise RuntimeError("Transaction service is not running.")
+        if operation not in OPERATIONS:
+            raise ValueError(f"Operation: {operation} must be one of {', '.join(OPERATIONS)}.")
+
+        account = self.__accounts[account_number]
+        future = asyncio.get_running_loop().create_future()
+        await self.__queue.put((account, operation, amount, future))
+        return await future
+
+    async def deposit(self, account_number: int, amount: float) -> TransactionResult:
+        """
+        Submits a deposit.
+
+        Args:
+            account_number (int): The target account.
+            amount (float): The deposit amount.
+
+        Returns:
+            TransactionResult: The outcome.
+        """
+        return await self.submit(account_number, BankAccount.OP_DEPOSIT, amount)
+
+    async def withdraw(self, account_number: int, amount: float) -> TransactionResult:
+        """
+        Submits a withdrawal.
+
+        Args:
+            account_number (int): The target account.
+            amount (float): The withdrawal amount.
+
+        Returns:
+            TransactionResult: The outcome.
+        """
+        return await self.submit(account_number, BankAccount.OP_WITHDRAW, amount)
+
+    async def charge(self, account_number: int) -> TransactionResult:
+        """
+        Submits a withdrawal of the account's current service charges.
+
+        Args:
+            account_number (int): The target account.
+
+        Returns:
+            TransactionResult: The outcome.
+        """
+        return await self.submit(account_number, OP_CHARGE)
+
+    # ---- Batch worker ----
+    async def _run(self) -> None:
+        """
+        Drains the queue in batches until cancelled.
+        """
+        queue = self.__queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.__max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                self._apply_batch(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    def _apply_batch(self, batch: list[tuple]) -> None:
+        """
+        Applies a batch of requests, grouped by account, and resolves their futures.
+
+        Requests whose caller has already given up (cancelled future) are skipped.
+
+        Args:
+            batch (list[tuple]): (account, operation, amount, future) requests.
+        """
+        by_account: dict[BankAccount, list[tuple]] = {}
+        for request in batch:
+            by_account.setdefault(request[0], []).append(request)
+
+        stripes = BankAccount._lock_stripes
+        for account, requests in by_account.items():
+            if stripes is None:
+                self._apply_account(account, requests)
+            else:
+                with stripes.lock_for(account.account_number):
+                    self._apply_account(account, requests)
+
+    @classmethod
+    def _apply_account(cls, account: BankAccount, requests: list[tuple]) -> None:
+        """
+        Applies one account's requests in arrival order.
+
+        An exception raised while applying a request (for example by a
+        balance listener) is passed to that request's caller; the other
+        requests and the worker carry on.
+
+        Args:
+            account (BankAccount): The account.
+            requests (list[tuple]): Its (account, operation, amount, future) requests.
+        """
+        for _, operation, amount, future in requests:
+            if future.cancelled():
+                continue
+
+            try:
+                result = cls._apply_request(account, operation, amount)
+            except Exception as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    @staticmethod
+    def _apply_request(account: BankAccount, operation: str, amount: float) -> TransactionResult:
+        """
+        Applies one request.
+
+        Args:
+            account (BankAccount): The account.
+            operation (str): "deposit", "withdraw" or "charge".
+            amount (float): The amount (ignored for "charge").
+
+        Returns:
+            TransactionResult: The outcome.
+        """
+        if operation == OP_CHARGE:
+            amount = account.get_service_charges()
+            operation_code = BankAccount.OP_WITHDRAW
+        else:
+            operation_code = operation
+
+        try:
+            amount = float(amount)
+        except (TypeError, ValueError):
+            code = REJECT_NOT_NUMERIC
+        else:
+            if operation_code == BankAccount.OP_DEPOSIT:
+                code = check_deposit(amount)
+            else:
+                code = check_withdrawal(account.balance, amount)
+
+        if code == ACCEPTED:
+            signed = amount if operation_code == BankAccount.OP_DEPOSIT else -amount
+            account._change_balance(signed, operation_code)
+
+        return TransactionResult(account.account_number, operation, amount, code, account.balance)
@@ -0,0 +1,166 @@
+"""
+transfers.py
+
+Atomic transfers between accounts.
+
+transfer() moves funds between any two BankAccount subclasses with one
+validation: the amount must be numeric and positive and must not exceed
+the source balance (the withdraw() rules). Both legs are applied
+together or not at all. When thread safety is enabled, the locks of both
+accounts are held for the whole transfer, acquired in stripe order so
+opposite transfers cannot deadlock.
+
+transfer_many() applies a payment file of transfers in order and reports
+each outcome as a transaction_rules code instead of raising.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Sequence
+
+from bank_account.bank_account import BankAccount
+from bank_account.money import to_minor
+from bank_account.transaction_rules import (
+    ACCEPTED,
+    REJECT_EXCEEDS_BALANCE,
+    REJECT_NOT_NUMERIC,
+    REJECT_NOT_POSITIVE,
+    REJECT_SAME_ACCOUNT,
+)
+
+
+def _apply_transfer(source: BankAccount, target: BankAccount, amount: float) -> int:
+    """
+    Moves a positive amount if the source balance covers it.
+
+    Both balances are changed before any listener is notified, so a
+    failing listener cannot leave one leg applied without the other. The
+    deposit leg is notified even if a withdraw listener raises.
+
+    Args:
+        source (BankAccount): The account debited.
+        target (BankAccount): The account credited.
+        amount (float): The transfer amount.
+
+    Returns:
+        int: ACCEPTED or REJECT_EXCEEDS_BALANCE.
+    """
+    minor_units = BankAccount.MINOR_UNITS
+    stored = amount if minor_units is None else to_minor(amount, minor_units)
+    if stored > source._balance:
+        return REJECT_EXCEEDS_BALANCE
+
+    # Same steps as BankAccount._change_balance(), with notification deferred.
+    source._balance -= stored
+    source._service_charge_cache = None
+    target._balance += stored
+    target._service_charge_cache = None
+
+    listeners = BankAccount._balance_listeners
+    try:
+        for listener in listeners:
+            listener(source, BankAccount.OP_WITHDRAW, -amount)
+    finally:
+        for listener in listeners:
+            listener(target, BankAccount.OP_DEPOSIT, amount)
+    return ACCEPTED
+
+
+def _transfer_code(source: BankAccount, target: BankAccount, amount: float) -> int:
+    """
+    Validates and applies one transfer.
+
+    Args:
+        source (BankAccount): The account debited.
+        target (BankAccount): The account credited.
+        amount (float): The transfer amount (already a float).
+
+    Returns:
+        int: A transaction_rules result code.
+    """
+    if amount <= 0:
+        return REJECT_NOT_POSITIVE
+    if source is target:
+        return REJECT_SAME_ACCOUNT
+
+    stripes = BankAccount._lock_stripes
+    if stripes is None:
+        return _apply_transfer(source, target, amount)
+
+    # Same stripe order as LockStripes.locked(), without the generator overhead.
+    first, second = source._account_number, target._account_number
+    if stripes.index_for(first) > stripes.index_for(second):
+        first, second = second, first
+    with stripes.lock_for(first), stripes.lock_for(second):
+        return _apply_transfer(source, target, amount)
+
+
+def transfer(source: BankAccount, target: BankAccount, amount: float) -> None:
+    """
+    Moves funds from one account to another atomically.
+
+    Args:
+        source (BankAccount): The account debited.
+        target (BankAccount): The account credited.
+        amount (float): The transfer amount.
+
+    Raises:
+        ValueError: If the amount is not numeric.
+        ValueError: If the amount is not positive.
+        ValueError: If both accounts are the same account.
+        ValueError: If the amount exceeds the source balance.
+    """
+    try:
+        amount = float(amount)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"Transfer amount: {amount} must be numeric.") from exc
+
+    code = _transfer_code(source, target, amount)
+    if code == REJECT_NOT_POSITIVE:
+        raise ValueError(f"Transfer amount: ${amount:,.2f} must be positive.")
+    if code == REJECT_SAME_ACCOUNT:
+        raise ValueError(f"Transfer account: {source.account_number} must differ from the source.")
+    if code == REJECT_EXCEEDS_BALANCE:
+        raise ValueError(f"Transfer amount: ${amount:,.2f} exceeds balance.")
+
+
+def transfer_many(
+    accounts: Sequence[BankAccount],
+    sources: Sequence[int],
+    targets: Sequence[int],
+    amounts: Sequence[float],
+) -> tuple[array, array]:
+    """
+    Applies a batch of transfers in order.
+
+    Each transfer is atomic on its own; a rejected transfer does not stop
+    the ones after it.
+
+    Args:
+        accounts (Sequence[BankAccount]): The accounts.
+        sources (Sequence[int]): Position of each transfer's source account.
+        targets (Sequence[int]): Position of each transfer's target account.
+        amounts (Sequence[float]): Amount of each transfer.
+
+    Returns:
+        tuple[array, array]: The acceptance mask (1 accepted, 0 rejected)
+            and the transaction_rules code of each transfer.
+
+    Raises:
+        ValueError: If the sequences differ in length.
+        IndexError: If a position is out of range.
+    """
+    if not len(sources) == len(targets) == len(amounts):
+        raise ValueError("Transfer columns: sources, targets and amounts must have the same length.")
+
+    codes = array("b", bytes(len(amounts)))
+    for position, (source, target, amount) in enumerate(zip(sources, targets, amounts)):
+        try:
+            amount = float(amount)
+        except (TypeError, ValueError):
+            codes[position] = REJECT_NOT_NUMERIC
+            continue
+        codes[position] = _transfer_code(accounts[source], accounts[target], amount)
+
+    return array("b", [code == ACCEPTED for code in codes]), codes
@@ -0,0 +1,133 @@
+"""
+waiver_scheduler.py
+
+Keeps InvestmentAccount.TEN_YEARS_AGO current in long-running processes.
+
+InvestmentAccount.TEN_YEARS_AGO is computed once at import. A
+WaiverScheduler holds the investment accounts whose management fee is not
+yet waived in a heap ordered by the date the waiver starts. Each daily
+tick moves the threshold forward and pops only the accounts crossing it,
+in O(k log n) for k crossings instead of a scan of every account.
+"""
+
+from __future__ import annotations
+
+import heapq
+from datetime import date, timedelta
+from itertools import count
+from typing import Iterable
+
+from bank_account.bank_account import BankAccount
+from bank_account.investment_account import InvestmentAccount
+
+
+class WaiverScheduler:
+    """
+    Schedules investment accounts by the day their management fee is waived.
+
+    Attributes:
+        __today (date): The date of the last tick.
+        __heap (list): (waiver date ordinal, sequence, account) entries.
+        __sequence (count): Tie-breaker for accounts waived on the same day.
+    """
+
+    def __init__(self, accounts: Iterable[BankAccount] = (), today: date | None = None) -> None:
+        """
+        Initializes the scheduler and applies the threshold for today.
+
+        Args:
+            accounts (Iterable[BankAccount]): Accounts to schedule; accounts
+                other than InvestmentAccount are ignored.
+            today (date | None): The current date. Defaults to date.today().
+        """
+        self.__today = today or date.today()
+        self.__heap: list[tuple[int, int, InvestmentAccount]] = []
+        self.__sequence = count()
+
+        InvestmentAccount.TEN_YEARS_AGO = InvestmentAccount.waiver_threshold(self.__today)
+        for account in accounts:
+            self.add(account)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of accounts still waiting for their waiver.
+
+        Returns:
+            int: The number of scheduled accounts.
+        """
+        return len(self.__heap)
+
+    @property
+    def today(self) -> date:
+        """
+        Returns the date of the last tick.
+
+        Returns:
+            date: The scheduler's current date.
+        """
+        return self.__today
+
+    @property
+    def next_waiver_date(self) -> date | None:
+        """
+        Returns the next day on which an account's fee becomes waived.
+
+        Returns:
+            date | None: The date, or None if no accounts are pending.
+        """
+        if not self.__heap:
+            return None
+        return date.fromordinal(self.__heap[0][0])
+
+    @staticmethod
+    def waiver_date(account: InvestmentAccount) -> date:
+        """
+        Returns the first day on which an account's management fee is waived.
+
+        Args:
+            account (InvestmentAccount): The account.
+
+        Returns:
+            date: The waiver date.
+        """
+        created = account.date_created
+        lag = created - InvestmentAccount.waiver_threshold(created)
+        return created + timedelta(days=lag.days)
+
+    def add(self, account: BankAccount) -> None:
+        """
+        Schedules an account, unless its fee is already waived.
+
+        Args:
+            account (BankAccount): The account; non-investment accounts are ignored.
+        """
+        if not isinstance(account, InvestmentAccount):
+            return
+
+        waiver_ordinal = self.waiver_date(account).toordinal()
+        if waiver_ordinal > self.__today.toordinal():
+            heapq.heappush(self.__heap, (waiver_ordinal, next(self.__sequence), account))
+
+    def tick(self, today: date | None = None) -> list[InvestmentAccount]:
+        """
+        Advances to a new day and updates InvestmentAccount.TEN_YEARS_AGO.
+
+        Args:
+            today (date | None): The new current date. Defaults to date.today().
+
+        Returns:
+            list[InvestmentAccount]: Accounts whose fee became waived since
+                the last tick and whose get_service_charges() result
+                therefore changed (accounts with a zero fee are omitted).
+        """
+        self.__today = today or date.today()
+        InvestmentAccount.TEN_YEARS_AGO = InvestmentAccount.waiver_threshold(self.__today)
+
+        changed: list[InvestmentAccount] = []
+        today_ordinal = self.__today.toordinal()
+        while self.__heap and self.__heap[0][0] <= today_ordinal:
+            account = heapq.heappop(self.__heap)[2]
+            if account.management_fee != 0:
+                changed.append(account)
+
+        return changed
@@ -0,0 +1,7 @@
+"""
+benchmarks package.
+
+Performance benchmarks for the bank_account package. Run a benchmark
+from the repository root with, for example:
+python -m benchmarks.bench_memory
+"""
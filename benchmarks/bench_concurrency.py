@@ -0,0 +1,94 @@
+"""
+bench_concurrency.py
+
+Stress test for the opt-in thread-safe balance changes.
+
+Several threads deposit into and withdraw from a shared set of accounts.
+The benchmark reports operations per second for each thread count and
+checks that every final balance equals its opening balance plus the
+accepted changes, and that no account was overdrawn.
+
+Usage:
+    python -m benchmarks.bench_concurrency [accounts] [ops_per_thread]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import threading
+from datetime import date
+from time import perf_counter
+
+from bank_account import SavingsAccount
+from bank_account.concurrency import disable_thread_safety, enable_thread_safety
+
+
+def run(thread_count: int, account_count: int, ops_per_thread: int) -> tuple[float, bool]:
+    """
+    Runs one contention round.
+
+    Args:
+        thread_count (int): Number of worker threads.
+        account_count (int): Number of shared accounts.
+        ops_per_thread (int): Operations performed by each thread.
+
+    Returns:
+        tuple[float, bool]: Operations per second, and whether every
+            final balance was correct and non-negative.
+    """
+    accounts = [SavingsAccount(n, n, 100.0, date.today(), 50.0) for n in range(account_count)]
+    accepted = [[0.0] * account_count for _ in range(thread_count)]
+
+    def worker(index: int) -> None:
+        rng = random.Random(index)
+        totals = accepted[index]
+        for _ in range(ops_per_thread):
+            slot = rng.randrange(account_count)
+            amount = float(rng.randint(1, 20))
+            try:
+                if rng.random() < 0.5:
+                    accounts[slot].deposit(amount)
+                    totals[slot] += amount
+                else:
+                    accounts[slot].withdraw(amount)
+                    totals[slot] -= amount
+            except ValueError:
+                pass
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(thread_count)]
+    start = perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = perf_counter() - start
+
+    consistent = all(
+        account.balance >= 0.0
+        and account.balance == 100.0 + sum(totals[slot] for totals in accepted)
+        for slot, account in enumerate(accounts)
+    )
+    return thread_count * ops_per_thread / elapsed, consistent
+
+
+def main(account_count: int = 64, ops_per_thread: int = 50_000) -> None:
+    """
+    Prints throughput and consistency for 1, 2, 4 and 8 threads.
+
+    Args:
+        account_count (int): Number of shared accounts.
+        ops_per_thread (int): Operations performed by each thread.
+    """
+    enable_thread_safety()
+    try:
+        print(f"{'threads':>8} {'ops/sec':>14} {'balances':>10}")
+        for thread_count in (1, 2, 4, 8):
+            rate, consistent = run(thread_count, account_count, ops_per_thread)
+            print(f"{thread_count:>8} {rate:>14,.0f} {'ok' if consistent else 'MISMATCH':>10}")
+    finally:
+        disable_thread_safety()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
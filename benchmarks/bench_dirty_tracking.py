@@ -0,0 +1,62 @@
+"""
+bench_dirty_tracking.py
+
+Compares a full statement and service charge pass with an incremental
+pass over the accounts changed since the last checkpoint.
+
+Usage:
+    python -m benchmarks.bench_dirty_tracking [accounts] [active percent]
+"""
+
+from __future__ import annotations
+
+import io
+import random
+import sys
+from time import perf_counter
+
+from bank_account.dirty_tracking import ChangeTracker
+from bank_account.statements import render_statements
+from benchmarks.common import make_accounts
+
+
+def _month_end(accounts: list) -> float:
+    start = perf_counter()
+    for account in accounts:
+        account.get_service_charges()
+    render_statements(accounts, io.StringIO())
+    return perf_counter() - start
+
+
+def main(count: int = 500_000, active_percent: float = 1.0) -> None:
+    """
+    Prints the elapsed time of both passes.
+
+    Args:
+        count (int): Number of accounts.
+        active_percent (float): Share of accounts with activity this month.
+    """
+    accounts = make_accounts(count)
+    active = random.Random(3).sample(accounts, int(count * active_percent / 100))
+
+    with ChangeTracker() as tracker:
+        tracker.checkpoint("month-end")
+        start = perf_counter()
+        for account in active:
+            account.deposit(10.0)
+        activity = perf_counter() - start
+
+        full = _month_end(accounts)
+        start = perf_counter()
+        changed = tracker.changed_since("month-end")
+        lookup = perf_counter() - start
+        incremental = _month_end(changed)
+
+    print(f"accounts: {count:,}, changed: {len(changed):,}")
+    print(f"deposits with tracking:  {activity:8.3f} s")
+    print(f"full pass:               {full:8.3f} s")
+    print(f"changed_since + pass:    {lookup + incremental:8.3f} s ({full / (lookup + incremental):,.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main(*(float(arg) if index else int(arg) for index, arg in enumerate(sys.argv[1:3])))
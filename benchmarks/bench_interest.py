@@ -0,0 +1,70 @@
+"""
+bench_interest.py
+
+Compares InterestAccrual with a per-object script that calls
+update_balance() on every account for every day.
+
+Usage:
+    python -m benchmarks.bench_interest [accounts] [days]
+"""
+
+from __future__ import annotations
+
+import sys
+from datetime import date, timedelta
+from time import perf_counter
+
+from bank_account.account_book import INVESTMENT, SAVINGS, AccountBook
+from bank_account.interest import InterestAccrual, InterestPolicy
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+from benchmarks.common import make_accounts
+
+_POLICY = InterestPolicy({SAVINGS: 0.02, INVESTMENT: [(0.0, 0.01), (2_500.0, 0.03)]})
+
+
+def _daily_script(accounts: list, days: int) -> None:
+    rates = {SavingsAccount: SAVINGS, InvestmentAccount: INVESTMENT}
+    for _ in range(days):
+        for account in accounts:
+            code = rates.get(type(account))
+            balance = account.balance
+            if code is not None and balance > 0.0:
+                account.update_balance(balance * _POLICY.rate_for(code, balance) / 365)
+
+
+def main(count: int = 100_000, days: int = 90) -> None:
+    """
+    Prints the elapsed time of each approach.
+
+    Args:
+        count (int): Number of accounts.
+        days (int): Days to catch up.
+    """
+    start_day = date(2025, 1, 1)
+    end_day = start_day + timedelta(days=days)
+
+    accounts = make_accounts(count)
+    start = perf_counter()
+    _daily_script(accounts, days)
+    script = perf_counter() - start
+
+    accounts = make_accounts(count)
+    start = perf_counter()
+    with InterestAccrual(accounts, _POLICY, as_of=start_day) as accrual:
+        accrual.advance(end_day)
+    objects = perf_counter() - start
+
+    book = AccountBook.from_accounts(make_accounts(count))
+    start = perf_counter()
+    InterestAccrual(book, _POLICY, as_of=start_day).advance(end_day)
+    batched = perf_counter() - start
+
+    print(f"accounts: {count:,} x days: {days}")
+    print(f"daily update_balance():  {script:8.3f} s")
+    print(f"InterestAccrual objects: {objects:8.3f} s ({script / objects:.1f}x faster)")
+    print(f"InterestAccrual book:    {batched:8.3f} s ({script / batched:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
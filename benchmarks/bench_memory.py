@@ -0,0 +1,126 @@
+"""
+bench_memory.py
+
+Measures the memory used per account by the slotted account classes and
+compares it with the previous __dict__-based layout.
+
+The dict-based layout is reproduced by copying each account's fields into
+a plain object with an instance __dict__, which is exactly how the
+attributes were stored before BankAccount and its subclasses used
+__slots__.
+
+Usage:
+    python -m benchmarks.bench_memory [count]
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+from typing import Callable
+
+from bank_account import BankAccount
+from benchmarks.common import make_accounts
+
+
+class _DictLayout:
+    """
+    A plain object that stores account fields in an instance __dict__.
+    """
+
+
+def _slot_names(account: BankAccount) -> list[str]:
+    """
+    Returns the (mangled) slot names of an account's class hierarchy.
+
+    Args:
+        account (BankAccount): The account to inspect.
+
+    Returns:
+        list[str]: Attribute names as they appear on the instance.
+    """
+    names = []
+    for klass in type(account).__mro__:
+        for name in klass.__dict__.get("__slots__", ()):
+            if name.startswith("__") and not name.endswith("__"):
+                name = f"_{klass.__name__.lstrip('_')}{name}"
+            names.append(name)
+    return names
+
+
+def _dict_layout_copy(account: BankAccount) -> _DictLayout:
+    """
+    Copies an account's fields into a dict-based object.
+
+    Args:
+        account (BankAccount): The account to copy.
+
+    Returns:
+        _DictLayout: An object holding the same attributes in its __dict__.
+    """
+    copy = _DictLayout()
+    for name in _slot_names(account):
+        setattr(copy, name, getattr(account, name))
+    return copy
+
+
+def _slotted_copy(account: BankAccount) -> BankAccount:
+    """
+    Copies an account's fields into a new instance of its slotted class.
+
+    Args:
+        account (BankAccount): The account to copy.
+
+    Returns:
+        BankAccount: An object holding the same attributes in its slots.
+    """
+    copy = type(account).__new__(type(account))
+    for name in _slot_names(account):
+        setattr(copy, name, getattr(account, name))
+    return copy
+
+
+def _bytes_per_object(build: Callable[[], list], count: int) -> float:
+    """
+    Measures the traced allocation per object for a builder.
+
+    Args:
+        build (Callable[[], list]): Builds and returns the objects.
+        count (int): Number of objects built.
+
+    Returns:
+        float: Bytes allocated per object.
+    """
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current / count
+
+
+def main(count: int = 100_000) -> None:
+    """
+    Prints bytes per account for the dict-based and slotted layouts.
+
+    Args:
+        count (int): Number of accounts to measure.
+    """
+    template = make_accounts(count)
+
+    # Share the field values between both layouts so only the per-object
+    # container cost is measured.
+    before = _bytes_per_object(lambda: [_dict_layout_copy(a) for a in template], count)
+    after = _bytes_per_object(lambda: [_slotted_copy(a) for a in template], count)
+
+    print(f"accounts:               {count:,}")
+    print(f"dict layout (before):   {before:,.1f} bytes/account")
+    print(f"slotted layout (after): {after:,.1f} bytes/account")
+    print(f"saved:                  {before - after:,.1f} bytes/account "
+          f"({(before - after) / before:.0%})")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
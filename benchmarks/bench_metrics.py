@@ -0,0 +1,55 @@
+"""
+bench_metrics.py
+
+Measures the cost of the metrics layer on account operations.
+
+Each operation is timed before metrics were ever enabled, with metrics
+enabled, and again after disabling them.
+
+Usage:
+    python -m benchmarks.bench_metrics [accounts]
+"""
+
+from __future__ import annotations
+
+import sys
+
+from bank_account.metrics import disable_metrics, enable_metrics, metrics
+from benchmarks.common import best_of, make_accounts
+
+
+def _time_operations(count: int) -> dict[str, float]:
+    accounts = make_accounts(count)
+    return {
+        "deposit": best_of(lambda: [a.deposit(1.0) for a in accounts]) / count * 1e9,
+        "withdraw": best_of(lambda: [a.withdraw(0.5) for a in accounts if a.balance >= 0.5]) / count * 1e9,
+        "update_balance": best_of(lambda: [a.update_balance(-0.25) for a in accounts]) / count * 1e9,
+        "get_service_charges": best_of(lambda: [a.get_service_charges() for a in accounts]) / count * 1e9,
+    }
+
+
+def main(count: int = 200_000) -> None:
+    """
+    Prints nanoseconds per operation in each mode.
+
+    Args:
+        count (int): Number of accounts.
+    """
+    baseline = _time_operations(count)
+    enable_metrics()
+    enabled = _time_operations(count)
+    disable_metrics()
+    disabled = _time_operations(count)
+    metrics.reset()
+
+    print(f"accounts: {count:,} (ns/op)")
+    print(f"{'operation':<22}{'never enabled':>15}{'enabled':>12}{'disabled':>12}{'overhead off':>14}")
+    for name, reference in baseline.items():
+        print(
+            f"{name:<22}{reference:>15,.0f}{enabled[name]:>12,.0f}{disabled[name]:>12,.0f}"
+            f"{disabled[name] / reference - 1.0:>14.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,135 @@
+"""
+bench_money.py
+
+Compares the float, fixed-point and Decimal money paths.
+
+Two measurements are reported:
+
+* account objects: a month of activity (deposit, withdrawal, service
+  charge withdrawal and __str__) through the real account classes in
+  float mode and in fixed-point mode;
+* arithmetic kernel: the same activity as a bare loop over float,
+  integer-cent and Decimal balances, which isolates the cost of the number
+  representation itself.
+
+Usage:
+    python -m benchmarks.bench_money [accounts]
+"""
+
+from __future__ import annotations
+
+import sys
+from decimal import Decimal
+from time import perf_counter
+from typing import Any, Callable
+
+from bank_account import BankAccount
+from bank_account.money import format_minor
+from benchmarks.common import make_accounts
+
+
+def run_accounts(count: int) -> float:
+    """
+    Times a month of activity on real accounts in the current money mode.
+
+    Args:
+        count (int): Number of accounts.
+
+    Returns:
+        float: Elapsed seconds.
+    """
+    accounts = make_accounts(count)
+    start = perf_counter()
+    for account in accounts:
+        account.deposit(12.34)
+        try:
+            account.withdraw(5.67)
+            account.withdraw(account.get_service_charges())
+        except ValueError:
+            pass
+        str(account)
+    return perf_counter() - start
+
+
+def run_kernel(
+    balances: list,
+    convert: Callable[[str], Any],
+    settle: Callable[[Any, Any], Any],
+    fmt: Callable[[Any], str],
+) -> float:
+    """
+    Times the month of activity on bare balances of one number type.
+
+    Args:
+        balances (list): Opening balances, already converted.
+        convert (Callable[[str], Any]): Converts a decimal literal.
+        settle (Callable[[Any, Any], Any]): Computes the overdraft fee of a
+            gap at a rate, rounded to the representation's precision.
+        fmt (Callable[[Any], str]): Formats a balance for a statement.
+
+    Returns:
+        float: Elapsed seconds.
+    """
+    deposit, withdrawal = convert("12.34"), convert("5.67")
+    base, limit, rate = convert("0.50"), convert("-100"), convert("0.05")
+
+    start = perf_counter()
+    for index, balance in enumerate(balances):
+        balance += deposit
+        if withdrawal <= balance:
+            balance -= withdrawal
+            charge = base
+            if balance < limit:
+                charge = base + settle(limit - balance, rate)
+            if charge <= balance:
+                balance -= charge
+        balances[index] = balance
+        fmt(balance)
+    return perf_counter() - start
+
+
+def main(count: int = 200_000) -> None:
+    """
+    Prints the elapsed time of each money path.
+
+    Args:
+        count (int): Number of accounts.
+    """
+    float_seconds = run_accounts(count)
+    BankAccount.use_fixed_point(100)
+    try:
+        fixed_seconds = run_accounts(count)
+    finally:
+        BankAccount.use_floating_point()
+
+    opening = [account.balance for account in make_accounts(count)]
+    cent = Decimal("0.01")
+    kernel_float = run_kernel(
+        list(opening), float, lambda gap, rate: gap * rate, lambda b: f"${b:,.2f}"
+    )
+    kernel_cents = run_kernel(
+        [round(b * 100) for b in opening],
+        lambda text: round(float(text) * 100),
+        # Gap and rate are both scaled by 100; divide once to get cents.
+        lambda gap, rate: round(gap * rate / 100),
+        lambda b: format_minor(b, 100),
+    )
+    kernel_decimal = run_kernel(
+        [Decimal(repr(b)) for b in opening],
+        Decimal,
+        lambda gap, rate: (gap * rate).quantize(cent),
+        lambda b: f"${b:,.2f}",
+    )
+
+    print(f"accounts: {count:,}")
+    print("account objects")
+    print(f"  float:        {float_seconds:8.3f} s")
+    print(f"  fixed-point:  {fixed_seconds:8.3f} s ({fixed_seconds / float_seconds:.2f}x float)")
+    print("arithmetic kernel")
+    print(f"  float:        {kernel_float:8.3f} s")
+    print(f"  integer cents:{kernel_cents:8.3f} s ({kernel_cents / kernel_float:.2f}x float)")
+    print(f"  Decimal:      {kernel_decimal:8.3f} s ({kernel_decimal / kernel_float:.2f}x float)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,51 @@
+"""
+bench_sharding.py
+
+Scaling benchmark for the multiprocess sharded service charge run.
+
+Posts service charges for the same AccountBook with 1 to N worker
+processes and reports the wall time and speedup over one worker.
+
+Usage:
+    python -m benchmarks.bench_sharding [accounts] [max_workers]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from time import perf_counter
+
+from bank_account import AccountBook
+from bank_account.sharding import run_sharded_service_charges
+from benchmarks.common import make_accounts
+
+
+def main(account_count: int = 1_000_000, max_workers: int | None = None) -> None:
+    """
+    Prints wall time and speedup for each worker count.
+
+    Args:
+        account_count (int): Number of accounts in the book.
+        max_workers (int | None): Largest worker count. Defaults to the
+            number of CPUs.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    template = AccountBook.from_accounts(make_accounts(account_count)).to_buffers()
+
+    print(f"accounts: {account_count:,}")
+    print(f"{'workers':>8} {'seconds':>10} {'speedup':>8}")
+    baseline = None
+    workers = 1
+    while workers <= max_workers:
+        book = AccountBook.from_buffers(template)
+        start = perf_counter()
+        run_sharded_service_charges(book, workers=workers)
+        elapsed = perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>10.3f} {baseline / elapsed:>7.2f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,67 @@
+"""
+bench_simulation.py
+
+Compares simulate() with repeating the A02_main.py step-12 loop on
+account objects, for the same months and scenarios (no random flows).
+
+Usage:
+    python -m benchmarks.bench_simulation [accounts] [months]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+from bank_account.account_book import AccountBook
+from bank_account.simulation import Scenario, simulate
+from benchmarks.common import make_accounts
+
+_SCENARIOS = (
+    Scenario("base"),
+    Scenario("rate 10%", overdraft_rate=0.10),
+    Scenario("minimum 100", minimum_balance=100.0),
+    Scenario("fee 5", management_fee=5.0),
+)
+
+
+def _object_loop(portfolios: list[list], months: int) -> None:
+    for accounts in portfolios:
+        for _ in range(months):
+            for account in accounts:
+                try:
+                    account.withdraw(account.get_service_charges())
+                except ValueError:
+                    pass
+
+
+def main(count: int = 20_000, months: int = 12) -> None:
+    """
+    Prints the elapsed time of both approaches.
+
+    Args:
+        count (int): Number of accounts.
+        months (int): Months per scenario.
+    """
+    book = AccountBook.from_accounts(make_accounts(count))
+
+    portfolios = [make_accounts(count) for _ in _SCENARIOS]
+    start = perf_counter()
+    _object_loop(portfolios, months)
+    loop = perf_counter() - start
+
+    start = perf_counter()
+    results = simulate(book, _SCENARIOS, months)
+    batched = perf_counter() - start
+
+    print(f"accounts: {count:,} x months: {months} x scenarios: {len(_SCENARIOS)}")
+    print(f"object loop:   {loop:8.3f} s (base settings, once per scenario)")
+    print(f"simulate():    {batched:8.3f} s ({loop / batched:.2f}x faster)")
+    for result in results:
+        charges = result.summary()["charges"]
+        print(f"  {result.scenario.name:<12} total ${result.total_charged:>14,.2f} "
+              f"p50 ${charges['p50']:,.2f} p95 ${charges['p95']:,.2f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
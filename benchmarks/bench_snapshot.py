@@ -0,0 +1,61 @@
+"""
+bench_snapshot.py
+
+Compares a cold start from CSV with opening a memory-mapped snapshot.
+
+Both paths are timed up to the first answered service charge query.
+
+Usage:
+    python -m benchmarks.bench_snapshot [accounts]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+from bank_account.loader import iter_accounts
+from bank_account.snapshot import PortfolioSnapshot, write_snapshot
+from bank_account.statements import write_statements
+from benchmarks.common import make_accounts
+
+
+def main(count: int = 200_000) -> None:
+    """
+    Prints the cold start time of both approaches.
+
+    Args:
+        count (int): Number of accounts.
+    """
+    accounts = make_accounts(count)
+    target = accounts[count // 2].account_number
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "accounts.csv")
+        snapshot_path = os.path.join(directory, "accounts.snap")
+        write_statements(csv_path, accounts, layout="csv")
+        write_snapshot(snapshot_path, accounts)
+
+        start = perf_counter()
+        loaded = {account.account_number: account for account in iter_accounts(csv_path)}
+        csv_charge = loaded[target].get_service_charges()
+        csv_seconds = perf_counter() - start
+
+        start = perf_counter()
+        with PortfolioSnapshot(snapshot_path) as snapshot:
+            snapshot_charge = snapshot.get_service_charges(target)
+            snapshot_seconds = perf_counter() - start
+
+        snapshot_size = os.path.getsize(snapshot_path)
+
+    print(f"accounts: {count:,} (snapshot {snapshot_size / 2**20:.1f} MiB)")
+    print(f"CSV rebuild:     {csv_seconds * 1e3:10.2f} ms")
+    print(f"mmap snapshot:   {snapshot_seconds * 1e3:10.2f} ms "
+          f"({csv_seconds / snapshot_seconds:,.0f}x faster)")
+    print(f"same charge:     {csv_charge == snapshot_charge}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,89 @@
+"""
+bench_sqlite_store.py
+
+Throughput of the SQLite account store.
+
+Times saving and loading a portfolio (as account objects and as an
+AccountBook), then committing balance changes on 10% of the accounts,
+against per-call single-row updates.
+
+Usage:
+    python -m benchmarks.bench_sqlite_store [accounts]
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import sys
+import tempfile
+from time import perf_counter
+
+from bank_account.account_book import AccountBook
+from bank_account.sqlite_store import SqliteAccountStore
+from benchmarks.common import make_accounts
+
+
+def main(count: int = 1_000_000) -> None:
+    """
+    Prints rows per second for each step.
+
+    Args:
+        count (int): Number of accounts.
+    """
+    accounts = make_accounts(count)
+    book = AccountBook.from_accounts(accounts)
+    changed = accounts[::10]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "accounts.db")
+        timings: list[tuple[str, int, float]] = []
+
+        with SqliteAccountStore(path) as store:
+            start = perf_counter()
+            store.save(accounts)
+            timings.append(("save objects", count, perf_counter() - start))
+
+            start = perf_counter()
+            store.save(book)
+            timings.append(("save book", count, perf_counter() - start))
+
+            start = perf_counter()
+            for account in changed:
+                account.deposit(1.0)
+            store.commit()
+            timings.append(("deposit + batched commit", len(changed), perf_counter() - start))
+
+        connection = sqlite3.connect(path)
+        start = perf_counter()
+        for account in changed:
+            account.deposit(1.0)
+            connection.execute(
+                "UPDATE accounts SET balance = ? WHERE account_number = ?",
+                (account.balance, account.account_number),
+            )
+            connection.commit()
+            if perf_counter() - start > 5.0:
+                timings.append(("deposit + per-call commit", changed.index(account) + 1,
+                                perf_counter() - start))
+                break
+        else:
+            timings.append(("deposit + per-call commit", len(changed), perf_counter() - start))
+        connection.close()
+
+        with SqliteAccountStore(path) as store:
+            start = perf_counter()
+            store.load()
+            timings.append(("load objects", count, perf_counter() - start))
+
+            start = perf_counter()
+            store.load_book()
+            timings.append(("load book", count, perf_counter() - start))
+
+    print(f"accounts: {count:,}")
+    for name, rows, seconds in timings:
+        print(f"{name:<28} {rows:>10,} rows {seconds:8.3f} s {rows / seconds:>12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,57 @@
+"""
+bench_statements.py
+
+Compares the bulk statement renderer with a naive print() loop.
+
+Both write the same text to a temporary file; the output is checked to
+be byte-identical.
+
+Usage:
+    python -m benchmarks.bench_statements [accounts]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+from bank_account.statements import write_statements
+from benchmarks.common import make_accounts
+
+
+def main(count: int = 200_000) -> None:
+    """
+    Prints the elapsed time of both approaches.
+
+    Args:
+        count (int): Number of accounts.
+    """
+    accounts = make_accounts(count)
+
+    with tempfile.TemporaryDirectory() as directory:
+        naive_path = os.path.join(directory, "naive.txt")
+        bulk_path = os.path.join(directory, "bulk.txt")
+
+        start = perf_counter()
+        with open(naive_path, "w", encoding="utf-8", newline="") as stream:
+            for account in accounts:
+                print(account, file=stream)
+        naive = perf_counter() - start
+
+        start = perf_counter()
+        write_statements(bulk_path, accounts)
+        bulk = perf_counter() - start
+
+        with open(naive_path, "rb") as first, open(bulk_path, "rb") as second:
+            identical = first.read() == second.read()
+
+    print(f"accounts: {count:,}")
+    print(f"print loop:      {naive:8.3f} s")
+    print(f"bulk renderer:   {bulk:8.3f} s ({naive / bulk:.2f}x faster)")
+    print(f"byte-identical:  {identical}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,93 @@
+"""
+bench_transaction_service.py
+
+Load generator for the asyncio TransactionService.
+
+A number of concurrent clients each submit a stream of random deposits,
+withdrawals and charges. The run reports request latency percentiles and
+overall throughput.
+
+Usage:
+    python -m benchmarks.bench_transaction_service [requests] [clients]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import sys
+from time import perf_counter
+
+from bank_account.transaction_service import TransactionService
+from benchmarks.common import make_accounts
+
+
+async def _client(
+    service: TransactionService,
+    numbers: list[int],
+    requests: int,
+    seed: int,
+    latencies: list[float],
+) -> None:
+    """
+    Submits one client's requests sequentially, recording each latency.
+
+    Args:
+        service (TransactionService): The running service.
+        numbers (list[int]): Account numbers to pick from.
+        requests (int): Number of requests to submit.
+        seed (int): Random seed.
+        latencies (list[float]): Where latencies (seconds) are appended.
+    """
+    rng = random.Random(seed)
+    for _ in range(requests):
+        number = rng.choice(numbers)
+        kind = rng.random()
+        start = perf_counter()
+        if kind < 0.45:
+            await service.deposit(number, round(rng.uniform(1.0, 100.0), 2))
+        elif kind < 0.95:
+            await service.withdraw(number, round(rng.uniform(1.0, 100.0), 2))
+        else:
+            await service.charge(number)
+        latencies.append(perf_counter() - start)
+
+
+async def _run(total: int, clients: int) -> tuple[list[float], float]:
+    accounts = make_accounts(10_000)
+    numbers = [account.account_number for account in accounts]
+    latencies: list[float] = []
+
+    async with TransactionService(accounts) as service:
+        start = perf_counter()
+        await asyncio.gather(*(
+            _client(service, numbers, total // clients, seed, latencies)
+            for seed in range(clients)
+        ))
+        elapsed = perf_counter() - start
+
+    return latencies, elapsed
+
+
+def main(total: int = 200_000, clients: int = 500) -> None:
+    """
+    Prints latency percentiles and throughput.
+
+    Args:
+        total (int): Total number of requests.
+        clients (int): Number of concurrent clients.
+    """
+    latencies, elapsed = asyncio.run(_run(total, clients))
+    latencies.sort()
+
+    def percentile(fraction: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1e3
+
+    print(f"requests: {len(latencies):,} from {clients:,} clients")
+    print(f"throughput:  {len(latencies) / elapsed:12,.0f} requests/s")
+    print(f"p50 latency: {percentile(0.50):12.3f} ms")
+    print(f"p99 latency: {percentile(0.99):12.3f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
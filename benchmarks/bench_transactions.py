@@ -0,0 +1,69 @@
+"""
+bench_transactions.py
+
+Compares apply_transactions() with calling deposit()/withdraw() and
+catching ValueError for every rejected transaction.
+
+About half of the generated withdrawals exceed the balance, so the
+exception path is exercised heavily.
+
+Usage:
+    python -m benchmarks.bench_transactions [transactions]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from time import perf_counter
+
+from bank_account.account_book import AccountBook
+from bank_account.bulk_transactions import apply_transactions
+from benchmarks.common import make_accounts
+
+
+def main(count: int = 500_000) -> None:
+    """
+    Prints the elapsed time of each approach.
+
+    Args:
+        count (int): Number of transactions.
+    """
+    rng = random.Random(11)
+    accounts = make_accounts(10_000)
+    indices = [rng.randrange(len(accounts)) for _ in range(count)]
+    amounts = [round(rng.uniform(-3000.0, 1000.0), 2) for _ in range(count)]
+
+    loop_accounts = make_accounts(10_000)
+    start = perf_counter()
+    accepted = 0
+    for index, amount in zip(indices, amounts):
+        account = loop_accounts[index]
+        try:
+            if amount > 0:
+                account.deposit(amount)
+            else:
+                account.withdraw(-amount)
+            accepted += 1
+        except ValueError:
+            pass
+    loop = perf_counter() - start
+
+    start = perf_counter()
+    mask, _ = apply_transactions(accounts, indices, amounts)
+    objects = perf_counter() - start
+
+    book = AccountBook.from_accounts(make_accounts(10_000))
+    start = perf_counter()
+    apply_transactions(book, indices, amounts)
+    columns = perf_counter() - start
+
+    print(f"transactions: {count:,} ({count - accepted:,} rejected)")
+    print(f"try/except loop:             {loop:8.3f} s")
+    print(f"apply_transactions(objects): {objects:8.3f} s ({loop / objects:.2f}x faster)")
+    print(f"apply_transactions(book):    {columns:8.3f} s ({loop / columns:.2f}x faster)")
+    print(f"same outcome:                {sum(mask) == accepted}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,73 @@
+"""
+bench_transfers.py
+
+Transfers per second for single and batched submission, with and
+without thread safety, against chaining withdraw() and deposit().
+
+Usage:
+    python -m benchmarks.bench_transfers [transfers]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from time import perf_counter
+
+from bank_account.concurrency import disable_thread_safety, enable_thread_safety
+from bank_account.transfers import transfer, transfer_many
+from benchmarks.common import make_accounts
+
+
+def _chained(accounts: list, sources: list, targets: list, amounts: list) -> None:
+    for source, target, amount in zip(sources, targets, amounts):
+        try:
+            accounts[source].withdraw(amount)
+        except ValueError:
+            continue
+        accounts[target].deposit(amount)
+
+
+def _single(accounts: list, sources: list, targets: list, amounts: list) -> None:
+    for source, target, amount in zip(sources, targets, amounts):
+        try:
+            transfer(accounts[source], accounts[target], amount)
+        except ValueError:
+            pass
+
+
+def main(count: int = 200_000) -> None:
+    """
+    Prints transfers per second for each submission mode.
+
+    Args:
+        count (int): Number of transfers.
+    """
+    rng = random.Random(17)
+    size = 10_000
+    sources = [rng.randrange(size) for _ in range(count)]
+    targets = [(source + rng.randrange(1, size)) % size for source in sources]
+    amounts = [round(rng.uniform(1.0, 2000.0), 2) for _ in range(count)]
+
+    cases = (
+        ("withdraw + deposit", _chained),
+        ("transfer()", _single),
+        ("transfer_many()", lambda a, s, t, m: transfer_many(a, s, t, m)),
+    )
+
+    print(f"transfers: {count:,}")
+    for locked in (False, True):
+        if locked:
+            enable_thread_safety()
+        for name, run in cases:
+            accounts = make_accounts(size)
+            start = perf_counter()
+            run(accounts, sources, targets, amounts)
+            elapsed = perf_counter() - start
+            label = f"{name}{' (locked)' if locked else ''}"
+            print(f"{label:<30} {count / elapsed:>12,.0f} transfers/s")
+    disable_thread_safety()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,67 @@
+"""
+common.py
+
+Shared helpers for the bank_account benchmarks.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+from time import perf_counter
+from typing import Callable
+
+from bank_account import BankAccount, ChequingAccount, InvestmentAccount, SavingsAccount
+
+
+def make_accounts(count: int, seed: int = 2024) -> list[BankAccount]:
+    """
+    Builds a reproducible mix of chequing, savings and investment accounts.
+
+    Balances fall on both sides of the overdraft limit and minimum balance,
+    and creation dates span twenty years so some investment fees are waived.
+
+    Args:
+        count (int): Number of accounts to build.
+        seed (int): Random seed.
+
+    Returns:
+        list[BankAccount]: The accounts, numbered from 1.
+    """
+    rng = random.Random(seed)
+    today = date.today()
+    accounts: list[BankAccount] = []
+
+    for number in range(1, count + 1):
+        client = number // 3 + 1
+        balance = round(rng.uniform(-500.0, 5000.0), 2)
+        created = today - timedelta(days=rng.randrange(0, 20 * 365))
+        kind = number % 3
+
+        if kind == 0:
+            accounts.append(ChequingAccount(number, client, balance, created, -100.0, 0.05))
+        elif kind == 1:
+            accounts.append(SavingsAccount(number, client, balance, created, 50.0))
+        else:
+            accounts.append(InvestmentAccount(number, client, balance, created, 2.55))
+
+    return accounts
+
+
+def best_of(func: Callable[[], object], repeat: int = 3) -> float:
+    """
+    Times a callable and returns its fastest run.
+
+    Args:
+        func (Callable[[], object]): The work to time.
+        repeat (int): Number of runs.
+
+    Returns:
+        float: The fastest run, in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
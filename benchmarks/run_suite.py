@@ -0,0 +1,197 @@
+"""
+run_suite.py
+
+Benchmark suite for the bank_account hot paths, with regression tracking.
+
+Every case is timed at each requested portfolio size and reported in
+nanoseconds per operation. Results are written as JSON; when a stored
+baseline is given, the run fails (exit status 1) if any case is slower
+than the baseline by more than the allowed threshold.
+
+Cases:
+    construct_<type>            constructor with valid arguments
+    construct_<type>_fallback   constructor taking the try/except defaults
+    from_records_<type>         trusted bulk construction
+    deposit, withdraw, update_balance
+    service_charges_cold        get_service_charges() after a balance change
+    service_charges_cached      get_service_charges() repeated
+    str                         __str__()
+
+Usage:
+    python -m benchmarks.run_suite --sizes 1e3,1e4,1e5 --output results.json
+    python -m benchmarks.run_suite --baseline baseline.json --threshold 0.15
+    python -m benchmarks.run_suite --output baseline.json   # store a new baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+from datetime import date
+from typing import Callable
+
+from bank_account import BankAccount, ChequingAccount, InvestmentAccount, SavingsAccount
+from benchmarks.common import best_of, make_accounts
+
+_TODAY = date.today()
+
+_RECORD_FIELDS: dict[str, tuple[type[BankAccount], tuple[float, ...]]] = {
+    "chequing": (ChequingAccount, (-100.0, 0.05)),
+    "savings": (SavingsAccount, (50.0,)),
+    "investment": (InvestmentAccount, (2.55,)),
+}
+
+_CONSTRUCTORS: dict[str, tuple[Callable[[int], BankAccount], Callable[[int], BankAccount]]] = {
+    "chequing": (
+        lambda n: ChequingAccount(n, n, 100.0, _TODAY, -100.0, 0.05),
+        lambda n: ChequingAccount(n, n, "bad", "bad", "bad", "bad"),
+    ),
+    "savings": (
+        lambda n: SavingsAccount(n, n, 100.0, _TODAY, 50.0),
+        lambda n: SavingsAccount(n, n, "bad", "bad", "bad"),
+    ),
+    "investment": (
+        lambda n: InvestmentAccount(n, n, 100.0, _TODAY, 2.55),
+        lambda n: InvestmentAccount(n, n, "bad", "bad", "bad"),
+    ),
+}
+
+
+def run_cases(size: int, repeat: int) -> dict[str, float]:
+    """
+    Times every case for one portfolio size.
+
+    Args:
+        size (int): Number of accounts (and operations) per case.
+        repeat (int): Runs per case; the fastest is kept.
+
+    Returns:
+        dict[str, float]: Nanoseconds per operation, keyed by case name.
+    """
+    results: dict[str, float] = {}
+    numbers = range(size)
+
+    def record(name: str, func: Callable[[], object]) -> None:
+        results[name] = best_of(func, repeat) / size * 1e9
+
+    for type_name, (valid, fallback) in _CONSTRUCTORS.items():
+        record(f"construct_{type_name}", lambda: [valid(n) for n in numbers])
+        record(f"construct_{type_name}_fallback", lambda: [fallback(n) for n in numbers])
+
+        account_class, fields = _RECORD_FIELDS[type_name]
+        records = [(n, n, 100.0, _TODAY, *fields) for n in numbers]
+        record(f"from_records_{type_name}", lambda: account_class.from_records(records))
+
+    accounts = make_accounts(size)
+    record("deposit", lambda: [account.deposit(1.0) for account in accounts])
+    record("withdraw", lambda: [a.withdraw(0.5) for a in accounts if a.balance >= 0.5])
+    record("update_balance", lambda: [a.update_balance(-0.25) for a in accounts])
+
+    def cold_charges() -> None:
+        for account in accounts:
+            account.update_balance(0.0)
+            account.get_service_charges()
+
+    record("service_charges_cold", cold_charges)
+    record("service_charges_cached", lambda: [a.get_service_charges() for a in accounts])
+    record("str", lambda: [str(account) for account in accounts])
+
+    return results
+
+
+def compare(current: dict[str, float], baseline: dict[str, float], threshold: float) -> list[str]:
+    """
+    Lists the cases that regressed against a baseline.
+
+    Args:
+        current (dict[str, float]): This run's results.
+        baseline (dict[str, float]): The stored results.
+        threshold (float): Allowed slowdown as a fraction (0.10 = 10%).
+
+    Returns:
+        list[str]: One message per regressed case (empty if none).
+    """
+    regressions = []
+    for name, value in sorted(current.items()):
+        reference = baseline.get(name)
+        if reference and value > reference * (1.0 + threshold):
+            regressions.append(
+                f"{name}: {value:,.0f} ns/op vs baseline {reference:,.0f} ns/op "
+                f"(+{value / reference - 1.0:.0%})"
+            )
+    return regressions
+
+
+def parse_sizes(text: str) -> list[int]:
+    """
+    Parses a comma-separated list of sizes such as "1e3,1e4,250000".
+
+    Args:
+        text (str): The size list.
+
+    Returns:
+        list[int]: The sizes.
+    """
+    return [int(float(part)) for part in text.split(",") if part.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Runs the suite from the command line.
+
+    Args:
+        argv (list[str] | None): Command line arguments.
+
+    Returns:
+        int: 0 on success, 1 if a regression was found.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", default="1e3,1e4,1e5",
+                        help="comma-separated portfolio sizes (up to 1e7)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per case (fastest kept)")
+    parser.add_argument("--output", default="bench_results.json",
+                        help="where to write the JSON results")
+    parser.add_argument("--baseline",
+                        help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed slowdown (0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    results: dict[str, float] = {}
+    for size in parse_sizes(args.sizes):
+        for name, value in run_cases(size, args.repeat).items():
+            results[f"{name}@{size}"] = value
+            print(f"{name + '@' + str(size):<40} {value:>12,.0f} ns/op")
+
+    with open(args.output, "w", encoding="utf-8") as stream:
+        json.dump(
+            {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": results,
+            },
+            stream,
+            indent=2,
+        )
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as stream:
+        baseline = json.load(stream)["results"]
+
+    regressions = compare(results, baseline, args.threshold)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
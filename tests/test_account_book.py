@@ -0,0 +1,38 @@
+import unittest
+from datetime import date
+
+from bank_account.account_book import CHEQUING, INVESTMENT, SAVINGS, AccountBook
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+
+
+class TestAccountBook(unittest.TestCase):
+    def setUp(self) -> None:
+        self.accounts = [
+            ChequingAccount(1001, 2001, -600.0, date.today(), -100, 0.05),
+            ChequingAccount(1002, 2002, -50.0, date.today(), -100, 0.05),
+            ChequingAccount(1003, 2003, -100.1, date.today(), "bad", "bad"),
+            SavingsAccount(1004, 2004, 49.99, date.today(), 50),
+            SavingsAccount(1005, 2005, 500.0, date.today(), 50),
+            InvestmentAccount(1006, 2006, 100.0, date(2013, 1, 1), 2.00),
+            InvestmentAccount(1007, 2007, 100.0, date.today(), 1.99),
+        ]
+
+    def test_columns_copied_from_accounts(self) -> None:
+        book = AccountBook.from_accounts(self.accounts)
+        self.assertEqual(len(book), 7)
+        self.assertEqual(list(book.account_type), [CHEQUING] * 3 + [SAVINGS] * 2 + [INVESTMENT] * 2)
+        self.assertEqual(book.overdraft_limit[2], -100.0)
+        self.assertEqual(book.minimum_balance[3], 50.0)
+        self.assertEqual(book.date_created[5], date(2013, 1, 1).toordinal())
+
+    def test_service_charges_match_accounts_exactly(self) -> None:
+        book = AccountBook.from_accounts(self.accounts)
+        expected = [account.get_service_charges() for account in self.accounts]
+        self.assertEqual(list(book.get_service_charges()), expected)
+
+    def test_unsupported_account_type_rejected(self) -> None:
+        book = AccountBook()
+        with self.assertRaises(TypeError):
+            book.append(object())
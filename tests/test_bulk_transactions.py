@@ -0,0 +1,79 @@
+import random
+import unittest
+from datetime import date
+
+from bank_account.account_book import AccountBook
+from bank_account.bulk_transactions import DEPOSIT, WITHDRAW, apply_transactions
+from bank_account.chequing_account import ChequingAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.transaction_rules import (
+    ACCEPTED,
+    REJECT_EXCEEDS_BALANCE,
+    REJECT_NOT_NUMERIC,
+    REJECT_NOT_POSITIVE,
+)
+
+
+def make_accounts() -> list:
+    return [
+        SavingsAccount(1, 1, 100.0, date(2020, 1, 1), 50.0),
+        ChequingAccount(2, 1, 10.0, date(2020, 1, 1), -100.0, 0.05),
+    ]
+
+
+class TestApplyTransactions(unittest.TestCase):
+    def test_signed_feed_matches_deposit_and_withdraw(self) -> None:
+        rng = random.Random(3)
+        indices = [rng.randrange(2) for _ in range(500)]
+        amounts = [round(rng.uniform(-80.0, 60.0), 2) for _ in range(500)]
+        amounts[:2] = [0.0, -1000.0]
+
+        expected_accounts = make_accounts()
+        expected_mask = []
+        for index, amount in zip(indices, amounts):
+            account = expected_accounts[index]
+            try:
+                account.deposit(amount) if amount > 0 else account.withdraw(-amount)
+                expected_mask.append(1)
+            except ValueError:
+                expected_mask.append(0)
+
+        accounts = make_accounts()
+        mask, codes = apply_transactions(accounts, indices, amounts)
+        self.assertEqual(list(mask), expected_mask)
+        self.assertEqual(list(codes[:2]), [REJECT_NOT_POSITIVE, REJECT_EXCEEDS_BALANCE])
+        self.assertEqual([a.balance for a in accounts], [a.balance for a in expected_accounts])
+
+        book = AccountBook.from_accounts(make_accounts())
+        book_mask, book_codes = apply_transactions(book, indices, amounts)
+        self.assertEqual(book_mask, mask)
+        self.assertEqual(book_codes, codes)
+        self.assertEqual(list(book.balance), [a.balance for a in accounts])
+
+    def test_op_codes(self) -> None:
+        accounts = make_accounts()
+        mask, codes = apply_transactions(
+            accounts,
+            [0, 0, 1, 1, 0],
+            [50.0, -5.0, 10.0, "abc", 150.0],
+            [DEPOSIT, DEPOSIT, WITHDRAW, WITHDRAW, WITHDRAW],
+        )
+
+        self.assertEqual(list(mask), [1, 0, 1, 0, 1])
+        self.assertEqual(
+            list(codes),
+            [ACCEPTED, REJECT_NOT_POSITIVE, ACCEPTED, REJECT_NOT_NUMERIC, ACCEPTED],
+        )
+        self.assertEqual([a.balance for a in accounts], [0.0, 0.0])
+
+        with self.assertRaises(ValueError):
+            apply_transactions(accounts, [0], [1.0], [7])
+        with self.assertRaises(ValueError):
+            apply_transactions(accounts, [0, 1], [1.0])
+
+    def test_signed_feed_rejects_non_numeric(self) -> None:
+        for target in (make_accounts(), AccountBook.from_accounts(make_accounts())):
+            mask, codes = apply_transactions(target, [0, 0, 1, 0], [5.0, "abc", None, "-20"])
+
+            self.assertEqual(list(mask), [1, 0, 0, 1])
+            self.assertEqual(list(codes), [ACCEPTED, REJECT_NOT_NUMERIC, REJECT_NOT_NUMERIC, ACCEPTED])
@@ -0,0 +1,54 @@
+import unittest
+from datetime import date, timedelta
+
+from bank_account.bank_account import BankAccount
+from bank_account.charge_cache import cache_stats
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+
+
+class TestServiceChargeCache(unittest.TestCase):
+    def setUp(self) -> None:
+        cache_stats.reset()
+        self.ten_years_ago = InvestmentAccount.TEN_YEARS_AGO
+
+    def tearDown(self) -> None:
+        InvestmentAccount.TEN_YEARS_AGO = self.ten_years_ago
+
+    def test_repeated_calls_hit_cache(self) -> None:
+        account = SavingsAccount(1001, 2001, 100.0, date.today(), 50)
+        for _ in range(3):
+            self.assertEqual(account.get_service_charges(), 0.50)
+        self.assertEqual(cache_stats.snapshot()["hits"], 2)
+        self.assertEqual(cache_stats.snapshot()["misses"], 1)
+
+    def test_balance_change_invalidates(self) -> None:
+        account = SavingsAccount(1001, 2001, 100.0, date.today(), 50)
+        self.assertEqual(account.get_service_charges(), 0.50)
+        account.withdraw(60.0)
+        self.assertEqual(account.get_service_charges(), 1.00)
+        self.assertEqual(cache_stats.misses, 2)
+
+    def test_waiver_threshold_rollover_invalidates(self) -> None:
+        created = self.ten_years_ago + timedelta(days=1)
+        account = InvestmentAccount(1002, 2002, 100.0, created, 2.00)
+        self.assertEqual(account.get_service_charges(), 2.50)
+
+        InvestmentAccount.TEN_YEARS_AGO = created
+        self.assertEqual(account.get_service_charges(), 0.50)
+
+    def test_direct_balance_write_misses(self) -> None:
+        account = SavingsAccount(1001, 2001, 100.0, date.today(), 50)
+        self.assertEqual(account.get_service_charges(), 0.50)
+        account._balance = 10.0
+        self.assertEqual(account.get_service_charges(), 1.00)
+
+    def test_cached_under_stripe_lock(self) -> None:
+        BankAccount.enable_thread_safety()
+        try:
+            account = SavingsAccount(1001, 2001, 100.0, date.today(), 50)
+            self.assertEqual(account.get_service_charges(), 0.50)
+            self.assertEqual(account.get_service_charges(), 0.50)
+        finally:
+            BankAccount.disable_thread_safety()
+        self.assertEqual(cache_stats.hits, 1)
@@ -21,3 +21,7 @@ class TestChequingAccount(unittest.TestCase):
     def test_name_mangling_private_attr_example(self) -> None:
         account = ChequingAccount(1004, 2004, 0.0, date.today(), -100, 0.05)
         self.assertEqual(account._ChequingAccount__overdraft_limit, -100.0)
+
+    def test_slotted_layout_has_no_instance_dict(self) -> None:
+        account = ChequingAccount(1005, 2005, 0.0, date.today(), -100, 0.05)
+        self.assertFalse(hasattr(account, "__dict__"))
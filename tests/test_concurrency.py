@@ -0,0 +1,44 @@
+import threading
+import unittest
+from datetime import date
+
+from bank_account.concurrency import disable_thread_safety, enable_thread_safety
+from bank_account.savings_account import SavingsAccount
+
+
+class TestThreadSafety(unittest.TestCase):
+    def setUp(self) -> None:
+        self.stripes = enable_thread_safety(stripes=8)
+
+    def tearDown(self) -> None:
+        disable_thread_safety()
+
+    def test_concurrent_withdrawals_never_overdraw(self) -> None:
+        account = SavingsAccount(1001, 2001, 1000.0, date.today(), 50)
+        accepted = []
+
+        def worker() -> None:
+            for _ in range(200):
+                try:
+                    account.withdraw(1.0)
+                    accepted.append(1)
+                except ValueError:
+                    pass
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(accepted), 1000)
+        self.assertEqual(account.balance, 0.0)
+
+    def test_locked_accepts_accounts_in_any_order(self) -> None:
+        first = SavingsAccount(1, 1, 0.0, date.today(), 50)
+        second = SavingsAccount(2, 1, 0.0, date.today(), 50)
+        with self.stripes.locked(second, first):
+            first.deposit(1.0)
+        with self.stripes.locked(first, first):
+            second.deposit(1.0)
+        self.assertEqual(first.balance + second.balance, 2.0)
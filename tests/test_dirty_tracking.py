@@ -0,0 +1,77 @@
+import threading
+import unittest
+from datetime import date
+
+from bank_account.chequing_account import ChequingAccount
+from bank_account.concurrency import disable_thread_safety, enable_thread_safety
+from bank_account.dirty_tracking import ChangeTracker
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.waiver_scheduler import WaiverScheduler
+
+
+class TestChangeTracker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.threshold = InvestmentAccount.TEN_YEARS_AGO
+        self.savings = SavingsAccount(1, 1, 100.0, date(2020, 1, 1), 50.0)
+        self.chequing = ChequingAccount(2, 1, 100.0, date(2020, 1, 1), -100.0, 0.05)
+        self.tracker = ChangeTracker()
+
+    def tearDown(self) -> None:
+        self.tracker.close()
+        InvestmentAccount.TEN_YEARS_AGO = self.threshold
+
+    def test_changed_since_checkpoints(self) -> None:
+        self.savings.deposit(1.0)
+        self.tracker.checkpoint("month-end")
+        self.assertEqual(self.tracker.changed_since("month-end"), [])
+        self.assertEqual(len(self.tracker), 0)
+
+        self.savings.deposit(1.0)
+        self.tracker.checkpoint("statements")
+        self.chequing.withdraw(1.0)
+        self.savings.update_balance(-1.0)
+
+        self.assertEqual(self.tracker.changed_since("month-end"), [self.savings, self.chequing])
+        self.assertEqual(self.tracker.changed_since("statements"), [self.savings, self.chequing])
+
+        self.tracker.checkpoint("statements")
+        self.assertEqual(self.tracker.changed_count("statements"), 0)
+        self.assertEqual(self.tracker.changed_count("month-end"), 2)
+
+        self.tracker.release("month-end")
+        self.assertEqual(len(self.tracker), 0)
+        with self.assertRaises(KeyError):
+            self.tracker.changed_since("month-end")
+
+    def test_waiver_flips_are_recorded(self) -> None:
+        investment = InvestmentAccount(3, 1, 100.0, date(2015, 6, 1), 2.55)
+        scheduler = WaiverScheduler([investment], today=date(2025, 5, 1))
+        self.tracker.checkpoint("month-end")
+
+        self.assertEqual(self.tracker.tick_waivers(scheduler, date(2025, 5, 15)), [])
+        flipped = self.tracker.tick_waivers(scheduler, date(2025, 6, 15))
+        self.assertEqual(flipped, [investment])
+        self.assertEqual(self.tracker.changed_since("month-end"), [investment])
+
+    def test_concurrent_changes_are_all_recorded(self) -> None:
+        accounts = [SavingsAccount(100 + n, 1, 100.0, date(2020, 1, 1), 50.0) for n in range(64)]
+        self.tracker.checkpoint("start")
+
+        def churn(mine: list) -> None:
+            for _ in range(200):
+                for account in mine:
+                    account.update_balance(1.0)
+
+        enable_thread_safety()
+        try:
+            threads = [threading.Thread(target=churn, args=(accounts[n::4],)) for n in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            disable_thread_safety()
+
+        self.assertEqual(self.tracker.generation, 64 * 200)
+        self.assertEqual(set(self.tracker.changed_since("start")), set(accounts))
@@ -0,0 +1,80 @@
+import threading
+import unittest
+from datetime import date
+from math import fsum
+
+from bank_account.account_book import SAVINGS
+from bank_account.chequing_account import ChequingAccount
+from bank_account.concurrency import disable_thread_safety, enable_thread_safety
+from bank_account.exposure_index import ExposureIndex
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+
+
+class TestExposureIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        created = date(2020, 1, 1)
+        self.chequing = [
+            ChequingAccount(1, 1, -150.0, created, -100.0, 0.05),
+            ChequingAccount(2, 1, -400.0, created, -100.0, 0.10),
+            ChequingAccount(3, 2, 20.0, created, -100.0, 0.05),
+            ChequingAccount(4, 2, -100.0, created, -100.0, 0.05),
+        ]
+        self.savings = SavingsAccount(5, 3, 10.0, created, 50.0)
+        self.investment = InvestmentAccount(6, 3, 10.0, created, 2.55)
+        self.index = ExposureIndex([*self.chequing, self.savings, self.investment])
+
+    def tearDown(self) -> None:
+        self.index.close()
+
+    def test_queries_match_full_scan(self) -> None:
+        self.assertEqual(len(self.index), 5)
+        self.assertNotIn(6, self.index)
+        self.assertEqual([a.account_number for a in self.index.below_threshold()], [2, 1])
+        self.assertEqual([a.account_number for a in self.index.deepest(1)], [2])
+        self.assertEqual([a.account_number for a in self.index.in_range(-60.0, 200.0)], [1, 4, 3])
+
+        expected = fsum(
+            a.get_service_charges() - a.BASE_SERVICE_CHARGE for a in self.chequing
+        )
+        self.assertAlmostEqual(self.index.projected_penalty(), expected)
+        self.assertEqual(self.index.projected_penalty(SAVINGS), 0.5)
+
+    def test_tracks_balance_changes(self) -> None:
+        self.chequing[1].deposit(350.0)
+        self.chequing[2].update_balance(-300.0)
+        self.savings.deposit(40.0)
+
+        self.assertEqual([a.account_number for a in self.index.below_threshold()], [3, 1])
+        self.assertEqual(self.index.margin(2), 50.0)
+        self.assertEqual(self.index.below_threshold(SAVINGS), [])
+
+        self.index.remove(3)
+        self.assertEqual([a.account_number for a in self.index.deepest(5)], [1])
+        with self.assertRaises(ValueError):
+            self.index.add(self.chequing[0])
+
+    def test_concurrent_updates_keep_keys_sorted(self) -> None:
+        accounts = [ChequingAccount(100 + n, 9, 0.0, date(2020, 1, 1), -100.0, 0.05) for n in range(64)]
+        for account in accounts:
+            self.index.add(account)
+
+        def churn(mine: list) -> None:
+            for step in range(300):
+                for account in mine:
+                    account.update_balance(-3.0 if step % 2 else 2.0)
+
+        enable_thread_safety()
+        try:
+            threads = [threading.Thread(target=churn, args=(accounts[n::4],)) for n in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            disable_thread_safety()
+
+        expected = [account.balance + 100.0 for account in accounts]
+        self.assertEqual([self.index.margin(account.account_number) for account in accounts], expected)
+        below = self.index.below_threshold()
+        self.assertEqual(len(below), len([a for a in [*self.chequing, *accounts] if a.balance < -100.0]))
@@ -0,0 +1,144 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+from datetime import date, timedelta
+
+from bank_account.account_book import CHEQUING, SAVINGS, AccountBook
+from bank_account.chequing_account import ChequingAccount
+from bank_account.fee_rules import (
+    DEFAULT_RULES,
+    DEFAULT_RULES_DATA,
+    FeeRule,
+    FeeRuleSet,
+    active_rules,
+    reload_rules,
+    set_rules,
+)
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.service_charges import post_service_charges
+from bank_account.simulation import Scenario, simulate
+from bank_account.snapshot import PortfolioSnapshot, write_snapshot
+
+
+def make_accounts(count: int) -> list:
+    rng = random.Random(5)
+    accounts = []
+    for number in range(count):
+        balance = round(rng.uniform(-500.0, 500.0), 2)
+        created = date.today() - timedelta(days=rng.randrange(0, 20 * 365))
+        kind = number % 3
+        if kind == 0:
+            accounts.append(ChequingAccount(number, 1, balance, created, -100.0, rng.choice((0.05, 0.07))))
+        elif kind == 1:
+            accounts.append(SavingsAccount(number, 1, balance, created, 50.0))
+        else:
+            accounts.append(InvestmentAccount(number, 1, balance, created, 2.55))
+    return accounts
+
+
+class TestFeeRules(unittest.TestCase):
+    def tearDown(self) -> None:
+        set_rules(DEFAULT_RULES)
+
+    def test_default_rules_match_get_service_charges(self) -> None:
+        accounts = make_accounts(600)
+        expected = [account.get_service_charges() for account in accounts]
+
+        self.assertEqual([DEFAULT_RULES.charge(account) for account in accounts], expected)
+        self.assertEqual(list(DEFAULT_RULES.charges(AccountBook.from_accounts(accounts))), expected)
+        self.assertEqual(FeeRuleSet.from_dict(DEFAULT_RULES.to_dict()).to_dict(), DEFAULT_RULES.to_dict())
+
+    def test_reload_from_json(self) -> None:
+        data = dict(DEFAULT_RULES_DATA)
+        data["Savings"] = {"kind": "flat", "base": 1.0, "fee": "minimum_balance"}
+        data["Investment"] = {"kind": "age_waiver", "fee": 3.0, "waiver_age_days": 30}
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rules.json")
+            with open(path, "w", encoding="utf-8") as stream:
+                json.dump(data, stream)
+            rules = reload_rules(path)
+
+        self.assertIs(active_rules(), rules)
+        self.assertEqual(rules.rule_for(SAVINGS).kind, "flat")
+
+        savings = SavingsAccount(1, 1, 10.0, date.today(), 50.0)
+        old = InvestmentAccount(2, 1, 10.0, date.today() - timedelta(days=31), 2.55)
+        new = InvestmentAccount(3, 1, 10.0, date.today(), 2.55)
+        self.assertEqual(rules.charge(savings), 51.0)
+        self.assertEqual([rules.charge(old), rules.charge(new)], [0.5, 3.5])
+        self.assertEqual(list(rules.charges(AccountBook.from_accounts([savings, old, new]))), [51.0, 0.5, 3.5])
+
+    def test_reload_changes_bulk_charges(self) -> None:
+        accounts = make_accounts(30)
+        book = AccountBook.from_accounts(accounts)
+        before = list(book.get_service_charges())
+
+        data = dict(DEFAULT_RULES_DATA)
+        data["Savings"] = {"kind": "flat", "base": 2.0}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rules.json")
+            with open(path, "w", encoding="utf-8") as stream:
+                json.dump(data, stream)
+            reload_rules(path)
+
+        after = list(book.get_service_charges())
+        self.assertEqual(after[1::3], [2.0] * 10)
+        self.assertEqual(after[0::3], before[0::3])
+
+        result = post_service_charges(book)
+        self.assertEqual(result.counts["Savings"] + sum(r.account_type == "Savings" for r in result.rejected), 10)
+        self.assertEqual(result.totals["Savings"], 2.0 * result.counts["Savings"])
+
+        result = post_service_charges(accounts)
+        self.assertEqual(result.totals["Savings"], 2.0 * result.counts["Savings"])
+
+    def test_invalid_rules(self) -> None:
+        with self.assertRaises(ValueError):
+            FeeRule("tiered")
+        with self.assertRaises(ValueError):
+            FeeRule("threshold", threshold="overdraft_limit")
+        with self.assertRaises(ValueError):
+            FeeRule("flat", fee="balance")
+        with self.assertRaises(ValueError):
+            FeeRuleSet.from_dict({"Business": {"kind": "flat"}})
+        with self.assertRaises(ValueError):
+            FeeRuleSet.from_dict({"Savings": {"kind": "flat", "premium": 2}})
+
+        with self.assertRaises(ValueError):
+            FeeRuleSet.from_dict({"Savings": {"kind": "flat", "base": "0.5"}})
+        with self.assertRaises(ValueError):
+            FeeRule("multiplier", threshold="minimum_balance", multiplier=None)
+        with self.assertRaises(ValueError):
+            FeeRule("flat", fee=[1.0])
+
+    def test_simulation_and_snapshot_use_active_rules(self) -> None:
+        accounts = make_accounts(30)
+        book = AccountBook.from_accounts(accounts)
+        set_rules(FeeRuleSet({SAVINGS: FeeRule("flat", base=0.0, fee=4.0)}))
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "portfolio.snap")
+            write_snapshot(path, book)
+            with PortfolioSnapshot(path) as snapshot:
+                self.assertEqual(snapshot.get_service_charges(accounts[1].account_number), 4.0)
+
+        result, = simulate(book, [Scenario("base")], months=1)
+        self.assertEqual(result.charges[1], 4.0 if accounts[1].balance >= 4.0 else 0.0)
+        self.assertEqual(result.charges[0], accounts[0].get_service_charges())
+
+    def test_partial_rule_set_falls_back_to_built_in_rules(self) -> None:
+        set_rules(FeeRuleSet({SAVINGS: FeeRule("flat", base=1.0)}))
+        accounts = make_accounts(30)
+        expected = [1.0 if isinstance(a, SavingsAccount) else a.get_service_charges() for a in accounts]
+
+        self.assertEqual(list(AccountBook.from_accounts(accounts).get_service_charges()), expected)
+        self.assertEqual(active_rules().rule_for(CHEQUING), DEFAULT_RULES.rule_for(CHEQUING))
+
+        book_result = post_service_charges(AccountBook.from_accounts(accounts))
+        object_result = post_service_charges(accounts)
+        self.assertEqual(book_result.totals, object_result.totals)
+        self.assertEqual(len(book_result.rejected), len(object_result.rejected))
@@ -0,0 +1,50 @@
+import unittest
+from datetime import date
+
+from bank_account.account_book import AccountBook
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+
+
+def state(account) -> tuple:
+    fields = tuple(getattr(account, name) for name in type(account)._RECORD_FIELDS)
+    return (
+        type(account),
+        str(account),
+        account.get_service_charges(),
+        account.client_number,
+        account.date_created,
+    ) + fields
+
+
+class TestFromRecords(unittest.TestCase):
+    def test_matches_constructor(self) -> None:
+        today = date.today()
+        records = [(1, 10, -600.0, today, -100.0, 0.05), (2, 20, 5.0, today, -50.0, 0.1)]
+        built = ChequingAccount.from_records(records)
+        expected = [ChequingAccount(*record) for record in records]
+        self.assertEqual([state(a) for a in built], [state(a) for a in expected])
+        self.assertEqual(built[1]._ChequingAccount__overdraft_rate, 0.1)
+
+    def test_int_balances_converted_once_per_column(self) -> None:
+        account, = SavingsAccount.from_records([(3, 30, 49, date.today(), 50)])
+        self.assertIs(type(account.balance), float)
+        self.assertEqual(account.get_service_charges(), 1.00)
+
+    def test_column_validation(self) -> None:
+        with self.assertRaises(ValueError):
+            InvestmentAccount.from_records([(4, 40, 1.0, "2020-01-01", 2.55)])
+        with self.assertRaises(ValueError):
+            InvestmentAccount.from_records([("4", 40, 1.0, date.today(), 2.55)])
+        with self.assertRaises(ValueError):
+            InvestmentAccount.from_records([(4, 40, 1.0, date.today())])
+
+    def test_book_to_accounts_round_trip(self) -> None:
+        accounts = [
+            SavingsAccount(1, 1, 10.0, date(2020, 5, 1), 75.0),
+            ChequingAccount(2, 1, -10.0, date(2021, 5, 1), -100.0, 0.05),
+            InvestmentAccount(3, 2, 10.0, date(2010, 5, 1), 1.0),
+        ]
+        rebuilt = AccountBook.from_accounts(accounts).to_accounts()
+        self.assertEqual([state(a) for a in rebuilt], [state(a) for a in accounts])
@@ -0,0 +1,124 @@
+import unittest
+from datetime import date
+
+from bank_account.account_book import CHEQUING, INVESTMENT, SAVINGS, AccountBook
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.interest import InterestAccrual, InterestPolicy
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+
+
+class TestInterest(unittest.TestCase):
+    def setUp(self) -> None:
+        # 3.65% over 365 days is 0.01% a day.
+        self.policy = InterestPolicy({SAVINGS: 0.0365, INVESTMENT: [(0.0, 0.0365), (5_000.0, 0.073)]})
+        self.accounts = [
+            ChequingAccount(1, 1, 1_000.0, date(2020, 1, 1), -100.0, 0.05),
+            SavingsAccount(2, 1, 1_000.0, date(2020, 1, 1), 50.0),
+            InvestmentAccount(3, 2, 10_000.0, date(2020, 1, 1), 2.55),
+            SavingsAccount(4, 2, -20.0, date(2020, 1, 1), 50.0),
+        ]
+        self.book = AccountBook.from_accounts(self.accounts)
+
+    def test_policy_tiers_and_validation(self) -> None:
+        self.assertEqual(self.policy.rate_for(SAVINGS, 1.0), 0.0365)
+        self.assertEqual(self.policy.rate_for(INVESTMENT, 4_999.99), 0.0365)
+        self.assertEqual(self.policy.rate_for(INVESTMENT, 5_000.0), 0.073)
+        self.assertEqual(self.policy.rate_for(CHEQUING, 1_000.0), 0.0)
+        self.assertEqual(list(self.policy.daily_interest([SAVINGS, SAVINGS], [1_000.0, -5.0], 10)), [1.0, 0.0])
+
+        with self.assertRaises(ValueError):
+            InterestPolicy({SAVINGS: -0.01})
+        with self.assertRaises(ValueError):
+            InterestPolicy({SAVINGS: [(0.0, 0.01), (0.0, 0.02)]})
+        with self.assertRaises(ValueError):
+            InterestPolicy({SAVINGS: 0.01}, day_count=0)
+
+    def test_catch_up_compounds_monthly(self) -> None:
+        accrual = InterestAccrual(self.book, self.policy, as_of=date(2025, 1, 1))
+        posted = accrual.advance(date(2025, 3, 11))
+
+        # January (31 days) posts on Feb 1; February (28 days) earns on the new balance.
+        february = 1_003.1 * 0.0001 * 28
+        self.assertAlmostEqual(self.book.balance[1], 1_003.1 + february)
+        self.assertAlmostEqual(accrual.accrued[1], (1_003.1 + february) * 0.0001 * 10)
+        self.assertAlmostEqual(posted, sum(self.book.balance) - sum(a.balance for a in self.accounts))
+        self.assertEqual(self.book.balance[0], 1_000.0)
+        self.assertEqual(self.book.balance[3], -20.0)
+        self.assertEqual(accrual.as_of, date(2025, 3, 11))
+
+        # Catching up in one call matches advancing one day at a time.
+        stepped_book = AccountBook.from_accounts(self.accounts)
+        stepped = InterestAccrual(stepped_book, self.policy, as_of=date(2025, 1, 1))
+        for ordinal in range(date(2025, 1, 2).toordinal(), date(2025, 3, 11).toordinal() + 1):
+            stepped.advance(date.fromordinal(ordinal))
+        for expected, actual in zip(self.book.balance, stepped_book.balance):
+            self.assertAlmostEqual(expected, actual)
+        self.assertAlmostEqual(stepped.pending_total, accrual.pending_total)
+
+        with self.assertRaises(ValueError):
+            accrual.advance(date(2025, 3, 1))
+
+    def test_objects_post_through_update_balance(self) -> None:
+        events = []
+
+        def listener(account: BankAccount, operation: str, amount: float) -> None:
+            events.append((account.account_number, operation))
+
+        book_accrual = InterestAccrual(self.book, self.policy, as_of=date(2025, 1, 15))
+
+        BankAccount.add_balance_listener(listener)
+        try:
+            with InterestAccrual(self.accounts, self.policy, as_of=date(2025, 1, 15)) as accrual:
+                posted = accrual.advance(date(2025, 4, 1))
+        finally:
+            BankAccount.remove_balance_listener(listener)
+        book_accrual.advance(date(2025, 4, 1))
+
+        self.assertEqual(events, [(2, BankAccount.OP_UPDATE), (3, BankAccount.OP_UPDATE)] * 3)
+        self.assertGreater(posted, 0.0)
+        self.assertEqual(accrual.pending_total, 0.0)
+        for account, balance in zip(self.accounts, self.book.balance):
+            self.assertAlmostEqual(account.balance, balance)
+
+    def test_balance_changes_between_advances(self) -> None:
+        today = [date(2025, 1, 2)]
+        clock = lambda: today[0]
+        with InterestAccrual(self.accounts, self.policy, as_of=date(2025, 1, 1), clock=clock) as accrual:
+            accrual.advance(date(2025, 1, 2))
+            today[0] = date(2025, 1, 20)
+            self.accounts[1].deposit(1_000_000.0)
+            accrual.advance(date(2025, 1, 31))
+
+            # 30 days on 1,000 plus the 11 days from Jan 20 on the deposit.
+            deposit_interest = 1_000_000.0 * 0.0001 * 11
+            self.assertAlmostEqual(accrual.accrued[1], 1_000.0 * 0.0001 * 30 + deposit_interest)
+
+            # A change dated after the advance stays recorded for the next one.
+            today[0] = date(2025, 2, 10)
+            self.accounts[1].withdraw(1_000_000.0)
+            posted = accrual.advance(date(2025, 2, 5))
+            january = 1_000.0 * 0.0001 * 31 + 1_000_000.0 * 0.0001 * 12
+            self.assertAlmostEqual(posted, january + 10_000.0 * 0.0002 * 31)
+
+            balance = 1_000.0 + january
+            accrual.advance(date(2025, 2, 15))
+            expected = (balance + 1_000_000.0) * 0.0001 * 9 + balance * 0.0001 * 5
+            self.assertAlmostEqual(accrual.accrued[1], expected)
+
+        self.accounts[1].deposit(5.0)
+        self.assertNotIn(accrual._on_balance_change, BankAccount._balance_listeners)
+
+    def test_rows_appended_to_the_book_start_accruing(self) -> None:
+        accrual = InterestAccrual(self.book, self.policy, as_of=date(2025, 1, 1))
+        accrual.advance(date(2025, 1, 11))
+        self.book.append(SavingsAccount(5, 3, 1_000.0, date(2025, 1, 11), 50.0))
+        accrual.advance(date(2025, 1, 21))
+
+        self.assertAlmostEqual(accrual.accrued[1], 2.0)
+        self.assertAlmostEqual(accrual.accrued[4], 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -16,3 +16,7 @@ class TestInvestmentAccount(unittest.TestCase):
     def test_name_mangling_private_attr_example(self) -> None:
         account = InvestmentAccount(2003, 3003, 0.0, date.today(), 1.99)
         self.assertEqual(round(account._InvestmentAccount__management_fee, 2), 1.99)
+
+    def test_slotted_layout_has_no_instance_dict(self) -> None:
+        account = InvestmentAccount(2004, 3004, 0.0, date.today(), 1.99)
+        self.assertFalse(hasattr(account, "__dict__"))
@@ -0,0 +1,82 @@
+import os
+import tempfile
+import unittest
+from datetime import date
+
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.journal import (
+    TransactionJournal,
+    read_journal,
+    recover_balances,
+    restore_balances,
+    write_checkpoint,
+)
+from bank_account.savings_account import SavingsAccount
+
+
+class TestTransactionJournal(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.journal_path = os.path.join(self.directory.name, "accounts.journal")
+        self.checkpoint_path = os.path.join(self.directory.name, "accounts.checkpoint")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_records_every_balance_change(self) -> None:
+        account = SavingsAccount(1001, 2001, 100.0, date.today(), 50)
+        with TransactionJournal(self.journal_path, flush_records=2):
+            account.deposit(25.0)
+            account.withdraw(10.0)
+            account.update_balance(-0.5)
+
+        records = list(read_journal(self.journal_path))
+        self.assertEqual(
+            [(r.account_number, r.operation, r.amount) for r in records],
+            [
+                (1001, BankAccount.OP_DEPOSIT, 25.0),
+                (1001, BankAccount.OP_WITHDRAW, -10.0),
+                (1001, BankAccount.OP_UPDATE, -0.5),
+            ],
+        )
+
+    def test_recover_from_checkpoint_and_tail(self) -> None:
+        cheq = ChequingAccount(1, 1, 0.1, date.today(), -100, 0.05)
+        sav = SavingsAccount(2, 1, 0.2, date.today(), 50)
+
+        with TransactionJournal(self.journal_path) as journal:
+            cheq.deposit(0.7)
+            write_checkpoint(self.checkpoint_path, [cheq, sav], journal)
+            sav.deposit(0.1)
+            cheq.withdraw(0.3)
+
+        # Simulate a crash that tore the last record in half.
+        with open(self.journal_path, "ab") as stream:
+            stream.write(b"\x01\x02\x03")
+
+        balances = recover_balances(self.journal_path, self.checkpoint_path)
+        self.assertEqual(balances, {1: cheq.balance, 2: sav.balance})
+
+        fresh = SavingsAccount(2, 1, 0.0, date.today(), 50)
+        restore_balances([fresh], balances)
+        self.assertEqual(fresh.balance, sav.balance)
+
+    def test_reopen_after_torn_tail_appends_aligned(self) -> None:
+        account = SavingsAccount(1001, 2001, 100.0, date.today(), 50)
+        with TransactionJournal(self.journal_path):
+            account.deposit(1.0)
+        with open(self.journal_path, "ab") as stream:
+            stream.write(b"\x01\x02\x03")
+
+        with TransactionJournal(self.journal_path):
+            account.deposit(2.0)
+
+        records = list(read_journal(self.journal_path))
+        self.assertEqual([(r.account_number, r.amount) for r in records], [(1001, 1.0), (1001, 2.0)])
+
+    def test_rejects_foreign_file(self) -> None:
+        with open(self.journal_path, "wb") as stream:
+            stream.write(b"not a journal")
+        with self.assertRaises(ValueError):
+            TransactionJournal(self.journal_path)
@@ -0,0 +1,47 @@
+import io
+import unittest
+from datetime import date
+
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from bank_account.loader import iter_account_batches, iter_accounts
+from bank_account.savings_account import SavingsAccount
+
+CSV_TEXT = (
+    "account_type,account_number,client_number,balance,date_created,"
+    "overdraft_limit,overdraft_rate,minimum_balance,management_fee\n"
+    "chequing,1001,2001,-200.00,2020-01-01,,,,\n"
+    "Savings,1002,2002,200.00,bad-date,,,75,\n"
+    "investment,1003,2003,1000.00,2010-01-01,,,,x\n"
+)
+
+
+class TestLoader(unittest.TestCase):
+    def test_csv_dispatch_and_defaults(self) -> None:
+        cheq, sav, inv = iter_accounts(io.StringIO(CSV_TEXT), "csv")
+
+        self.assertIsInstance(cheq, ChequingAccount)
+        self.assertEqual(cheq.overdraft_limit, -100.0)
+        self.assertEqual(cheq.overdraft_rate, 0.05)
+        self.assertEqual(cheq.date_created, date(2020, 1, 1))
+
+        self.assertIsInstance(sav, SavingsAccount)
+        self.assertEqual(sav.minimum_balance, 75.0)
+        self.assertEqual(sav.date_created, date.today())
+
+        self.assertIsInstance(inv, InvestmentAccount)
+        self.assertEqual(inv.management_fee, 2.55)
+
+    def test_jsonl_batches(self) -> None:
+        lines = "\n".join(
+            f'{{"account_type": "savings", "account_number": {n}, "client_number": 1}}'
+            for n in range(5)
+        )
+        batches = list(iter_account_batches(io.StringIO(lines), batch_size=2, file_format="jsonl"))
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        self.assertEqual(batches[0][0].minimum_balance, 50.0)
+
+    def test_unknown_type_reports_row(self) -> None:
+        text = "account_type,account_number,client_number\nloan,1,1\n"
+        with self.assertRaisesRegex(ValueError, "Row 1"):
+            list(iter_accounts(io.StringIO(text), "csv"))
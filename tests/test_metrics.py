@@ -0,0 +1,74 @@
+import unittest
+from datetime import date
+
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.metrics import disable_metrics, enable_metrics, metrics, metrics_enabled
+from bank_account.savings_account import SavingsAccount
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self) -> None:
+        metrics.reset()
+        self.savings = SavingsAccount(1, 1, 100.0, date(2020, 1, 1), 50.0)
+        self.chequing = ChequingAccount(2, 1, 100.0, date(2020, 1, 1), -100.0, 0.05)
+
+    def tearDown(self) -> None:
+        disable_metrics()
+        metrics.reset()
+
+    def test_disabled_leaves_methods_untouched(self) -> None:
+        original = BankAccount.__dict__["deposit"]
+        enable_metrics()
+        self.assertTrue(metrics_enabled())
+        self.assertIsNot(BankAccount.__dict__["deposit"], original)
+
+        disable_metrics()
+        self.assertFalse(metrics_enabled())
+        self.assertIs(BankAccount.__dict__["deposit"], original)
+        self.savings.deposit(1.0)
+        self.assertEqual(metrics.snapshot(), {})
+
+    def test_counts_rejections_by_type(self) -> None:
+        enable_metrics()
+        self.savings.deposit(10.0)
+        self.chequing.withdraw(5.0)
+        with self.assertRaises(ValueError):
+            self.savings.withdraw(1000.0)
+        with self.assertRaises(ValueError):
+            self.savings.deposit(-1.0)
+        self.chequing.get_service_charges()
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["deposit"]["Savings"]["count"], 2)
+        self.assertEqual(snapshot["deposit"]["Savings"]["rejected"], {"must be positive": 1})
+        self.assertEqual(snapshot["withdraw"]["Savings"]["rejected"], {"exceeds balance": 1})
+        self.assertEqual(snapshot["withdraw"]["Chequing"]["count"], 1)
+        self.assertEqual(snapshot["get_service_charges"]["Chequing"]["buckets"]["+Inf"], 1)
+        self.assertEqual(self.savings.balance, 110.0)
+
+    def test_keyword_arguments_are_forwarded(self) -> None:
+        enable_metrics()
+        self.savings.deposit(amount=5.0)
+        self.savings.withdraw(amount=2.0)
+
+        self.assertEqual(self.savings.balance, 103.0)
+        self.assertEqual(metrics.snapshot()["deposit"]["Savings"]["count"], 1)
+
+    def test_prometheus_text(self) -> None:
+        enable_metrics()
+        self.savings.deposit(10.0)
+        with self.assertRaises(ValueError):
+            self.savings.withdraw(1000.0)
+
+        text = metrics.to_prometheus()
+        self.assertIn("# TYPE bank_account_operations_total counter", text)
+        self.assertIn(
+            'bank_account_operations_total{operation="withdraw",account_type="Savings",'
+            'outcome="rejected",reason="exceeds balance"} 1',
+            text,
+        )
+        self.assertIn(
+            'bank_account_operation_seconds_count{operation="deposit",account_type="Savings"} 1',
+            text,
+        )
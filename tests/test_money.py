@@ -0,0 +1,46 @@
+import unittest
+from datetime import date
+
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from bank_account.money import format_minor, validate_minor_units
+from bank_account.savings_account import SavingsAccount
+
+
+class TestFixedPointMode(unittest.TestCase):
+    def setUp(self) -> None:
+        BankAccount.use_fixed_point(100)
+
+    def tearDown(self) -> None:
+        BankAccount.use_floating_point()
+
+    def test_balances_do_not_drift(self) -> None:
+        account = SavingsAccount(1001, 2001, 0.0, date.today(), 50)
+        for _ in range(10):
+            account.deposit(0.1)
+        self.assertEqual(account._balance, 100)
+        self.assertEqual(account.balance, 1.0)
+
+        account.withdraw(0.3)
+        self.assertEqual(account.balance, 0.7)
+        with self.assertRaisesRegex(ValueError, "exceeds balance"):
+            account.withdraw(0.71)
+
+    def test_service_charges_in_minor_units(self) -> None:
+        cheq = ChequingAccount(1001, 2001, -600.0, date.today(), -100, 0.05)
+        sav = SavingsAccount(1002, 2002, 49.99, date.today(), 50)
+        inv = InvestmentAccount(1003, 2003, 100.0, date.today(), 2.55)
+        self.assertEqual(cheq.get_service_charges(), 25.50)
+        self.assertEqual(sav.get_service_charges(), 1.00)
+        self.assertEqual(inv.get_service_charges(), 3.05)
+
+    def test_str_matches_float_format(self) -> None:
+        account = ChequingAccount(1001, 2001, -1234567.5, date.today(), -100, 0.05)
+        self.assertIn("Balance: $-1,234,567.50\n", str(account))
+
+    def test_format_minor_and_validation(self) -> None:
+        self.assertEqual(format_minor(5, 100), "$0.05")
+        self.assertEqual(format_minor(-123456, 1000), "$-123.456")
+        with self.assertRaises(ValueError):
+            validate_minor_units(50)
@@ -0,0 +1,65 @@
+import threading
+import unittest
+from datetime import date
+
+from bank_account.chequing_account import ChequingAccount
+from bank_account.concurrency import disable_thread_safety, enable_thread_safety
+from bank_account.registry import AccountRegistry
+from bank_account.savings_account import SavingsAccount
+
+
+class TestAccountRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cheq = ChequingAccount(1001, 7, 100.0, date.today(), -100, 0.05)
+        self.sav = SavingsAccount(1002, 7, 200.0, date.today(), 50)
+        self.other = SavingsAccount(1003, 8, 10.0, date.today(), 50)
+        self.registry = AccountRegistry([self.cheq, self.sav, self.other])
+
+    def tearDown(self) -> None:
+        self.registry.close()
+
+    def test_lookups(self) -> None:
+        self.assertIs(self.registry.get(1002), self.sav)
+        self.assertEqual(self.registry.accounts_for_client(7), [self.cheq, self.sav])
+        self.assertEqual(self.registry.accounts_for_client(99), [])
+
+    def test_duplicate_account_number_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            self.registry.add(SavingsAccount(1001, 9, 0.0, date.today(), 50))
+
+    def test_aggregates_follow_balance_changes(self) -> None:
+        self.assertEqual(self.registry.client_total_balance(7), 300.0)
+        self.assertEqual(self.registry.client_total_service_charges(7), 1.0)
+
+        self.sav.withdraw(190.0)
+        self.cheq.deposit(5.0)
+        self.assertEqual(self.registry.client_total_balance(7), 115.0)
+        self.assertEqual(self.registry.client_total_service_charges(7), 1.5)
+
+    def test_remove_updates_indexes(self) -> None:
+        self.registry.remove(1003)
+        self.assertNotIn(1003, self.registry)
+        self.assertEqual(self.registry.client_total_balance(8), 0.0)
+        with self.assertRaises(KeyError):
+            self.registry.remove(1003)
+
+    def test_concurrent_changes_to_one_client(self) -> None:
+        accounts = [SavingsAccount(2000 + n, 9, 100.0, date.today(), 50) for n in range(8)]
+        for account in accounts:
+            self.registry.add(account)
+
+        def churn(account: SavingsAccount) -> None:
+            for _ in range(500):
+                account.update_balance(1.0)
+
+        enable_thread_safety()
+        try:
+            threads = [threading.Thread(target=churn, args=(account,)) for account in accounts]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            disable_thread_safety()
+
+        self.assertEqual(self.registry.client_total_balance(9), 8 * 600.0)
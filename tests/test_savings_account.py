@@ -16,3 +16,7 @@ class TestSavingsAccount(unittest.TestCase):
     def test_name_mangling_private_attr_example(self) -> None:
         account = SavingsAccount(3003, 4003, 0.0, date.today(), 50)
         self.assertEqual(account._SavingsAccount__minimum_balance, 50.0)
+
+    def test_slotted_layout_has_no_instance_dict(self) -> None:
+        account = SavingsAccount(3004, 4004, 0.0, date.today(), 50)
+        self.assertFalse(hasattr(account, "__dict__"))
@@ -0,0 +1,80 @@
+import threading
+import unittest
+from datetime import date
+
+from bank_account.account_book import AccountBook
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.concurrency import disable_thread_safety, enable_thread_safety
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.service_charges import post_service_charges
+
+
+class TestPostServiceCharges(unittest.TestCase):
+    def make_accounts(self) -> list:
+        return [
+            ChequingAccount(1001, 2001, -600.0, date.today(), -100, 0.05),
+            ChequingAccount(1002, 2002, 100.0, date.today(), -100, 0.05),
+            SavingsAccount(1003, 2003, 0.75, date.today(), 50),
+            InvestmentAccount(1004, 2004, 100.0, date.today(), 2.00),
+        ]
+
+    def test_charges_posted_and_rejections_reported(self) -> None:
+        accounts = self.make_accounts()
+        result = post_service_charges(accounts)
+
+        self.assertEqual(round(accounts[1].balance, 2), 99.50)
+        self.assertEqual(round(accounts[3].balance, 2), 97.50)
+        self.assertEqual(accounts[0].balance, -600.0)
+        self.assertEqual(accounts[2].balance, 0.75)
+
+        self.assertEqual([r.account_number for r in result.rejected], [1001, 1003])
+        self.assertEqual({r.reason for r in result.rejected}, {"exceeds balance"})
+        self.assertEqual(result.counts, {"Chequing": 1, "Investment": 1})
+        self.assertEqual(round(result.total_charged, 2), 3.00)
+
+    def test_book_matches_object_path(self) -> None:
+        accounts = self.make_accounts()
+        book = AccountBook.from_accounts(accounts)
+
+        object_result = post_service_charges(accounts)
+        book_result = post_service_charges(book)
+
+        self.assertEqual(list(book.balance), [account.balance for account in accounts])
+        self.assertEqual(book_result.totals, object_result.totals)
+        self.assertEqual(book_result.rejected, object_result.rejected)
+
+    def test_charges_are_withdrawals_and_thread_safe(self) -> None:
+        events = []
+
+        def listener(account: BankAccount, operation: str, amount: float) -> None:
+            events.append(operation)
+
+        BankAccount.add_balance_listener(listener)
+        try:
+            post_service_charges(self.make_accounts())
+        finally:
+            BankAccount.remove_balance_listener(listener)
+        self.assertEqual(events, [BankAccount.OP_WITHDRAW] * 2)
+
+        # Each account can pay either its 0.50 charge or a 0.50 withdrawal, not both.
+        accounts = [ChequingAccount(n, 1, 0.5, date.today(), 0.0, 0.05) for n in range(2000)]
+
+        def withdraw_all() -> None:
+            for account in accounts:
+                try:
+                    account.withdraw(0.5)
+                except ValueError:
+                    pass
+
+        enable_thread_safety()
+        try:
+            thread = threading.Thread(target=withdraw_all)
+            thread.start()
+            post_service_charges(accounts)
+            thread.join()
+        finally:
+            disable_thread_safety()
+
+        self.assertEqual({account.balance for account in accounts}, {0.0})
@@ -0,0 +1,72 @@
+import unittest
+from datetime import date
+
+from bank_account.account_book import AccountBook
+from bank_account.chequing_account import ChequingAccount
+from bank_account.fee_rules import DEFAULT_RULES, FeeRuleSet, active_rules, set_rules
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.service_charges import post_service_charges
+from bank_account.sharding import _init_worker, partition_rows, run_sharded_service_charges
+
+
+class TestShardedServiceCharges(unittest.TestCase):
+    def make_book(self) -> AccountBook:
+        accounts = []
+        for number in range(1, 31):
+            balance = float(number * 7 % 60 - 10)
+            if number % 3 == 0:
+                accounts.append(ChequingAccount(number, 1, balance - 150, date.today(), -100, 0.05))
+            elif number % 3 == 1:
+                accounts.append(SavingsAccount(number, 1, balance, date.today(), 50))
+            else:
+                accounts.append(InvestmentAccount(number, 1, balance, date(2010, 1, 1), 2.55))
+        return AccountBook.from_accounts(accounts)
+
+    def test_sorted_book_partitions_into_ranges(self) -> None:
+        shards = partition_rows(self.make_book(), 4)
+        self.assertEqual(shards, [range(0, 7), range(7, 15), range(15, 22), range(22, 30)])
+
+    def test_unsorted_book_partitions_by_modulo(self) -> None:
+        book = self.make_book()
+        book = book.take(reversed(range(len(book))))
+        shards = partition_rows(book, 4)
+        self.assertEqual(sum(len(rows) for rows in shards), 30)
+        self.assertEqual([book.account_number[row] % 4 for row in shards[1]], [1] * len(shards[1]))
+
+    def test_matches_single_process_run(self) -> None:
+        expected_book = self.make_book()
+        expected = post_service_charges(expected_book)
+
+        book = self.make_book()
+        result = run_sharded_service_charges(book, workers=3)
+        self.assertEqual(list(book.balance), list(expected_book.balance))
+
+        order = [5, 1, 20, 3, 29, 0] + list(range(6, 20)) + [2, 4]
+        shuffled = self.make_book().take(order)
+        run_sharded_service_charges(shuffled, workers=3)
+        self.assertEqual(list(shuffled.balance), list(expected_book.take(order).balance))
+        self.assertEqual(result.counts, expected.counts)
+        self.assertEqual(
+            sorted(r.account_number for r in result.rejected),
+            sorted(r.account_number for r in expected.rejected),
+        )
+
+    def test_workers_receive_custom_rules(self) -> None:
+        custom = FeeRuleSet.from_dict({"Savings": {"kind": "flat", "base": 1.25}})
+        set_rules(custom)
+        try:
+            expected_book = self.make_book()
+            expected = post_service_charges(expected_book)
+            book = self.make_book()
+            run_sharded_service_charges(book, workers=2)
+
+            # A spawned worker starts with DEFAULT_RULES and gets the rules from initargs.
+            set_rules(DEFAULT_RULES)
+            _init_worker(InvestmentAccount.TEN_YEARS_AGO, custom.to_dict())
+            self.assertEqual(active_rules().to_dict(), custom.to_dict())
+        finally:
+            set_rules(DEFAULT_RULES)
+
+        self.assertEqual(list(book.balance), list(expected_book.balance))
+        self.assertEqual(expected.totals["Savings"], 1.25 * expected.counts["Savings"])
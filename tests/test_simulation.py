@@ -0,0 +1,56 @@
+import unittest
+from datetime import date
+
+from bank_account.account_book import AccountBook
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.service_charges import post_service_charges
+from bank_account.simulation import Scenario, add_months, simulate
+
+
+class TestSimulation(unittest.TestCase):
+    def setUp(self) -> None:
+        self.start = date(2025, 1, 31)
+        self.accounts = [
+            ChequingAccount(1, 1, 50.0, date(2020, 1, 1), 100.0, 0.05),
+            SavingsAccount(2, 1, 40.0, date(2020, 1, 1), 50.0),
+            InvestmentAccount(3, 2, 500.0, date(2015, 3, 15), 2.55),
+            ChequingAccount(4, 2, 0.25, date(2020, 1, 1), -100.0, 0.05),
+        ]
+        self.book = AccountBook.from_accounts(self.accounts)
+
+    def test_one_month_matches_step_12(self) -> None:
+        result, = simulate(self.book, [Scenario("base")], months=1)
+        post_service_charges(self.accounts)
+
+        self.assertEqual(list(result.ending_balances), [a.balance for a in self.accounts])
+        self.assertEqual(result.rejected_charges, 1)
+        self.assertEqual(self.book.balance[0], 50.0)
+
+    def test_waiver_and_overrides(self) -> None:
+        base, no_rate = simulate(
+            self.book,
+            [Scenario("base"), Scenario("no overdraft rate", overdraft_rate=0.0)],
+            months=4,
+            start=self.start,
+        )
+
+        # The investment account turns ten years old in the third month.
+        waiver = InvestmentAccount.waiver_threshold
+        self.assertGreater(date(2015, 3, 15), waiver(add_months(self.start, 1)))
+        self.assertLessEqual(date(2015, 3, 15), waiver(add_months(self.start, 2)))
+        self.assertAlmostEqual(base.charges[2], 0.5 * 4 + 2.55 * 2)
+
+        self.assertLess(no_rate.charges[0], base.charges[0])
+        self.assertEqual(no_rate.charges[0], 2.0)
+        self.assertEqual(len(base.monthly_charges), 4)
+        self.assertEqual(set(base.summary()), {"charges", "ending_balance"})
+
+    def test_random_flows_are_reproducible(self) -> None:
+        scenario = Scenario("flows", flow_mean=10.0, flow_stddev=100.0, seed=7)
+        first, second = simulate(self.book, [scenario, scenario], months=12, start=self.start)
+
+        self.assertEqual(first.ending_balances, second.ending_balances)
+        self.assertEqual(first.summary()["charges"]["max"], max(first.charges))
+        self.assertEqual(add_months(date(2024, 1, 31), 1), date(2024, 2, 29))
@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+from datetime import date
+
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.snapshot import PortfolioSnapshot, write_snapshot
+
+
+class TestPortfolioSnapshot(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "portfolio.snap")
+        self.accounts = [
+            SavingsAccount(30, 3, 49.99, date(2019, 2, 3), 50.0),
+            ChequingAccount(10, 1, -600.123, date(2021, 4, 5), -100.0, 0.055),
+            InvestmentAccount(20, 2, 1000.1, date(2010, 1, 1), 2.55),
+        ]
+        write_snapshot(self.path, self.accounts)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_round_trip_is_exact(self) -> None:
+        with PortfolioSnapshot(self.path) as snapshot:
+            self.assertEqual(len(snapshot), 3)
+            for original in self.accounts:
+                loaded = snapshot.find(original.account_number)
+                self.assertIs(type(loaded), type(original))
+                self.assertEqual(str(loaded), str(original))
+                self.assertEqual(loaded.balance, original.balance)
+                self.assertEqual(loaded.client_number, original.client_number)
+                for name in type(original)._RECORD_FIELDS:
+                    self.assertEqual(getattr(loaded, name), getattr(original, name))
+
+    def test_lookups_without_materializing(self) -> None:
+        with PortfolioSnapshot(self.path) as snapshot:
+            self.assertEqual(snapshot.row_of(20), 1)
+            self.assertIsNone(snapshot.find(15))
+            for original in self.accounts:
+                self.assertEqual(
+                    snapshot.get_service_charges(original.account_number),
+                    original.get_service_charges(),
+                )
+            self.assertEqual(list(snapshot.to_book().account_number), [10, 20, 30])
+
+    def test_rejects_bad_files(self) -> None:
+        with open(self.path, "r+b") as stream:
+            stream.write(b"NOTASNAP")
+        with self.assertRaises(ValueError):
+            PortfolioSnapshot(self.path)
+
+        with self.assertRaises(ValueError):
+            write_snapshot(self.path, self.accounts + [SavingsAccount(10, 9, 0.0, date.today(), 50)])
@@ -0,0 +1,93 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from datetime import date
+
+from bank_account.account_book import AccountBook
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.sqlite_store import SqliteAccountStore
+
+
+class TestSqliteAccountStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "accounts.db")
+        self.accounts = [
+            SavingsAccount(30, 3, 49.99, date(2019, 2, 3), 50.0),
+            ChequingAccount(10, 1, -600.123, date(2021, 4, 5), -100.0, 0.055),
+            InvestmentAccount(20, 2, 1000.1, date(2010, 1, 1), 2.55),
+        ]
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_round_trip(self) -> None:
+        with SqliteAccountStore(self.path, batch_size=2) as store:
+            self.assertEqual(store.save(self.accounts), 3)
+
+        with SqliteAccountStore(self.path) as store:
+            self.assertEqual(len(store), 3)
+            loaded = store.load()
+            book = store.load_book()
+
+        self.assertEqual([a.account_number for a in loaded], [10, 20, 30])
+        expected = sorted(self.accounts, key=lambda account: account.account_number)
+        for original, account in zip(expected, loaded):
+            self.assertIs(type(account), type(original))
+            self.assertEqual(str(account), str(original))
+            self.assertEqual(account.date_created, original.date_created)
+        self.assertEqual(list(book.balance), [a.balance for a in expected])
+        self.assertEqual(list(AccountBook.from_accounts(expected).minimum_balance), list(book.minimum_balance))
+
+    def test_balances_flush_at_commit(self) -> None:
+        store = SqliteAccountStore(self.path)
+        store.save(self.accounts)
+        self.accounts[0].deposit(10.0)
+        self.accounts[0].withdraw(5.0)
+        self.accounts[2].update_balance(-0.1)
+        self.assertEqual(store.dirty_count, 2)
+
+        with SqliteAccountStore(self.path) as reader:
+            self.assertEqual(reader.load_book().balance[2], 49.99)
+
+        self.assertEqual(store.commit(), 2)
+        self.assertEqual(store.dirty_count, 0)
+        store.delete([10])
+        store.close()
+
+        with SqliteAccountStore(self.path) as reader:
+            balances = {a.account_number: a.balance for a in reader.load()}
+        self.assertEqual(balances, {20: self.accounts[2].balance, 30: self.accounts[0].balance})
+
+    def test_failed_commit_keeps_balances_pending(self) -> None:
+        store = SqliteAccountStore(self.path)
+        store.save(self.accounts)
+        self.accounts[0].deposit(10.0)
+
+        blocker = sqlite3.connect(self.path)
+        blocker.execute(
+            "CREATE TRIGGER fail_update BEFORE UPDATE ON accounts BEGIN SELECT RAISE(ABORT, 'failed'); END"
+        )
+        blocker.commit()
+        with self.assertRaises(sqlite3.DatabaseError):
+            store.commit()
+        self.assertEqual(store.dirty_count, 1)
+
+        blocker.execute("DROP TRIGGER fail_update")
+        blocker.commit()
+        blocker.close()
+        self.assertEqual(store.commit(), 1)
+        store.close()
+
+        with SqliteAccountStore(self.path) as reader:
+            self.assertEqual(reader.load_book().balance[2], 59.99)
+
+    def test_save_book(self) -> None:
+        with SqliteAccountStore(self.path) as store:
+            store.save(AccountBook.from_accounts(self.accounts))
+            self.assertEqual(store.load_book().account_number.tolist(), [10, 20, 30])
+            store.load()[0].deposit(1.0)
+            self.assertEqual(store.dirty_count, 1)
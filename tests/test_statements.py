@@ -0,0 +1,65 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+from datetime import date
+
+from bank_account.chequing_account import ChequingAccount
+from bank_account.investment_account import InvestmentAccount
+from bank_account.loader import iter_accounts
+from bank_account.savings_account import SavingsAccount
+from bank_account.statements import (
+    _TEXT_FORMATTERS,
+    _chequing_text,
+    _investment_text,
+    _savings_text,
+    render_statements,
+)
+
+
+class TestRenderStatements(unittest.TestCase):
+    def setUp(self) -> None:
+        self.accounts = [
+            ChequingAccount(1001, 2001, -1200.456, date.today(), -100, 0.055),
+            SavingsAccount(1002, 2002, 49.99, date.today(), 50),
+            InvestmentAccount(1003, 2003, 1000.0, date(2010, 1, 1), 2.55),
+            InvestmentAccount(1004, 2004, 1000.0, date(2020, 1, 1), 2.55),
+        ]
+
+    def test_text_layout_matches_print(self) -> None:
+        expected = io.StringIO()
+        with redirect_stdout(expected):
+            for account in self.accounts:
+                print(account)
+
+        rendered = io.StringIO()
+        count = render_statements(self.accounts, rendered, chunk_size=3)
+        self.assertEqual(count, 4)
+        self.assertEqual(rendered.getvalue(), expected.getvalue())
+
+    def test_text_formatters_match_str(self) -> None:
+        formatters = {
+            ChequingAccount: _chequing_text,
+            SavingsAccount: _savings_text,
+            InvestmentAccount: _investment_text,
+        }
+        for account in self.accounts:
+            self.assertEqual(formatters[type(account)](account), str(account))
+        self.assertEqual(set(_TEXT_FORMATTERS), set(formatters))
+
+    def test_csv_layout_round_trips_through_loader(self) -> None:
+        rendered = io.StringIO()
+        render_statements(self.accounts, rendered, layout="csv")
+        rendered.seek(0)
+        loaded = list(iter_accounts(rendered, "csv"))
+        self.assertEqual([str(a) for a in loaded], [str(a) for a in self.accounts])
+
+    def test_fixed_layout_has_one_line_per_account(self) -> None:
+        rendered = io.StringIO()
+        render_statements(self.accounts, rendered, layout="fixed")
+        lines = rendered.getvalue().splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(len({len(line) for line in lines}), 1)
+
+    def test_unknown_layout_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            render_statements(self.accounts, io.StringIO(), layout="pdf")
@@ -0,0 +1,85 @@
+import asyncio
+import unittest
+from datetime import date
+
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.transaction_rules import (
+    ACCEPTED,
+    REJECT_EXCEEDS_BALANCE,
+    REJECT_NOT_NUMERIC,
+    REJECT_NOT_POSITIVE,
+)
+from bank_account.transaction_service import TransactionService
+
+
+class TestTransactionService(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.savings = SavingsAccount(1, 1, 100.0, date(2020, 1, 1), 50.0)
+        self.chequing = ChequingAccount(2, 1, 100.0, date(2020, 1, 1), -100.0, 0.05)
+
+    async def test_applies_requests_in_order_per_account(self) -> None:
+        async with TransactionService([self.savings, self.chequing], max_batch=8) as service:
+            results = await asyncio.gather(
+                service.withdraw(1, 80.0),
+                service.withdraw(1, 30.0),
+                service.deposit(1, 10.0),
+                service.deposit(2, 5.0),
+            )
+
+        self.assertEqual([r.code for r in results],
+                         [ACCEPTED, REJECT_EXCEEDS_BALANCE, ACCEPTED, ACCEPTED])
+        self.assertEqual(results[1].reason, "exceeds balance")
+        self.assertEqual(results[2].balance, 30.0)
+        self.assertEqual(self.savings.balance, 30.0)
+        self.assertEqual(self.chequing.balance, 105.0)
+
+    async def test_rejections_and_charges(self) -> None:
+        async with TransactionService([self.savings, self.chequing]) as service:
+            self.assertEqual((await service.deposit(1, -5.0)).code, REJECT_NOT_POSITIVE)
+            self.assertEqual((await service.withdraw(1, "abc")).code, REJECT_NOT_NUMERIC)
+
+            charge = await service.charge(2)
+            self.assertTrue(charge.accepted)
+            self.assertEqual(charge.amount, 0.5)
+            self.assertEqual(self.chequing.balance, 99.5)
+
+            with self.assertRaises(KeyError):
+                await service.deposit(99, 1.0)
+            with self.assertRaises(ValueError):
+                await service.submit(1, "transfer", 1.0)
+
+        with self.assertRaises(RuntimeError):
+            await service.deposit(1, 1.0)
+
+    async def test_bounded_queue_drains_on_stop(self) -> None:
+        service = TransactionService([self.savings], max_queue=2, max_batch=2)
+        await service.start()
+        results = await asyncio.gather(*(service.deposit(1, 1.0) for _ in range(50)))
+        await service.stop()
+
+        self.assertTrue(all(result.accepted for result in results))
+        self.assertEqual(self.savings.balance, 150.0)
+        self.assertFalse(service.running)
+
+    async def test_listener_error_reaches_its_caller_only(self) -> None:
+        def listener(account: BankAccount, operation: str, amount: float) -> None:
+            if account.account_number == 2:
+                raise RuntimeError("listener failed")
+
+        BankAccount.add_balance_listener(listener)
+        try:
+            async with TransactionService([self.savings, self.chequing]) as service:
+                failed, applied = await asyncio.wait_for(
+                    asyncio.gather(service.deposit(2, 5.0), service.deposit(1, 5.0), return_exceptions=True),
+                    timeout=1.0,
+                )
+                later = await asyncio.wait_for(service.deposit(1, 1.0), timeout=1.0)
+                self.assertTrue(service.running)
+        finally:
+            BankAccount.remove_balance_listener(listener)
+
+        self.assertIsInstance(failed, RuntimeError)
+        self.assertTrue(applied.accepted)
+        self.assertEqual(later.balance, 106.0)
@@ -0,0 +1,106 @@
+import threading
+import unittest
+from datetime import date
+
+from bank_account.bank_account import BankAccount
+from bank_account.chequing_account import ChequingAccount
+from bank_account.concurrency import disable_thread_safety, enable_thread_safety
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.transaction_rules import (
+    ACCEPTED,
+    REJECT_EXCEEDS_BALANCE,
+    REJECT_NOT_NUMERIC,
+    REJECT_NOT_POSITIVE,
+    REJECT_SAME_ACCOUNT,
+)
+from bank_account.transfers import transfer, transfer_many
+
+
+class TestTransfers(unittest.TestCase):
+    def setUp(self) -> None:
+        self.savings = SavingsAccount(1, 1, 100.0, date(2020, 1, 1), 50.0)
+        self.chequing = ChequingAccount(2, 1, 10.0, date(2020, 1, 1), -100.0, 0.05)
+        self.investment = InvestmentAccount(3, 2, 0.0, date(2020, 1, 1), 2.55)
+
+    def tearDown(self) -> None:
+        disable_thread_safety()
+
+    def test_transfer(self) -> None:
+        events = []
+        listener = lambda account, operation, amount: events.append((account.account_number, operation, amount))
+        BankAccount.add_balance_listener(listener)
+        try:
+            transfer(self.savings, self.investment, 60.0)
+        finally:
+            BankAccount.remove_balance_listener(listener)
+
+        self.assertEqual((self.savings.balance, self.investment.balance), (40.0, 60.0))
+        self.assertEqual(events, [(1, "withdraw", -60.0), (3, "deposit", 60.0)])
+
+        for amount, message in ((40.01, "exceeds balance"), (0, "must be positive"), ("x", "must be numeric")):
+            with self.assertRaisesRegex(ValueError, message):
+                transfer(self.savings, self.chequing, amount)
+        with self.assertRaises(ValueError):
+            transfer(self.savings, self.savings, 1.0)
+        self.assertEqual((self.savings.balance, self.chequing.balance), (40.0, 10.0))
+
+    def test_transfer_many(self) -> None:
+        accounts = [self.savings, self.chequing, self.investment]
+        mask, codes = transfer_many(
+            accounts,
+            [0, 1, 2, 0, 0, 1],
+            [1, 2, 0, 0, 2, 0],
+            [50.0, 60.0, 20.0, 1.0, -1.0, None],
+        )
+
+        self.assertEqual(list(mask), [1, 1, 1, 0, 0, 0])
+        self.assertEqual(
+            list(codes),
+            [ACCEPTED, ACCEPTED, ACCEPTED, REJECT_SAME_ACCOUNT, REJECT_NOT_POSITIVE, REJECT_NOT_NUMERIC],
+        )
+        self.assertEqual([a.balance for a in accounts], [70.0, 0.0, 40.0])
+
+        _, codes = transfer_many(accounts, [1], [0], [0.01])
+        self.assertEqual(list(codes), [REJECT_EXCEEDS_BALANCE])
+
+    def test_failing_listener_leaves_both_legs_applied(self) -> None:
+        events = []
+
+        def listener(account: BankAccount, operation: str, amount: float) -> None:
+            events.append((account.account_number, operation))
+            if operation == BankAccount.OP_DEPOSIT:
+                raise RuntimeError("listener failed")
+
+        BankAccount.add_balance_listener(listener)
+        try:
+            with self.assertRaises(RuntimeError):
+                transfer(self.savings, self.chequing, 30.0)
+        finally:
+            BankAccount.remove_balance_listener(listener)
+
+        self.assertEqual((self.savings.balance, self.chequing.balance), (70.0, 40.0))
+        self.assertEqual(events, [(1, BankAccount.OP_WITHDRAW), (2, BankAccount.OP_DEPOSIT)])
+
+    def test_opposite_transfers_under_concurrency(self) -> None:
+        enable_thread_safety(stripes=8)
+        self.chequing.update_balance(90.0)
+
+        def worker(source, target) -> None:
+            for _ in range(2000):
+                try:
+                    transfer(source, target, 1.0)
+                except ValueError:
+                    pass
+
+        threads = [
+            threading.Thread(target=worker, args=(self.savings, self.chequing)),
+            threading.Thread(target=worker, args=(self.chequing, self.savings)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.savings.balance + self.chequing.balance, 200.0)
+        self.assertGreaterEqual(min(self.savings.balance, self.chequing.balance), 0.0)
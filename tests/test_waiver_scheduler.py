@@ -0,0 +1,46 @@
+import unittest
+from datetime import date, timedelta
+
+from bank_account.investment_account import InvestmentAccount
+from bank_account.savings_account import SavingsAccount
+from bank_account.waiver_scheduler import WaiverScheduler
+
+
+class TestWaiverScheduler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.ten_years_ago = InvestmentAccount.TEN_YEARS_AGO
+        self.today = date(2026, 1, 10)
+        threshold = InvestmentAccount.waiver_threshold(self.today)
+        self.old = InvestmentAccount(1, 1, 0.0, threshold, 2.55)
+        self.tomorrow = InvestmentAccount(2, 1, 0.0, threshold + timedelta(days=1), 2.55)
+        self.later = InvestmentAccount(3, 1, 0.0, threshold + timedelta(days=5), 2.55)
+        self.free = InvestmentAccount(4, 1, 0.0, threshold + timedelta(days=1), 0.0)
+        self.savings = SavingsAccount(5, 1, 0.0, threshold, 50)
+
+    def tearDown(self) -> None:
+        InvestmentAccount.TEN_YEARS_AGO = self.ten_years_ago
+
+    def test_only_pending_investment_accounts_scheduled(self) -> None:
+        scheduler = WaiverScheduler(
+            [self.old, self.tomorrow, self.later, self.free, self.savings], self.today
+        )
+        self.assertEqual(len(scheduler), 3)
+        self.assertEqual(scheduler.next_waiver_date, self.today + timedelta(days=1))
+
+    def test_tick_returns_accounts_crossing_threshold(self) -> None:
+        scheduler = WaiverScheduler([self.old, self.tomorrow, self.later, self.free], self.today)
+        self.assertEqual(self.tomorrow.get_service_charges(), 3.05)
+
+        self.assertEqual(scheduler.tick(self.today + timedelta(days=1)), [self.tomorrow])
+        self.assertEqual(self.tomorrow.get_service_charges(), 0.50)
+        self.assertEqual(self.later.get_service_charges(), 3.05)
+
+        self.assertEqual(scheduler.tick(self.today + timedelta(days=10)), [self.later])
+        self.assertEqual(len(scheduler), 0)
+
+    def test_waiver_date_matches_threshold(self) -> None:
+        waiver = WaiverScheduler.waiver_date(self.later)
+        self.assertEqual(InvestmentAccount.waiver_threshold(waiver), self.later.date_created)
+        self.assertLess(
+            InvestmentAccount.waiver_threshold(waiver - timedelta(days=1)), self.later.date_created
+        )